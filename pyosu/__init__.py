@@ -9,11 +9,32 @@ __copyright__ = "Copyright 2022-present Grapphy"
 from .client import *
 from .beatmap import *
 from .channel import *
+from .comment import *
+from .discussion import *
 from .message import *
 from .news import *
+from .notification import *
 from .forum import *
 from .rankings import *
 from .score import *
 from .user import *
 from .wiki import *
 from .enums import *
+from .errors import HTTPException, NotFound, Unauthorized
+from .serialization import dumps, dumps_many, loads, loads_many
+from .utils import TimeIndex, parse_timestamp
+from .pagination import CursorPaginator
+from .poller import ChatPoller
+from .dispatch import EventBus, Subscription
+from .outbox import MessageQueue
+from .ratelimit import TokenBucket
+from .chatlog import ChatHistoryStore
+from .markers import ReadMarkers
+from .websocket import NotificationSocket
+from .leaderboard import LeaderboardChange, LeaderboardWatcher
+from .tracker import ScoreTracker
+from .resolver import BeatmapResolver
+from .search import BeatmapsetIndex
+from .snapshots import RankingHistory, RankingSnapshot, ranking_key
+from .progress import StatisticsRecorder, StatisticsSample
+from .references import resolve_references
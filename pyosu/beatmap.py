@@ -24,7 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, List, Dict, TYPE_CHECKING
+from typing import Any, List, Dict, Optional, TYPE_CHECKING
 
 from collections import namedtuple
 
@@ -61,6 +61,22 @@ class BeatmapScores:
 
         self.user_score = data.get("userScore")
 
+    def to_payload(self) -> BeatmapScoresPayload:
+        return {
+            "scores": [score.to_payload() for score in self.scores],
+            "userScore": self.user_score,
+        }
+
+    @classmethod
+    def from_payload(
+        cls,
+        data: BeatmapScoresPayload,
+        *,
+        connector: Connector,
+        beatmap: Optional[Beatmap] = None,
+    ) -> BeatmapScores:
+        return cls(connector=connector, data=data, beatmap=beatmap)
+
 
 class BaseBeatmap:
     def __init__(self, *, connector: Connector, data: BeatmapPayload) -> None:
@@ -109,13 +125,53 @@ class BaseBeatmap:
         self.drain = data.get("drain")
         self.hit_length = data.get("hit_length")
         self.is_scoreable = data.get("is_scoreable")
-        self.last_update = data.get("last_update")
+        self.last_update = data.get("last_updated")
         self.mode_int = data.get("mode_int")
         self.passcount = data.get("passcount")
         self.playcount = data.get("playcount")
         self.ranked = data.get("ranked")
         self.url = data.get("url")
 
+    def to_payload(self) -> BeatmapPayload:
+        return {
+            "id": self.id,
+            "mode": self.mode,
+            "status": self.status,
+            "total_length": self.total_length,
+            "user_id": self.user_id,
+            "version": self.version,
+            "beatmapset_id": self.beatmapset_id,
+            "difficulty_rating": self.difficulty_rating,
+            "beatmapset": self.beatmapset,
+            "checksum": self.checksum,
+            "failtimes": self.failtimes,
+            "max_combo": self.max_combo,
+            "accuracy": self.accuracy,
+            "ar": self.ar,
+            "bpm": self.bpm,
+            "convert": self.convert,
+            "count_circles": self.count_circles,
+            "count_sliders": self.count_sliders,
+            "count_spinners": self.count_spinners,
+            "cs": self.cs,
+            "deleted_at": self.deleted_at,
+            "drain": self.drain,
+            "hit_length": self.hit_length,
+            "is_scoreable": self.is_scoreable,
+            "last_updated": self.last_update,
+            "mode_int": self.mode_int,
+            "passcount": self.passcount,
+            "playcount": self.playcount,
+            "ranked": self.ranked,
+            "url": self.url,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: BeatmapPayload, *, connector: Connector
+    ) -> BaseBeatmap:
+        return cls(connector=connector, data=data)
+
 
 class Beatmap(BaseBeatmap):
     def __init__(self, *, connector: Connector, data: BeatmapPayload) -> None:
@@ -24,10 +24,14 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, List, Dict, TYPE_CHECKING
+from typing import Any, List, Dict, Optional, TYPE_CHECKING
+from datetime import datetime
+
+from .utils import cached_epoch, cached_timestamp
 
 if TYPE_CHECKING:
     from .types.user import User as UserPayload
+    from .types.beatmap import Beatmap as BeatmapPayload
     from .types.beatmapset import Beatmapset as BeatmapsetPayload
     from .connection import Connector
 
@@ -37,6 +41,7 @@ class BaseBeatmapset:
         self, *, connector: Connector, data: BeatmapsetPayload
     ) -> None:
         self._connector = connector
+        self._timestamps = {}
         self._update_data(data)
 
     def __repr__(self) -> str:
@@ -58,6 +63,16 @@ class BaseBeatmapset:
     def __hash__(self) -> int:
         return self.id
 
+    @property
+    def ranked_date_datetime(self) -> Optional[datetime]:
+        """Optional[:obj:`datetime.datetime`]: Parsed `ranked_date`."""
+        return cached_timestamp(self, "ranked_date")
+
+    @property
+    def ranked_date_epoch(self) -> Optional[int]:
+        """Optional[:obj:`int`]: `ranked_date` as epoch seconds."""
+        return cached_epoch(self, "ranked_date")
+
     def _update_data(self, data: BeatmapsetPayload) -> None:
         self.id = data["id"]
         self.artist = data["artist"]
@@ -113,6 +128,78 @@ class BaseBeatmapset:
             except KeyError:
                 continue
 
+    def _merge_data(self, data: BeatmapsetPayload) -> None:
+        # Beatmapsets embedded in other payloads carry few fields, only
+        # replace those, missing user and beatmaps are kept as well
+        payload = self.to_payload()
+        payload.pop("user", None)
+        payload.pop("beatmaps", None)
+        payload.update(data)
+        self._update_data(payload)
+
+    def to_payload(self) -> BeatmapsetPayload:
+        data = {
+            "id": self.id,
+            "artist": self.artist,
+            "artist_unicode": self.artist_unicode,
+            "covers": self.covers,
+            "creator": self.creator,
+            "favourite_count": self.favourite_count,
+            "nsfw": self.nsfw,
+            "play_count": self.play_count,
+            "preview_url": self.preview_url,
+            "source": self.source,
+            "status": self.status,
+            "title": self.title,
+            "title_unicode": self.title_unicode,
+            "user_id": self.user_id,
+            "video": self.video,
+            "converts": self.converts,
+            "current_user_attributes": self.current_user_attributes,
+            "description": self.description,
+            "discussions": self.discussions,
+            "events": self.events,
+            "genre": self.genre,
+            "has_favourited": self.has_favourited,
+            "language": self.language,
+            "nominations": self.nominations,
+            "ratings": self.ratings,
+            "recent_favourites": self.recent_favourites,
+            "related_users": self.related_users,
+            "download_disabled": self.download_disabled,
+            "more_information": self.more_information,
+            "bpm": self.bpm,
+            "can_be_hyped": self.can_be_hyped,
+            "discussion_enabled": self.discussion_enabled,
+            "discussion_locked": self.discussion_locked,
+            "hype_current": self.hype_current,
+            "hype_required": self.hype_required,
+            "is_scoreable": self.is_scoreable,
+            "last_updated": self.last_updated,
+            "legacy_thread_url": self.legacy_thread_url,
+            "nominations_current": self.nominations_current,
+            "nominations_required": self.nominations_required,
+            "ranked": self.ranked,
+            "ranked_date": self.ranked_date,
+            "storyboard": self.storyboard,
+            "submitted_date": self.submitted_date,
+            "tags": self.tags,
+        }
+
+        if hasattr(self, "user"):
+            data["user"] = self.user.to_payload()
+
+        if hasattr(self, "beatmaps"):
+            data["beatmaps"] = [b.to_payload() for b in self.beatmaps]
+
+        return data
+
+    @classmethod
+    def from_payload(
+        cls, data: BeatmapsetPayload, *, connector: Connector
+    ) -> BaseBeatmapset:
+        return cls(connector=connector, data=data)
+
     def _handle_user(self, data: UserPayload) -> None:
         self.user = self._connector._add_user_cache(data)
 
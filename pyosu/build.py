@@ -39,6 +39,20 @@ class UpdateStream:
         self.latest_build = data.get("latest_build")
         self.user_count = data.get("user_count")
 
+    def to_payload(self) -> UpdateStreamPayload:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "display_name": self.display_name,
+            "is_featured": self.is_featured,
+            "latest_build": self.latest_build,
+            "user_count": self.user_count,
+        }
+
+    @classmethod
+    def from_payload(cls, data: UpdateStreamPayload) -> "UpdateStream":
+        return cls(data=data)
+
 
 class Versions:
     def __init__(self, *, data: VersionsPayload) -> None:
@@ -51,6 +65,21 @@ class Versions:
         if "next" in data:
             self.next = BuildChangelog(data=data["next"])
 
+    def to_payload(self) -> VersionsPayload:
+        data = {}
+
+        if hasattr(self, "previous"):
+            data["previous"] = self.previous.to_payload()
+
+        if hasattr(self, "next"):
+            data["next"] = self.next.to_payload()
+
+        return data
+
+    @classmethod
+    def from_payload(cls, data: VersionsPayload) -> "Versions":
+        return cls(data=data)
+
 
 class BuildChangelog:
     def __init__(self, *, data: BuildPayload) -> None:
@@ -67,6 +96,22 @@ class BuildChangelog:
         self.changelog_entries = data.get("changelog_entries")
         self.versions = self._handle_versions(data.get("versions"))
 
+    def to_payload(self) -> BuildPayload:
+        return {
+            "id": self.id,
+            "version": self.version,
+            "display_version": self.display_version,
+            "users": self.users,
+            "created_at": self.created_at,
+            "update_stream": self.update_stream.to_payload(),
+            "changelog_entries": self.changelog_entries,
+            "versions": self.versions.to_payload() if self.versions else None,
+        }
+
+    @classmethod
+    def from_payload(cls, data: BuildPayload) -> "BuildChangelog":
+        return cls(data=data)
+
     def _handle_update_stream(self, data: UpdateStreamPayload) -> UpdateStream:
         return UpdateStream(data=data)
 
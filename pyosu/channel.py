@@ -24,14 +24,29 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, List, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+    List,
+    Union,
+    TYPE_CHECKING,
+)
+from datetime import datetime
+
+import asyncio
+
 from .message import ChatMessage
+from .utils import to_epoch
 
 if TYPE_CHECKING:
     from .http import HTTPClient
     from .connection import Connector
     from .types.obj import ObjectID
-    from .types.message import CurrentUserAttributes, ChatMessage
+    from .types.message import CurrentUserAttributes
+    from .types.message import ChatMessage as ChatMessagePayload
+    from .types.channel import ChatChannel as ChatChannelPayload
 
 
 class ChatChannel:
@@ -59,7 +74,7 @@ class ChatChannel:
         moderated: bool
         last_read_id: Optional[ObjectID]
         last_message_id: Optional[ObjectID]
-        recent_messages: Optional[List[ChatMessage]]
+        recent_messages: Optional[List[ChatMessagePayload]]
         description: Optional[str]
         users: Optional[List[ObjectID]]
         current_user_attributes: Optional[CurrentUserAttributes]
@@ -84,37 +99,181 @@ class ChatChannel:
         self.last_message_id = data.get("last_message_id", 0)
         self.recent_messages = data.get("recent_messages", [])
         self.users = data.get("users", [])
+        self.description = data.get("description")
+        self.current_user_attributes = data.get("current_user_attributes")
+
+    def to_payload(self) -> ChatChannelPayload:
+        return {
+            "channel_id": self.id,
+            "name": self.name,
+            "icon": self.icon,
+            "type": self.type,
+            "moderated": self.moderated,
+            "last_read_id": self.last_read_id,
+            "last_message_id": self.last_message_id,
+            "recent_messages": self.recent_messages,
+            "description": self.description,
+            "users": self.users,
+            "current_user_attributes": self.current_user_attributes,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: ChatChannelPayload, *, connector: Connector
+    ) -> ChatChannel:
+        return cls(connector=connector, data=data)
+
+    async def mark_as_read(
+        self, message_id: Optional[ObjectID] = None, *, coalesce: bool = False
+    ) -> None:
+        """Marks the channel as read up to a message. Does nothing when
+        the channel has no messages.
+
+        With `coalesce` the marker goes through the client
+        `pyosu.ReadMarkers` instead, only the highest message ID is
+        sent after a short debounce.
+
+        Args:
+            message_id (:obj:`ObjectID`, optional): Last read message.
+                Defaults to the last message of the channel.
+            coalesce (:obj:`bool`, optional): Set to True to debounce
+                the marker. Defaults to False.
+        """
+        message_id = message_id or self.last_message_id
+        if not message_id:
+            return
+
+        message_id = int(message_id)
+        self.last_read_id = max(message_id, self.last_read_id or 0)
+
+        if coalesce:
+            self._connector.read_markers.mark_channel(self.id, message_id)
+            return
 
-    async def mark_as_read(self) -> None:
         await self._connector.http.mark_channel_as_read(
             self.id,
-            self.last_message_id,
+            message_id,
             channel_id=self.id,
-            message_id=self.last_message_id,
+            message_id=message_id,
         )
 
     async def history(
-        self, *, limit: int = 50, since: int = None
-    ) -> AsyncIterator[ForumPost]:
-        while True:
-            _limit = min(50 if limit is None else limit, 50)
-            if _limit < 1:
-                return
-
-            data = await self._connector.http.get_channel_messages(
-                self.id, limit=_limit, since=since
+        self,
+        *,
+        limit: Optional[int] = 50,
+        since: Optional[ObjectID] = None,
+        until: Optional[ObjectID] = None,
+        reverse: bool = False,
+        stop_id: Optional[ObjectID] = None,
+        stop_at: Union[datetime, int, str, None] = None,
+        window: int = 50,
+    ) -> AsyncIterator[ChatMessage]:
+        """Iterates over the channel messages in windows of up to 50.
+
+        By default the history is walked forward, oldest first, from
+        `since` or from the newest window. With `reverse` or `until` it
+        is walked backward from `until` or the newest message, newest
+        first. The next window is requested while the current one is
+        consumed.
+
+        Args:
+            limit (:obj:`int`, optional): Max messages, None for no
+                limit. Defaults to 50.
+            since (:obj:`ObjectID`, optional): Walk forward from
+                this message ID (exclusive).
+            until (:obj:`ObjectID`, optional): Walk backward from
+                this message ID (exclusive).
+            reverse (:obj:`bool`, optional): Walk backward from the
+                newest message. Defaults to False.
+            stop_id (:obj:`ObjectID`, optional): Stop before reaching
+                this message ID.
+            stop_at (Union[datetime, int, str], optional): Stop before
+                reaching messages sent at this time.
+            window (:obj:`int`, optional): Messages per request.
+                Defaults to 50.
+
+        Yields:
+            pyosu.ChatMessage: Messages of the channel.
+        """
+        forward = since is not None or not (reverse or until is not None)
+        window = max(1, min(window, 50))
+        stop_epoch = None if stop_at is None else to_epoch(stop_at)
+        cursor = int((since if forward else until) or 0) or None
+
+        def fetch(cursor: Optional[int]) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self._connector.http.get_channel_messages(
+                    self.id,
+                    limit=window,
+                    since=cursor if forward else None,
+                    until=None if forward else cursor,
+                )
             )
 
-            if not data:
-                return
+        def reached(message: ChatMessage) -> bool:
+            if stop_id is not None:
+                if forward and message.id >= int(stop_id):
+                    return True
+                if not forward and message.id <= int(stop_id):
+                    return True
+
+            if stop_epoch is not None:
+                if forward and message.timestamp_epoch >= stop_epoch:
+                    return True
+                if not forward and message.timestamp_epoch <= stop_epoch:
+                    return True
+
+            return False
+
+        def past(message_id: int) -> bool:
+            if forward:
+                return message_id > cursor
+            return message_id < cursor
+
+        pending: Optional[asyncio.Task] = fetch(cursor)
+        count = 0
+
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+
+                page = sorted(
+                    data or (),
+                    key=lambda m: int(m["message_id"]),
+                    reverse=not forward,
+                )
+
+                # Windows may overlap, only keep IDs past the cursor
+                if cursor is not None:
+                    page = [m for m in page if past(int(m["message_id"]))]
+
+                if not page:
+                    return
+
+                remaining = None if limit is None else limit - count
+                if len(data) >= window and (
+                    remaining is None or remaining > len(page)
+                ):
+                    cursor = int(page[-1]["message_id"])
+                    pending = fetch(cursor)
+
+                for payload in page:
+                    message = ChatMessage(
+                        connector=self._connector, data=payload
+                    )
 
-            if len(data) < 50:
-                limit = 0
+                    if reached(message):
+                        return
 
-            since = data[-1]["message_id"]
+                    yield message
+                    count += 1
 
-            for message in data:
-                yield ChatMessage(connector=self._connector, data=message)
+                    if limit is not None and count >= limit:
+                        return
+        finally:
+            if pending is not None:
+                pending.cancel()
 
     async def send(self, message: str) -> ChatMessage:
         data = await self._connector.http.send_message_to_channel(
@@ -0,0 +1,367 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+import sqlite3
+
+from .enums import EventType
+from .message import ChatMessage
+from .utils import timestamp_to_epoch, to_epoch
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from .channel import ChatChannel
+    from .connection import Connector
+    from .dispatch import EventBus, Subscription
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    message_id INTEGER PRIMARY KEY,
+    channel_id INTEGER NOT NULL,
+    sender_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    epoch INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    is_action INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_channel
+    ON messages (channel_id, message_id);
+CREATE INDEX IF NOT EXISTS messages_sender
+    ON messages (sender_id, message_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5 (
+    content, content='messages', content_rowid='message_id'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, content)
+        VALUES (new.message_id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, content)
+        VALUES ('delete', old.message_id, old.content);
+END;
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id INTEGER PRIMARY KEY,
+    high_water INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS backfills (
+    channel_id INTEGER PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "m.message_id, m.channel_id, m.sender_id, m.timestamp, m.content,"
+    " m.is_action"
+)
+
+
+class ChatHistoryStore:
+    """SQLite chat history with a full-text index over message
+    content. Messages are kept once per ID and every channel has a
+    high-water mark of the newest stored message.
+
+    Backfills track their own position, apart from the high-water mark
+    moved by live messages, so the history older than the first live
+    message is still downloaded and later backfills only download
+    messages newer than the last one.
+
+    The store can be fed from :meth:`ChatChannel.history` with
+    :meth:`backfill` or from the chat poller with :meth:`attach`.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        path (:obj:`str`, optional): Database file.
+            Defaults to an in-memory database.
+    """
+
+    def __init__(self, connector: Connector, path: str = ":memory:") -> None:
+        self._connector = connector
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"<ChatHistoryStore path={self.path!r} messages={len(self)}>"
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+    def __enter__(self) -> ChatHistoryStore:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+    def high_water(self, channel_id: int) -> int:
+        """Returns the newest stored message ID of a channel, 0 if
+        nothing was stored yet.
+        """
+        row = self._db.execute(
+            "SELECT high_water FROM channels WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def backfilled(self, channel_id: int) -> int:
+        """Returns the newest message ID reached by a completed
+        backfill of a channel, 0 if it was never backfilled.
+        """
+        row = self._db.execute(
+            "SELECT last_id FROM backfills WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def add(self, messages: Iterable[ChatMessage]) -> int:
+        """Stores messages, ignoring the ones already stored.
+
+        Returns:
+            int: Number of new messages.
+        """
+        rows = [
+            (
+                m.id,
+                m.channel_id,
+                m.sender_id,
+                m.timestamp,
+                timestamp_to_epoch(m.timestamp),
+                m.content,
+                int(bool(m.is_action)),
+            )
+            for m in messages
+        ]
+
+        if not rows:
+            return 0
+
+        with self._db:
+            added = self._db.executemany(
+                "INSERT OR IGNORE INTO messages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            ).rowcount
+            self._db.executemany(
+                "INSERT INTO channels VALUES (?, ?)"
+                " ON CONFLICT (channel_id) DO UPDATE"
+                " SET high_water = MAX(high_water, excluded.high_water)",
+                self._high_waters(rows),
+            )
+
+        return added
+
+    @staticmethod
+    def _high_waters(rows: List[tuple]) -> List[Tuple[int, int]]:
+        marks = {}
+        for row in rows:
+            marks[row[1]] = max(marks.get(row[1], 0), row[0])
+        return list(marks.items())
+
+    async def backfill(self, channel: ChatChannel) -> int:
+        """Downloads the messages of a channel newer than the last
+        backfill, or its whole history on the first backfill. Messages
+        already stored, e.g. by :meth:`attach`, are skipped.
+
+        Args:
+            channel (:obj:`pyosu.ChatChannel`): Channel to download.
+
+        Returns:
+            int: Number of new messages.
+        """
+        added = 0
+        batch = []
+        newest = last_id = self.backfilled(channel.id)
+
+        # The first backfill walks back through the whole history
+        async for message in channel.history(
+            limit=None, since=last_id or None, reverse=not last_id
+        ):
+            batch.append(message)
+            newest = max(newest, message.id)
+
+            if len(batch) >= 50:
+                added += self.add(batch)
+                batch.clear()
+
+        added += self.add(batch)
+
+        # Only a complete walk covers every message up to the newest one
+        if newest > last_id:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO backfills VALUES (?, ?)",
+                    (channel.id, newest),
+                )
+
+        return added
+
+    def attach(self, bus: EventBus) -> Subscription:
+        """Stores every message published on the bus, e.g. by the
+        chat poller.
+        """
+
+        async def on_message(message: ChatMessage) -> None:
+            self.add((message,))
+
+        return bus.subscribe(EventType.Message, on_message)
+
+    def _build(
+        self,
+        where: List[str],
+        params: List[Any],
+        channel_id: Optional[int],
+        sender_id: Optional[int],
+        after: Optional[int],
+        before: Optional[int],
+        start: Union[datetime, int, str, None],
+        end: Union[datetime, int, str, None],
+    ) -> None:
+        filters = (
+            ("m.channel_id = ?", channel_id),
+            ("m.sender_id = ?", sender_id),
+            ("m.message_id > ?", after),
+            ("m.message_id < ?", before),
+            ("m.epoch >= ?", None if start is None else to_epoch(start)),
+            ("m.epoch <= ?", None if end is None else to_epoch(end)),
+        )
+
+        for clause, value in filters:
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+
+    def _fetch(self, sql: str, params: List[Any]) -> List[ChatMessage]:
+        return [
+            ChatMessage(
+                connector=self._connector,
+                data={
+                    "message_id": row[0],
+                    "channel_id": row[1],
+                    "sender_id": row[2],
+                    "timestamp": row[3],
+                    "content": row[4],
+                    "is_action": bool(row[5]),
+                },
+            )
+            for row in self._db.execute(sql, params)
+        ]
+
+    def messages(
+        self,
+        *,
+        channel_id: Optional[int] = None,
+        sender_id: Optional[int] = None,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        start: Union[datetime, int, str, None] = None,
+        end: Union[datetime, int, str, None] = None,
+        limit: int = 100,
+    ) -> List[ChatMessage]:
+        """Returns stored messages, newest first.
+
+        Args:
+            channel_id (:obj:`int`, optional): Only from this channel.
+            sender_id (:obj:`int`, optional): Only from this user.
+            after (:obj:`int`, optional): Only with a greater ID.
+            before (:obj:`int`, optional): Only with a lower ID.
+            start (Union[datetime, int, str], optional): Only sent
+                at or after this time.
+            end (Union[datetime, int, str], optional): Only sent
+                at or before this time.
+            limit (:obj:`int`, optional): Max messages. Defaults to 100.
+
+        Returns:
+            List[pyosu.ChatMessage]: Matching messages.
+        """
+        where: List[str] = []
+        params: List[Any] = []
+        self._build(
+            where, params, channel_id, sender_id, after, before, start, end
+        )
+
+        sql = f"SELECT {_COLUMNS} FROM messages m"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        params.append(limit)
+        return self._fetch(sql + " ORDER BY m.message_id DESC LIMIT ?", params)
+
+    def search(
+        self,
+        query: str,
+        *,
+        channel_id: Optional[int] = None,
+        sender_id: Optional[int] = None,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        start: Union[datetime, int, str, None] = None,
+        end: Union[datetime, int, str, None] = None,
+        limit: int = 100,
+    ) -> List[ChatMessage]:
+        """Full-text search over stored messages, newest first.
+
+        Args:
+            query (:obj:`str`): FTS5 query, e.g. ``"spam OR scam"``.
+            **filters: Same filters as :meth:`messages`.
+
+        Returns:
+            List[pyosu.ChatMessage]: Matching messages.
+        """
+        where = ["messages_fts MATCH ?"]
+        params: List[Any] = [query]
+        self._build(
+            where, params, channel_id, sender_id, after, before, start, end
+        )
+
+        sql = (
+            f"SELECT {_COLUMNS} FROM messages_fts"
+            " JOIN messages m ON m.message_id = messages_fts.rowid"
+            " WHERE " + " AND ".join(where)
+        )
+
+        params.append(limit)
+        return self._fetch(sql + " ORDER BY m.message_id DESC LIMIT ?", params)
+
+    def count(self, *, channel_id: Optional[int] = None) -> int:
+        """Returns the number of stored messages."""
+        if channel_id is None:
+            return len(self)
+
+        return self._db.execute(
+            "SELECT COUNT(*) FROM messages WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()[0]
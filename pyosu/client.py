@@ -26,9 +26,10 @@ from __future__ import annotations
 
 import asyncio
 import aiohttp
+import os
 
 from .http import HTTPClient
-from .user import User
+from .user import User, UserStatistics
 from .connection import Connector
 from .beatmap import Beatmap
 from .beatmapset import Beatmapset
@@ -37,12 +38,51 @@ from .wiki import WikiPage
 from .rankings import Spotlight, Ranking
 from .news import NewsPostList
 from .build import BuildChangelog
+from .comment import CommentCrawler, CommentTree
+from .discussion import (
+    BeatmapsetDiscussion,
+    BeatmapsetDiscussionPost,
+    BeatmapsetDiscussionVote,
+)
+from .serialization import loads, loads_many
+from .pagination import CursorPaginator
+from .poller import ChatPoller
+from .dispatch import EventBus
+from .outbox import MessageQueue
+from .chatlog import ChatHistoryStore
+from .markers import ReadMarkers
+from .websocket import NotificationSocket
+from .leaderboard import LeaderboardWatcher
+from .tracker import ScoreTracker
+from .resolver import BeatmapResolver
+from .search import BeatmapsetIndex
+from .snapshots import RankingHistory, ranking_key
+from .progress import StatisticsRecorder
+from .references import Reference, resolve_references
+from .ratelimit import TokenBucket
+from .notification import Notification, NotificationInbox, iter_notifications
+from .enums import GameMode
 
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from .enums import ChangelogStream
+    from .channel import ChatChannel
     from .types.obj import ObjectID
+    from .dispatch import Handler
+
+ALL_MODES = (GameMode.Osu, GameMode.Taiko, GameMode.Fruits, GameMode.Mania)
 
 
 class Client:
@@ -66,10 +106,62 @@ class Client:
             proxy=proxy, proxy_auth=proxy_auth, ssl=ssl
         )
         self._connection: Connector = self._get_connection()
+        self.events: EventBus = EventBus()
+        self.poller: ChatPoller = ChatPoller(self._connection, bus=self.events)
+        self.outbox: MessageQueue = MessageQueue(self._connection)
+        # Chat messages come from the poller, the socket would publish
+        # every message a second time
+        self.notifier: NotificationSocket = NotificationSocket(
+            self._connection, bus=self.events, chat=False
+        )
+        self._inbox: Optional[NotificationInbox] = None
+        self.budget: TokenBucket = TokenBucket(1.0, 5)
+        self.leaderboards: LeaderboardWatcher = LeaderboardWatcher(
+            self._connection, bus=self.events, budget=self.budget
+        )
+        self.tracker: ScoreTracker = ScoreTracker(
+            self._connection, bus=self.events, budget=self.budget
+        )
+        self._user_requests: Dict[Tuple[Any, ...], asyncio.Future] = {}
 
     def _get_connection(self) -> Connector:
         return Connector(http=self.http)
 
+    def event(
+        self, event: str, /, **options: Any
+    ) -> Callable[[Handler], Handler]:
+        """Decorator registering a coroutine function for an event.
+
+        Handlers run in their own worker pool, options are passed to
+        `pyosu.EventBus.subscribe` (workers, queue_size, policy).
+
+        Args:
+            event (:obj:`str`): A `pyosu.EventType` value.
+
+        Example:
+            @client.event(pyosu.EventType.Message, workers=4)
+            async def on_message(message):
+                ...
+        """
+        return self.events.on(event, **options)
+
+    @property
+    def inbox(self) -> NotificationInbox:
+        """pyosu.NotificationInbox: Notification cache, created and
+        attached to `events` on first access, so clients that never use
+        it do not keep pushed notifications.
+        """
+        if self._inbox is None:
+            self._inbox = NotificationInbox(self._connection)
+            self._inbox.attach(self.events)
+
+        return self._inbox
+
+    @property
+    def read_markers(self) -> ReadMarkers:
+        """pyosu.ReadMarkers: Coalesced read markers, flushed on logout."""
+        return self._connection.read_markers
+
     @property
     def user(self) -> Optional[User]:
         return self._connection.user
@@ -94,11 +186,12 @@ class Client:
             password=password,
         )
 
-        data = await self.http.get_own_user()
-        client_user = User(connector=self._connection, data=data)
+        data, presence = await asyncio.gather(
+            self.http.get_own_user(), self.http.get_presence()
+        )
+        client_user = self._connection._refresh_user_cache(data)
         self._connection.user = client_user
-        self._connection.users[client_user.id] = client_user
-        await self._connection._get_presence()
+        await self._connection._get_presence(presence)
 
     async def oauth_login(self, client_id: int, client_secret: str) -> None:
         """Creates OAuth token for public scopes using a given client ID
@@ -138,7 +231,351 @@ class Client:
             :obj:`pyosu.Beatmap`
         """
         data = await self.http.get_beatmap(beatmap_id)
-        return Beatmap(connector=self._connection, data=data)
+        return self._connection._refresh_beatmap_cache(data)
+
+    def search_beatmapsets(
+        self,
+        query: Optional[str] = None,
+        *,
+        mode: Union[str, int, None] = None,
+        status: Optional[str] = None,
+        genre: Optional[int] = None,
+        language: Optional[int] = None,
+        sort: Optional[str] = None,
+        nsfw: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> CursorPaginator[Beatmapset]:
+        """Iterates beatmapset search results following the API
+        cursor. The next page is requested while the current one is
+        consumed and beatmapsets are cached. Results shifting between
+        pages while the search index updates are only yielded once.
+
+        Args:
+            query (:obj:`str`, optional): Search text.
+            mode (Union[str, int], optional): A `pyosu.GameMode` or
+                its number, 0 to 3.
+            status (:obj:`str`, optional): "any", "ranked", "qualified",
+                "loved", "pending", "graveyard"... Defaults to ranked.
+            genre (:obj:`int`, optional): Genre ID.
+            language (:obj:`int`, optional): Language ID.
+            sort (:obj:`str`, optional): Field and direction, e.g.
+                "ranked_desc" or "plays_desc".
+            nsfw (:obj:`bool`, optional): Include explicit content.
+            cursor (:obj:`str`, optional): Cursor string to resume from.
+            offset (:obj:`int`, optional): Items of the cursor page
+                already consumed, see `CursorPaginator.offset`.
+            limit (:obj:`int`, optional): Max number of items to yield.
+
+        Returns:
+            :obj:`pyosu.CursorPaginator[pyosu.Beatmapset]`
+
+        Raises:
+            ValueError: Unknown `mode`.
+        """
+        if isinstance(mode, str):
+            if mode not in ALL_MODES:
+                raise ValueError(
+                    f"Unknown game mode {mode!r}, expected one of"
+                    f" {', '.join(ALL_MODES)}"
+                )
+
+            # The search takes the ruleset number
+            mode = ALL_MODES.index(mode)
+        elif mode is not None and not 0 <= mode < len(ALL_MODES):
+            raise ValueError(f"Unknown ruleset number {mode!r}")
+
+        async def fetch(
+            cursor: Optional[str],
+        ) -> Tuple[List[Beatmapset], Optional[str]]:
+            data = await self.http.search_beatmap(
+                query,
+                mode=mode,
+                status=status,
+                genre=genre,
+                language=language,
+                sort=sort,
+                nsfw=nsfw,
+                cursor_string=cursor,
+            )
+            beatmapsets = [
+                self._connection._add_beatmapset_cache(payload)
+                for payload in data["beatmapsets"]
+            ]
+            return beatmapsets, data.get("cursor_string")
+
+        return CursorPaginator(
+            fetch,
+            cursor=cursor,
+            offset=offset,
+            limit=limit,
+            key=attrgetter("id"),
+        )
+
+    def iter_beatmapset_discussions(
+        self,
+        *,
+        beatmap_id: Optional[ObjectID] = None,
+        beatmapset_id: Optional[ObjectID] = None,
+        beatmapset_status: str = "all",
+        message_types: Optional[List[str]] = None,
+        only_unresolved: bool = False,
+        sort: str = "id_desc",
+        user: Optional[ObjectID] = None,
+        with_deleted: bool = False,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        page_size: int = 50,
+    ) -> CursorPaginator[BeatmapsetDiscussion]:
+        """Iterates beatmapset discussions following the API cursor.
+        The next page is requested while the current one is consumed,
+        embedded users, beatmaps and beatmapsets are cached.
+
+        Args:
+            beatmap_id (:obj:`pyosu.ObjectID`, optional): Beatmap filter.
+            beatmapset_id (:obj:`pyosu.ObjectID`, optional): Beatmapset
+                filter.
+            beatmapset_status (:obj:`str`, optional): Beatmapset status
+                filter. Defaults to "all".
+            message_types (:obj:`list`, optional): Message types filter
+                (suggestion, problem, praise...).
+            only_unresolved (:obj:`bool`, optional): True to only
+                include unresolved discussions.
+            sort (:obj:`str`, optional): "id_desc" or "id_asc".
+            user (:obj:`pyosu.ObjectID`, optional): Author filter.
+            with_deleted (:obj:`bool`, optional): Include deleted
+                discussions (moderators only).
+            cursor (:obj:`str`, optional): Cursor string to resume from.
+            offset (:obj:`int`, optional): Items of the cursor page
+                already consumed, see `CursorPaginator.offset`.
+            limit (:obj:`int`, optional): Max number of items to yield.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+
+        Returns:
+            :obj:`pyosu.CursorPaginator[pyosu.BeatmapsetDiscussion]`
+        """
+
+        async def fetch(
+            cursor: Optional[str],
+        ) -> Tuple[List[BeatmapsetDiscussion], Optional[str]]:
+            data = await self.http.get_beatmapset_discussions(
+                beatmap_id=beatmap_id,
+                beatmapset_id=beatmapset_id,
+                beatmapset_status=beatmapset_status,
+                limit=page_size,
+                message_types=message_types,
+                only_unresolved=only_unresolved,
+                sort=sort,
+                user_id=user,
+                with_deleted="true" if with_deleted else None,
+                cursor_string=cursor,
+            )
+            self._connection._add_included_cache(data)
+            discussions = [
+                BeatmapsetDiscussion(connector=self._connection, data=d)
+                for d in data["discussions"]
+            ]
+            return discussions, data.get("cursor_string")
+
+        return CursorPaginator(
+            fetch, cursor=cursor, offset=offset, limit=limit
+        )
+
+    def iter_beatmapset_discussion_posts(
+        self,
+        *,
+        discussion_id: Optional[ObjectID] = None,
+        sort: str = "id_desc",
+        types: str = "reply",
+        user: Optional[ObjectID] = None,
+        with_deleted: bool = False,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        page_size: int = 50,
+    ) -> CursorPaginator[BeatmapsetDiscussionPost]:
+        """Iterates beatmapset discussion posts following the API
+        cursor. The next page is requested while the current one is
+        consumed, embedded users and beatmapsets are cached.
+
+        Args:
+            discussion_id (:obj:`pyosu.ObjectID`, optional): Discussion
+                filter.
+            sort (:obj:`str`, optional): "id_desc" or "id_asc".
+            types (:obj:`str`, optional): "first", "reply" or "system".
+                Defaults to "reply".
+            user (:obj:`pyosu.ObjectID`, optional): Author filter.
+            with_deleted (:obj:`bool`, optional): Include deleted posts
+                (moderators only).
+            cursor (:obj:`str`, optional): Cursor string to resume from.
+            offset (:obj:`int`, optional): Items of the cursor page
+                already consumed, see `CursorPaginator.offset`.
+            limit (:obj:`int`, optional): Max number of items to yield.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+
+        Returns:
+            :obj:`pyosu.CursorPaginator[pyosu.BeatmapsetDiscussionPost]`
+        """
+
+        async def fetch(
+            cursor: Optional[str],
+        ) -> Tuple[List[BeatmapsetDiscussionPost], Optional[str]]:
+            data = await self.http.get_beatmapset_discussion_posts(
+                discussion_id=discussion_id,
+                limit=page_size,
+                sort=sort,
+                types=types,
+                user_id=user,
+                with_deleted="true" if with_deleted else None,
+                cursor_string=cursor,
+            )
+            self._connection._add_included_cache(data)
+            posts = [
+                BeatmapsetDiscussionPost(connector=self._connection, data=d)
+                for d in data["posts"]
+            ]
+            return posts, data.get("cursor_string")
+
+        return CursorPaginator(
+            fetch, cursor=cursor, offset=offset, limit=limit
+        )
+
+    def iter_beatmapset_discussion_votes(
+        self,
+        *,
+        discussion_id: Optional[ObjectID] = None,
+        receiver: Optional[ObjectID] = None,
+        score: Optional[str] = None,
+        sort: str = "id_desc",
+        user: Optional[ObjectID] = None,
+        with_deleted: bool = False,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        page_size: int = 50,
+    ) -> CursorPaginator[BeatmapsetDiscussionVote]:
+        """Iterates beatmapset discussion votes following the API
+        cursor. The next page is requested while the current one is
+        consumed, embedded users are cached.
+
+        Args:
+            discussion_id (:obj:`pyosu.ObjectID`, optional): Discussion
+                filter.
+            receiver (:obj:`pyosu.ObjectID`, optional): Receiver filter.
+            score (:obj:`str`, optional): "1" for upvotes or "-1" for
+                downvotes. Defaults to both.
+            sort (:obj:`str`, optional): "id_desc" or "id_asc".
+            user (:obj:`pyosu.ObjectID`, optional): Voter filter.
+            with_deleted (:obj:`bool`, optional): Include deleted votes
+                (moderators only).
+            cursor (:obj:`str`, optional): Cursor string to resume from.
+            offset (:obj:`int`, optional): Items of the cursor page
+                already consumed, see `CursorPaginator.offset`.
+            limit (:obj:`int`, optional): Max number of items to yield.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+
+        Returns:
+            :obj:`pyosu.CursorPaginator[pyosu.BeatmapsetDiscussionVote]`
+        """
+
+        async def fetch(
+            cursor: Optional[str],
+        ) -> Tuple[List[BeatmapsetDiscussionVote], Optional[str]]:
+            data = await self.http.get_beatmapset_discussion_votes(
+                discussion_id=discussion_id,
+                limit=page_size,
+                receiver=receiver,
+                score=score,
+                sort=sort,
+                user_id=user,
+                with_deleted="true" if with_deleted else None,
+                cursor_string=cursor,
+            )
+            self._connection._add_included_cache(data)
+            votes = [
+                BeatmapsetDiscussionVote(connector=self._connection, data=d)
+                for d in data["votes"]
+            ]
+            return votes, data.get("cursor_string")
+
+        return CursorPaginator(
+            fetch, cursor=cursor, offset=offset, limit=limit
+        )
+
+    def iter_comments(
+        self,
+        commentable_type: str,
+        commentable_id: ObjectID,
+        *,
+        parent_id: int = 0,
+        sort: str = "new",
+        concurrency: int = 4,
+    ) -> CommentCrawler:
+        """Streams every comment of a resource, top level comments and
+        replies. Reply listings are requested concurrently and comment
+        authors are added to the users cache.
+
+        Args:
+            commentable_type (:obj:`str`): Resource type (beatmapset,
+                build, news_post).
+            commentable_id (:obj:`pyosu.ObjectID`): Resource ID.
+            parent_id (:obj:`int`, optional): Only stream the replies of
+                this comment. Defaults to 0 (whole thread).
+            sort (:obj:`str`, optional): "new", "old" or "top".
+                Defaults to "new".
+            concurrency (:obj:`int`, optional): Max requests in flight.
+                Defaults to 4.
+
+        Returns:
+            :obj:`pyosu.CommentCrawler`: Async iterator of pyosu.Comment
+        """
+        return CommentCrawler(
+            self._connection,
+            commentable_type,
+            commentable_id,
+            parent_id=parent_id,
+            sort=sort,
+            concurrency=concurrency,
+        )
+
+    async def fetch_comment_tree(
+        self,
+        commentable_type: str,
+        commentable_id: ObjectID,
+        *,
+        sort: str = "new",
+        concurrency: int = 4,
+    ) -> CommentTree:
+        """Fetchs the whole comment thread of a resource indexed
+        by parent comment.
+
+        Args:
+            commentable_type (:obj:`str`): Resource type (beatmapset,
+                build, news_post).
+            commentable_id (:obj:`pyosu.ObjectID`): Resource ID.
+            sort (:obj:`str`, optional): "new", "old" or "top".
+                Defaults to "new".
+            concurrency (:obj:`int`, optional): Max requests in flight.
+                Defaults to 4.
+
+        Returns:
+            :obj:`pyosu.CommentTree`
+        """
+        tree = CommentTree()
+        async for comment in self.iter_comments(
+            commentable_type,
+            commentable_id,
+            sort=sort,
+            concurrency=concurrency,
+        ):
+            tree.add(comment)
+
+        return tree
 
     async def fetch_build_changelog(
         self, stream: ChangelogStream, build: str
@@ -227,6 +664,93 @@ class Client:
         data = await self.http.get_rankings(mode=mode, type=type)
         return Ranking(connector=self._connection, data=data)
 
+    def iter_rankings(
+        self,
+        mode: str = "osu",
+        type: str = "performance",
+        *,
+        country: Optional[str] = None,
+        filter: str = "all",
+        spotlight: Optional[ObjectID] = None,
+        variant: Optional[str] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> CursorPaginator[UserStatistics]:
+        """Iterates ranking entries across all pages. The next page is
+        requested while the current one is consumed and ranked users
+        are added to the users cache.
+
+        The returned iterator exposes `cursor`, which can be saved and
+        passed back to resume from the page being consumed.
+
+        Args:
+            mode (:obj:`str`): osu gamemode. Defaults to "osu".
+            type (:obj:`str`): ranking type. Defaults to "performance".
+            country (:obj:`str`, optional): Country code filter for
+                performance rankings.
+            filter (:obj:`str`, optional): "all" or "friends".
+            spotlight (:obj:`pyosu.ObjectID`, optional): Spotlight ID
+                for charts rankings.
+            variant (:obj:`str`, optional): Mania variant (4k or 7k).
+            cursor (:obj:`dict`, optional): Cursor to resume from.
+            offset (:obj:`int`, optional): Items of the cursor page
+                already consumed, see `CursorPaginator.offset`.
+            limit (:obj:`int`, optional): Max number of entries to yield.
+
+        Returns:
+            :obj:`pyosu.CursorPaginator[pyosu.UserStatistics]`
+        """
+
+        async def fetch(cursor: Any) -> Tuple[List[UserStatistics], Any]:
+            data = await self.http.get_rankings(
+                mode=mode,
+                type=type,
+                country=country,
+                cursor=cursor,
+                filter=filter,
+                spotlight=spotlight,
+                variant=variant,
+            )
+            entries = [
+                UserStatistics(connector=self._connection, data=d)
+                for d in data["ranking"]
+            ]
+            return entries, data.get("cursor")
+
+        return CursorPaginator(
+            fetch, cursor=cursor, offset=offset, limit=limit
+        )
+
+    async def record_rankings(
+        self,
+        history: RankingHistory,
+        mode: str = "osu",
+        type: str = "performance",
+        *,
+        country: Optional[str] = None,
+        variant: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> int:
+        """Takes a snapshot of a ranking into a `pyosu.RankingHistory`.
+
+        Args:
+            history (:obj:`pyosu.RankingHistory`): Snapshot store.
+            mode (:obj:`str`): osu gamemode. Defaults to "osu".
+            type (:obj:`str`): ranking type. Defaults to "performance".
+            country (:obj:`str`, optional): Country code filter.
+            variant (:obj:`str`, optional): Mania variant (4k or 7k).
+            limit (:obj:`int`, optional): Max number of entries.
+
+        Returns:
+            int: Snapshot ID.
+        """
+        entries = self.iter_rankings(
+            mode, type, country=country, variant=variant, limit=limit
+        )
+        key = ranking_key(mode, type, country, variant)
+        return await history.record(key, entries)
+
     async def fetch_spotlights(self) -> List[Spotlight]:
         """Fetchs spotlights from page.
 
@@ -239,17 +763,106 @@ class Client:
             for d in data["spotlights"]
         ]
 
-    async def fetch_user(self, user_id: int, /) -> User:
-        """Fetchs information from a user.
+    def _request_user(
+        self, user_id: int, mode: Optional[str], *, throttle: bool = False
+    ) -> asyncio.Future:
+        # Concurrent requests for the same profile share one call, only
+        # callers asking for the same throttling share it
+        key = (user_id, mode, throttle)
+        future = self._user_requests.get(key)
+
+        if future is None:
+
+            async def request() -> Dict[str, Any]:
+                if throttle:
+                    await self.budget.acquire()
+                return await self.http.get_user(user_id, mode)
+
+            future = asyncio.ensure_future(request())
+            self._user_requests[key] = future
+            future.add_done_callback(
+                lambda _: self._user_requests.pop(key, None)
+            )
+
+        return asyncio.shield(future)
+
+    async def fetch_user(
+        self, user_id: int, /, mode: Optional[str] = None
+    ) -> User:
+        """Fetchs information from a user and refreshes the cached
+        user in place.
+
+        Args:
+            user_id (:obj:`int`): user id
+            mode (:obj:`str`, optional): Game mode of the statistics.
+                Defaults to the user's default mode.
+
+        Returns:
+            :obj:`pyosu.User`
+        """
+        data = await self._request_user(user_id, mode)
+        return self._connection._merge_user(data, mode)
+
+    async def fetch_user_all_modes(
+        self, user_id: int, /, modes: Tuple[str, ...] = ALL_MODES
+    ) -> User:
+        """Fetchs a user in several game modes concurrently and merges
+        them into the cached user. Statistics of every mode are kept
+        in `User.statistics_rulesets`, `User.statistics` and
+        `User.rank_history` stay on the user's default mode. Requests
+        are throttled by the client `budget`.
 
         Args:
             user_id (:obj:`int`): user id
+            modes (Tuple[str], optional): Game modes to fetch.
+                Defaults to all modes.
 
         Returns:
             :obj:`pyosu.User`
+
+        Raises:
+            ValueError: `modes` is empty.
         """
-        data = await self.http.get_user(user_id)
-        return User(connector=self._connection, data=data)
+        if not modes:
+            raise ValueError("At least one game mode is required")
+
+        responses = await asyncio.gather(
+            *(self._request_user(user_id, m, throttle=True) for m in modes)
+        )
+        playmode = responses[0].get("playmode")
+
+        # The default mode goes last so it is the one left on the user
+        merged = sorted(zip(modes, responses), key=lambda r: r[0] == playmode)
+        for mode, data in merged:
+            user = self._connection._merge_user(data, mode)
+
+        return user
+
+    async def fetch_users_all_modes(
+        self, users_id: List[int], /, modes: Tuple[str, ...] = ALL_MODES
+    ) -> List[User]:
+        """Fetchs several users in several game modes concurrently,
+        see `fetch_user_all_modes`.
+
+        Args:
+            users_id (:obj:`list`): List containing users id to fetch
+            modes (Tuple[str], optional): Game modes to fetch.
+                Defaults to all modes.
+
+        Returns:
+            List[pyosu.User]
+
+        Raises:
+            ValueError: `modes` is empty.
+        """
+        if not modes:
+            raise ValueError("At least one game mode is required")
+
+        return list(
+            await asyncio.gather(
+                *(self.fetch_user_all_modes(u, modes) for u in users_id)
+            )
+        )
 
     async def fetch_users_bulk(self, users_id: List[int], /) -> List[User]:
         """Fetchs a list of users.
@@ -279,7 +892,156 @@ class Client:
         data = await self.http.get_wiki_page(locale=locale, path=path)
         return WikiPage(connector=self._connection, data=data)
 
+    def load_model(self, raw: bytes, /, *, backend: str = "json") -> Any:
+        """Rebuilds a model serialized with `pyosu.dumps` bound
+        to this client.
+
+        Args:
+            raw (:obj:`bytes`): Encoded model.
+            backend (:obj:`str`, optional): "json", "orjson" or "msgpack".
+                Defaults to "json".
+
+        Returns:
+            A pyosu model.
+        """
+        return loads(raw, connector=self._connection, backend=backend)
+
+    def load_models(
+        self, raw: bytes, /, *, backend: str = "json"
+    ) -> List[Any]:
+        """Rebuilds a list of models serialized with `pyosu.dumps_many`
+        bound to this client.
+
+        Args:
+            raw (:obj:`bytes`): Encoded models.
+            backend (:obj:`str`, optional): "json", "orjson" or "msgpack".
+                Defaults to "json".
+
+        Returns:
+            List of pyosu models.
+        """
+        return loads_many(raw, connector=self._connection, backend=backend)
+
+    def iter_notifications(
+        self,
+        *,
+        max_id: Optional[ObjectID] = None,
+        limit: Optional[int] = None,
+    ) -> CursorPaginator[Notification]:
+        """Iterates notifications from newest to oldest, paging with
+        `max_id`. Use `Client.inbox` to only process changes.
+
+        Args:
+            max_id (:obj:`pyosu.ObjectID`, optional): Newest notification
+                ID to start from.
+            limit (:obj:`int`, optional): Max number of items to yield.
+
+        Returns:
+            :obj:`pyosu.CursorPaginator[pyosu.Notification]`
+        """
+        return iter_notifications(self._connection, max_id=max_id, limit=limit)
+
+    async def resolve_references(
+        self, items: Iterable[Reference], *, concurrency: int = 4
+    ) -> List[Reference]:
+        """Links the beatmaps, beatmapsets and users referenced by
+        scores and events, fetching the missing ones in batches.
+        See `pyosu.resolve_references`.
+
+        Args:
+            items (Iterable[Union[pyosu.Score, pyosu.Event]]): Scores
+                and events to resolve.
+            concurrency (:obj:`int`, optional): Max requests in flight.
+
+        Returns:
+            List[Union[pyosu.Score, pyosu.Event]]: The same items.
+        """
+        return await resolve_references(
+            self._connection, items, concurrency=concurrency
+        )
+
+    def open_chat_history(self, path: str = ":memory:") -> ChatHistoryStore:
+        """Opens a local chat history store fed by the chat poller.
+        Use `ChatHistoryStore.backfill` to download older messages.
+
+        Args:
+            path (:obj:`str`, optional): SQLite database file.
+                Defaults to an in-memory database.
+
+        Returns:
+            pyosu.ChatHistoryStore: The opened store.
+        """
+        store = ChatHistoryStore(self._connection, path)
+        store.attach(self.events)
+        return store
+
+    def open_beatmap_resolver(
+        self, path: str = ":memory:", **options: Any
+    ) -> BeatmapResolver:
+        """Opens a checksum and filename index fed by every beatmap
+        the client receives. Options are passed to
+        `pyosu.BeatmapResolver`.
+
+        Args:
+            path (:obj:`str`, optional): SQLite database file.
+                Defaults to an in-memory database.
+
+        Returns:
+            pyosu.BeatmapResolver: The opened resolver.
+        """
+        resolver = BeatmapResolver(self._connection, path, **options)
+        self._connection.beatmap_index = resolver
+        return resolver
+
+    def open_statistics_recorder(
+        self, path: str = ":memory:"
+    ) -> StatisticsRecorder:
+        """Opens a statistics time series fed by every user fetched
+        with `fetch_user`.
+
+        Args:
+            path (:obj:`str`, optional): SQLite database file.
+                Defaults to an in-memory database.
+
+        Returns:
+            pyosu.StatisticsRecorder: The opened recorder.
+        """
+        recorder = StatisticsRecorder(path)
+        self._connection.statistics_recorder = recorder
+        return recorder
+
+    def open_beatmapset_index(
+        self, path: Optional[str] = None, *, backend: str = "json"
+    ) -> BeatmapsetIndex:
+        """Opens a local search index fed by every beatmapset the
+        client caches. Save it with `BeatmapsetIndex.save`.
+
+        Args:
+            path (:obj:`str`, optional): Snapshot to load, if it exists.
+            backend (:obj:`str`, optional): Snapshot backend.
+                Defaults to "json".
+
+        Returns:
+            pyosu.BeatmapsetIndex: The opened index.
+        """
+        if path is not None and os.path.exists(path):
+            index = BeatmapsetIndex.load(
+                path, connector=self._connection, backend=backend
+            )
+        else:
+            index = BeatmapsetIndex(self._connection.beatmapsets.values())
+
+        self._connection.beatmapset_index = index
+        return index
+
     async def logout(self) -> None:
         """Closes the connection and deletes token"""
+        await self.poller.stop()
+        await self.notifier.stop()
+        await self.leaderboards.stop()
+        await self.tracker.stop()
+        await self.outbox.close()
+        await self.read_markers.close()
+        await self.events.close()
         await self.http.delete_current_token()
         await self.http.close_session()
@@ -0,0 +1,329 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+from array import array
+
+import asyncio
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .types.obj import ObjectID
+    from .types.comment import Comment as CommentPayload
+    from .user import User
+
+
+class Comment:
+    __slots__ = (
+        "_connector",
+        "id",
+        "commentable_id",
+        "commentable_type",
+        "created_at",
+        "deleted_at",
+        "edited_at",
+        "edited_by_id",
+        "legacy_name",
+        "message",
+        "message_html",
+        "parent_id",
+        "pinned",
+        "replies_count",
+        "updated_at",
+        "user_id",
+        "votes_count",
+    )
+
+    if TYPE_CHECKING:
+        _connector: Connector
+        id: int
+        commentable_id: ObjectID
+        commentable_type: str
+        created_at: str
+        deleted_at: Optional[str]
+        edited_at: Optional[str]
+        edited_by_id: Optional[ObjectID]
+        legacy_name: Optional[str]
+        message: Optional[str]
+        message_html: Optional[str]
+        parent_id: Optional[int]
+        pinned: bool
+        replies_count: int
+        updated_at: str
+        user_id: Optional[ObjectID]
+        votes_count: int
+
+    def __init__(self, *, connector: Connector, data: CommentPayload) -> None:
+        self._connector = connector
+        self._update_data(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Comment id={self.id} parent_id={self.parent_id}"
+            f" user_id={self.user_id} replies={self.replies_count}>"
+        )
+
+    def __eq__(self, o: Any) -> bool:
+        return isinstance(o, type(self)) and o.id == self.id
+
+    def __hash__(self) -> int:
+        return self.id
+
+    @property
+    def user(self) -> Optional[User]:
+        return self._connector.users.get(self.user_id)
+
+    def _update_data(self, data: CommentPayload) -> None:
+        self.id = int(data["id"])
+        self.commentable_id = data["commentable_id"]
+        self.commentable_type = data["commentable_type"]
+        self.created_at = data["created_at"]
+        self.deleted_at = data.get("deleted_at")
+        self.edited_at = data.get("edited_at")
+        self.edited_by_id = data.get("edited_by_id")
+        self.legacy_name = data.get("legacy_name")
+        self.message = data.get("message")
+        self.message_html = data.get("message_html")
+        self.parent_id = data.get("parent_id")
+        self.pinned = data.get("pinned", False)
+        self.replies_count = data.get("replies_count", 0)
+        self.updated_at = data.get("updated_at")
+        self.user_id = data.get("user_id")
+        self.votes_count = data.get("votes_count", 0)
+
+    def to_payload(self) -> CommentPayload:
+        return {
+            "id": self.id,
+            "commentable_id": self.commentable_id,
+            "commentable_type": self.commentable_type,
+            "created_at": self.created_at,
+            "deleted_at": self.deleted_at,
+            "edited_at": self.edited_at,
+            "edited_by_id": self.edited_by_id,
+            "legacy_name": self.legacy_name,
+            "message": self.message,
+            "message_html": self.message_html,
+            "parent_id": self.parent_id,
+            "pinned": self.pinned,
+            "replies_count": self.replies_count,
+            "updated_at": self.updated_at,
+            "user_id": self.user_id,
+            "votes_count": self.votes_count,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: CommentPayload, *, connector: Connector
+    ) -> Comment:
+        return cls(connector=connector, data=data)
+
+
+class CommentTree:
+    """Comments of a thread indexed by parent. Each parent ID maps to
+    an `array` with the IDs of its replies, top level comments are
+    stored under the parent ID 0.
+
+    Args:
+        comments (Iterable[pyosu.Comment]): Comments of the thread.
+    """
+
+    def __init__(self, comments: Iterable[Comment] = ()) -> None:
+        self.comments: Dict[int, Comment] = {}
+        self.children: Dict[int, array] = {}
+
+        for comment in comments:
+            self.add(comment)
+
+    def __len__(self) -> int:
+        return len(self.comments)
+
+    def __contains__(self, comment_id: int) -> bool:
+        return comment_id in self.comments
+
+    def add(self, comment: Comment) -> None:
+        if comment.id in self.comments:
+            self.comments[comment.id] = comment
+            return
+
+        self.comments[comment.id] = comment
+        parent = comment.parent_id or 0
+        self.children.setdefault(parent, array("q")).append(comment.id)
+
+    @property
+    def roots(self) -> List[Comment]:
+        return self.replies(0)
+
+    def replies(self, comment_id: int) -> List[Comment]:
+        """Returns the direct replies of a comment."""
+        return [self.comments[i] for i in self.children.get(comment_id, ())]
+
+    def walk(self, comment_id: int = 0) -> Iterator[Tuple[int, Comment]]:
+        """Iterates the thread depth-first from a comment (or from the
+        top level), yielding (depth, comment) tuples.
+        """
+        stack = [(0, i) for i in reversed(self.children.get(comment_id, ()))]
+
+        while stack:
+            depth, current = stack.pop()
+            yield depth, self.comments[current]
+
+            for reply in reversed(self.children.get(current, ())):
+                stack.append((depth + 1, reply))
+
+
+class CommentCrawler:
+    """Streams a whole comment thread. Top level comments are read
+    following the API cursor, then every comment with missing replies
+    gets its own reply listing. Independent listings are requested
+    concurrently, with at most `concurrency` requests in flight.
+
+    Users embedded in each bundle are added to the users cache.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        commentable_type (:obj:`str`): Resource type (beatmapset,
+            build, news_post).
+        commentable_id (:obj:`pyosu.ObjectID`): Resource ID.
+        parent_id (:obj:`int`, optional): Comment to start from.
+            Defaults to 0 (top level).
+        sort (:obj:`str`, optional): "new", "old" or "top".
+            Defaults to "new".
+        concurrency (:obj:`int`, optional): Max requests in flight.
+            Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        commentable_type: str,
+        commentable_id: ObjectID,
+        *,
+        parent_id: int = 0,
+        sort: str = "new",
+        concurrency: int = 4,
+    ) -> None:
+        self._connector = connector
+        self.commentable_type = commentable_type
+        self.commentable_id = commentable_id
+        self.parent_id = parent_id
+        self.sort = sort
+        self.concurrency = concurrency
+
+    def __aiter__(self) -> AsyncIterator[Comment]:
+        return self._crawl()
+
+    async def _crawl(self) -> AsyncIterator[Comment]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks: Set[asyncio.Task] = set()
+        seen: Set[int] = set()
+        scheduled: Set[int] = {self.parent_id}
+        reply_counts: Dict[int, int] = {}
+
+        def schedule(parent_id: int) -> None:
+            task = asyncio.ensure_future(walk(parent_id))
+            tasks.add(task)
+            task.add_done_callback(done)
+
+        def done(task: asyncio.Task) -> None:
+            tasks.discard(task)
+            if task.cancelled():
+                return
+
+            if task.exception() is not None:
+                queue.put_nowait(task.exception())
+            elif not tasks:
+                queue.put_nowait(None)
+
+        async def walk(parent_id: int) -> None:
+            cursor = None
+
+            while True:
+                async with semaphore:
+                    data = await self._connector.http.get_comments(
+                        commentable_type=self.commentable_type,
+                        commentable_id=self.commentable_id,
+                        cursor=cursor,
+                        parent_id=parent_id,
+                        sort=self.sort,
+                    )
+
+                self._connector._add_users_cache(data.get("users"))
+                new = []
+
+                for payload in (
+                    *data["comments"],
+                    *(data.get("included_comments") or ()),
+                ):
+                    comment = Comment(connector=self._connector, data=payload)
+                    if comment.id in seen:
+                        continue
+
+                    seen.add(comment.id)
+                    parent = comment.parent_id or 0
+                    reply_counts[parent] = reply_counts.get(parent, 0) + 1
+                    new.append(comment)
+                    queue.put_nowait(comment)
+
+                for comment in new:
+                    missing = comment.replies_count > reply_counts.get(
+                        comment.id, 0
+                    )
+                    if missing and comment.id not in scheduled:
+                        scheduled.add(comment.id)
+                        schedule(comment.id)
+
+                cursor = data.get("cursor")
+                if not data.get("has_more") or not cursor:
+                    return
+
+        schedule(self.parent_id)
+
+        try:
+            while True:
+                item = await queue.get()
+
+                if item is None:
+                    return
+
+                if isinstance(item, BaseException):
+                    raise item
+
+                yield item
+        finally:
+            for task in list(tasks):
+                task.cancel()
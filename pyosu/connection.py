@@ -24,31 +24,51 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from collections import OrderedDict
 
+import asyncio
+import time
+
 from .channel import ChatChannel
 from .beatmap import BeatmapScores
 from .user import User
 from .beatmap import Beatmap
+from .beatmapset import Beatmapset
+from .markers import ReadMarkers
 
 if TYPE_CHECKING:
     from .types.user import User as UserPayload
     from .types.beatmap import Beatmap as BeatmapPayload
+    from .types.beatmapset import Beatmapset as BeatmapsetPayload
+    from .types.channel import ChatChannel as ChatChannelPayload
     from .http import HTTPClient
-    from .channel import ChatChannel
+    from .resolver import BeatmapResolver
+    from .search import BeatmapsetIndex
+    from .progress import StatisticsRecorder
 
 
 class Connector:
+    # Max IDs per /users lookup, as limited by the API
+    users_chunk_size: int = 50
+    # Seconds before a cached PM partner is looked up again
+    users_ttl: float = 600.0
+
     def __init__(self, http: HTTPClient) -> None:
         self.http: HTTPClient = http
+        self.read_markers: ReadMarkers = ReadMarkers(self)
+        self.beatmap_index: Optional[BeatmapResolver] = None
+        self.beatmapset_index: Optional[BeatmapsetIndex] = None
+        self.statistics_recorder: Optional[StatisticsRecorder] = None
         self.init_values()
 
     def init_values(self) -> None:
         self.user: Optional[User] = None
         self.users: Dict[int, User] = {}
+        self.users_updated: Dict[int, float] = {}
         self.beatmaps: Dict[int, Beatmap] = {}
+        self.beatmapsets: Dict[int, Beatmapset] = {}
         self.pm_channels: OrderedDict[int, ChatChannel] = OrderedDict()
         self.beatmapscores: OrderedDict[int, BeatmapScores] = OrderedDict()
 
@@ -64,15 +84,107 @@ class Connector:
         except KeyError:
             user = User(connector=self, data=data)
             self.users[user.id] = user
+            self.users_updated[user.id] = time.monotonic()
             return user
 
-    def _add_beatmap_cache(self, data: BeatmapPayload) -> Beatmap:
+    def _refresh_user_cache(self, data: UserPayload) -> User:
+        user = self.users.get(int(data["id"]))
+        if user is None:
+            return self._add_user_cache(data)
+
+        user._merge_data(data)
+        self.users_updated[user.id] = time.monotonic()
+        return user
+
+    def _merge_user(
+        self, data: UserPayload, mode: Optional[str] = None
+    ) -> User:
+        """Refreshes a cached user with a profile fetched in `mode` and
+        keeps its statistics under that mode.
+        """
+        user = self._refresh_user_cache(data)
+        mode = str(mode or data.get("playmode") or "osu")
+
+        if user.statistics is not None:
+            user.statistics_rulesets[mode] = user.statistics
+
+        self._record_statistics(user, mode)
+        return user
+
+    def _record_statistics(
+        self, user: User, mode: Optional[str] = None
+    ) -> None:
+        if self.statistics_recorder is not None:
+            self.statistics_recorder.record(user, mode=mode)
+
+    def _add_beatmap_cache(
+        self, data: BeatmapPayload, *, commit: bool = True
+    ) -> Beatmap:
         try:
-            return self.beatmaps[int(data["id"])]
+            beatmap = self.beatmaps[int(data["id"])]
         except KeyError:
             beatmap = Beatmap(connector=self, data=data)
             self.beatmaps[beatmap.id] = beatmap
-            return beatmap
+
+        if self.beatmap_index is not None:
+            self.beatmap_index.add(beatmap, commit=commit)
+
+        return beatmap
+
+    def _refresh_beatmap_cache(self, data: BeatmapPayload) -> Beatmap:
+        beatmap = self.beatmaps.get(int(data["id"]))
+        if beatmap is None:
+            return self._add_beatmap_cache(data)
+
+        beatmap._update_data(data)
+        if self.beatmap_index is not None:
+            self.beatmap_index.add(beatmap)
+
+        return beatmap
+
+    def _add_beatmapset_cache(self, data: BeatmapsetPayload) -> Beatmapset:
+        beatmapset = self.beatmapsets.get(int(data["id"]))
+
+        if beatmapset is None:
+            beatmapset = Beatmapset(connector=self, data=data)
+            self.beatmapsets[beatmapset.id] = beatmapset
+        else:
+            beatmapset._merge_data(data)
+
+        # Adding a known beatmapset replaces its previous entry
+        if self.beatmapset_index is not None:
+            self.beatmapset_index.add(beatmapset)
+
+        return beatmapset
+
+    def _add_users_cache(self, data: Iterable[UserPayload]) -> List[User]:
+        return [self._add_user_cache(user) for user in data or ()]
+
+    def _add_beatmaps_cache(
+        self, data: Iterable[BeatmapPayload]
+    ) -> List[Beatmap]:
+        beatmaps = [
+            self._add_beatmap_cache(beatmap, commit=False)
+            for beatmap in data or ()
+        ]
+
+        if beatmaps and self.beatmap_index is not None:
+            self.beatmap_index.commit()
+
+        return beatmaps
+
+    def _add_beatmapsets_cache(
+        self, data: Iterable[BeatmapsetPayload]
+    ) -> List[Beatmapset]:
+        return [self._add_beatmapset_cache(bset) for bset in data or ()]
+
+    def _add_included_cache(self, data: Dict[str, Any]) -> None:
+        """Caches the users, beatmaps and beatmapsets embedded
+        in a response bundle.
+        """
+        self._add_users_cache(data.get("users"))
+        self._add_beatmaps_cache(data.get("beatmaps"))
+        self._add_beatmapsets_cache(data.get("beatmapsets"))
 
     def _add_pm_channel_cache(
         self, user_id: int, channel: ChatChannel
@@ -110,13 +222,72 @@ class Connector:
 
         return beatmapscore
 
-    async def _get_presence(self) -> None:
-        data = await self.http.get_presence()
+    def _sync_pm_channels(self, data: List[ChatChannelPayload]) -> List[int]:
+        """Diffs the presence channel list against the cached PM
+        channels. Known channels are updated in place, new ones are
+        added and closed ones dropped.
+
+        Returns:
+            List[int]: IDs of the users with an open PM channel.
+        """
+        partners = []
+
+        for payload in data:
+            if payload["type"] != "PM":
+                continue
+
+            for user_id in payload.get("users") or ():
+                if user_id == self.user.id:
+                    continue
 
-        for channel in data:
-            if channel["type"] == "PM":
-                author = [i for i in channel["users"] if i != self.user.id][0]
-                self.create_pm_channel(author, channel)
+                channel = self.pm_channels.get(user_id)
+                if channel is not None and channel.id == int(
+                    payload["channel_id"]
+                ):
+                    channel._update_data(payload)
+                    self.pm_channels.move_to_end(user_id)
+                else:
+                    channel = ChatChannel(connector=self, data=payload)
+                    self._add_pm_channel_cache(user_id, channel)
+
+                partners.append(user_id)
+
+        current = set(partners)
+        for user_id in [i for i in self.pm_channels if i not in current]:
+            del self.pm_channels[user_id]
+
+        return partners
+
+    def _stale_users(self, user_ids: Iterable[int]) -> List[int]:
+        now = time.monotonic()
+        return [
+            user_id
+            for user_id in dict.fromkeys(user_ids)
+            if user_id not in self.users
+            or now - self.users_updated.get(user_id, 0) > self.users_ttl
+        ]
+
+    async def _fetch_users(self, user_ids: List[int]) -> List[User]:
+        """Looks up users in concurrent chunks and refreshes the cache."""
+        size = self.users_chunk_size
+        chunks = [
+            user_ids[i : i + size] for i in range(0, len(user_ids), size)
+        ]
+        responses = await asyncio.gather(
+            *(self.http.get_users(chunk) for chunk in chunks)
+        )
+
+        return [
+            self._refresh_user_cache(user)
+            for data in responses
+            for user in data["users"]
+        ]
+
+    async def _get_presence(
+        self, data: Optional[List[ChatChannelPayload]] = None
+    ) -> None:
+        if data is None:
+            data = await self.http.get_presence()
 
-        data = await self.http.get_users(self.pm_channels.keys())
-        [self._add_user_cache(user) for user in data["users"]]
+        partners = self._sync_pm_channels(data)
+        await self._fetch_users(self._stale_users(partners))
@@ -0,0 +1,339 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .types.obj import ObjectID
+    from .types.discussions import (
+        BeatmapsetDiscussion as BeatmapsetDiscussionPayload,
+        BeatmapsetDiscussionPost as BeatmapsetDiscussionPostPayload,
+        BeatmapsetDiscussionVote as BeatmapsetDiscussionVotePayload,
+    )
+    from .beatmap import Beatmap
+    from .beatmapset import Beatmapset
+    from .user import User
+
+
+class BeatmapsetDiscussionPost:
+    __slots__ = (
+        "_connector",
+        "id",
+        "beatmapset_discussion_id",
+        "created_at",
+        "deleted_at",
+        "deleted_by_id",
+        "last_editor_id",
+        "message",
+        "system",
+        "updated_at",
+        "user_id",
+    )
+
+    if TYPE_CHECKING:
+        _connector: Connector
+        id: ObjectID
+        beatmapset_discussion_id: ObjectID
+        created_at: str
+        deleted_at: Optional[str]
+        deleted_by_id: Optional[ObjectID]
+        last_editor_id: Optional[ObjectID]
+        message: str
+        system: bool
+        updated_at: str
+        user_id: ObjectID
+
+    def __init__(
+        self, *, connector: Connector, data: BeatmapsetDiscussionPostPayload
+    ) -> None:
+        self._connector = connector
+        self._update_data(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BeatmapsetDiscussionPost id={self.id}"
+            f" discussion_id={self.beatmapset_discussion_id}"
+            f" user_id={self.user_id} system={self.system}>"
+        )
+
+    def __eq__(self, o: Any) -> bool:
+        return isinstance(o, type(self)) and o.id == self.id
+
+    def __hash__(self) -> int:
+        return self.id
+
+    @property
+    def user(self) -> Optional[User]:
+        return self._connector.users.get(self.user_id)
+
+    def _update_data(self, data: BeatmapsetDiscussionPostPayload) -> None:
+        self.id = data["id"]
+        self.beatmapset_discussion_id = data["beatmapset_discussion_id"]
+        self.created_at = data["created_at"]
+        self.deleted_at = data.get("deleted_at")
+        self.deleted_by_id = data.get("deleted_by_id")
+        self.last_editor_id = data.get("last_editor_id")
+        self.message = data["message"]
+        self.system = data.get("system", False)
+        self.updated_at = data.get("updated_at")
+        self.user_id = data["user_id"]
+
+    def to_payload(self) -> BeatmapsetDiscussionPostPayload:
+        return {
+            "id": self.id,
+            "beatmapset_discussion_id": self.beatmapset_discussion_id,
+            "created_at": self.created_at,
+            "deleted_at": self.deleted_at,
+            "deleted_by_id": self.deleted_by_id,
+            "last_editor_id": self.last_editor_id,
+            "message": self.message,
+            "system": self.system,
+            "updated_at": self.updated_at,
+            "user_id": self.user_id,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: BeatmapsetDiscussionPostPayload, *, connector: Connector
+    ) -> BeatmapsetDiscussionPost:
+        return cls(connector=connector, data=data)
+
+
+class BeatmapsetDiscussionVote:
+    __slots__ = (
+        "_connector",
+        "id",
+        "beatmapset_discussion_id",
+        "created_at",
+        "updated_at",
+        "score",
+        "user_id",
+    )
+
+    if TYPE_CHECKING:
+        _connector: Connector
+        id: ObjectID
+        beatmapset_discussion_id: ObjectID
+        created_at: str
+        updated_at: str
+        score: int
+        user_id: ObjectID
+
+    def __init__(
+        self, *, connector: Connector, data: BeatmapsetDiscussionVotePayload
+    ) -> None:
+        self._connector = connector
+        self._update_data(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BeatmapsetDiscussionVote id={self.id}"
+            f" discussion_id={self.beatmapset_discussion_id}"
+            f" user_id={self.user_id} score={self.score}>"
+        )
+
+    def __eq__(self, o: Any) -> bool:
+        return isinstance(o, type(self)) and o.id == self.id
+
+    def __hash__(self) -> int:
+        return self.id
+
+    @property
+    def user(self) -> Optional[User]:
+        return self._connector.users.get(self.user_id)
+
+    def _update_data(self, data: BeatmapsetDiscussionVotePayload) -> None:
+        self.id = data["id"]
+        self.beatmapset_discussion_id = data["beatmapset_discussion_id"]
+        self.created_at = data["created_at"]
+        self.updated_at = data.get("updated_at")
+        self.score = data["score"]
+        self.user_id = data["user_id"]
+
+    def to_payload(self) -> BeatmapsetDiscussionVotePayload:
+        return {
+            "id": self.id,
+            "beatmapset_discussion_id": self.beatmapset_discussion_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "score": self.score,
+            "user_id": self.user_id,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: BeatmapsetDiscussionVotePayload, *, connector: Connector
+    ) -> BeatmapsetDiscussionVote:
+        return cls(connector=connector, data=data)
+
+
+class BeatmapsetDiscussion:
+    __slots__ = (
+        "_connector",
+        "id",
+        "beatmap_id",
+        "beatmapset_id",
+        "can_be_resolved",
+        "can_grant_kudosu",
+        "created_at",
+        "current_user_attributes",
+        "deleted_at",
+        "deleted_by_id",
+        "kudosu_denied",
+        "last_post_at",
+        "message_type",
+        "parent_id",
+        "posts",
+        "resolved",
+        "starting_post",
+        "timestamp",
+        "updated_at",
+        "user_id",
+    )
+
+    if TYPE_CHECKING:
+        _connector: Connector
+        id: ObjectID
+        beatmap_id: Optional[ObjectID]
+        beatmapset_id: ObjectID
+        can_be_resolved: bool
+        can_grant_kudosu: bool
+        created_at: str
+        current_user_attributes: Optional[dict]
+        deleted_at: Optional[str]
+        deleted_by_id: Optional[ObjectID]
+        kudosu_denied: bool
+        last_post_at: str
+        message_type: str
+        parent_id: Optional[ObjectID]
+        posts: List[BeatmapsetDiscussionPost]
+        resolved: bool
+        starting_post: Optional[BeatmapsetDiscussionPost]
+        timestamp: Optional[int]
+        updated_at: str
+        user_id: ObjectID
+
+    def __init__(
+        self, *, connector: Connector, data: BeatmapsetDiscussionPayload
+    ) -> None:
+        self._connector = connector
+        self._update_data(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BeatmapsetDiscussion id={self.id}"
+            f" beatmapset_id={self.beatmapset_id} type={self.message_type}"
+            f" resolved={self.resolved}>"
+        )
+
+    def __eq__(self, o: Any) -> bool:
+        return isinstance(o, type(self)) and o.id == self.id
+
+    def __hash__(self) -> int:
+        return self.id
+
+    @property
+    def user(self) -> Optional[User]:
+        return self._connector.users.get(self.user_id)
+
+    @property
+    def beatmap(self) -> Optional[Beatmap]:
+        return self._connector.beatmaps.get(self.beatmap_id)
+
+    @property
+    def beatmapset(self) -> Optional[Beatmapset]:
+        return self._connector.beatmapsets.get(self.beatmapset_id)
+
+    def _update_data(self, data: BeatmapsetDiscussionPayload) -> None:
+        self.id = data["id"]
+        self.beatmap_id = data.get("beatmap_id")
+        self.beatmapset_id = data["beatmapset_id"]
+        self.can_be_resolved = data.get("can_be_resolved", False)
+        self.can_grant_kudosu = data.get("can_grant_kudosu", False)
+        self.created_at = data["created_at"]
+        self.current_user_attributes = data.get("current_user_attributes")
+        self.deleted_at = data.get("deleted_at")
+        self.deleted_by_id = data.get("deleted_by_id")
+        self.kudosu_denied = data.get("kudosu_denied", False)
+        self.last_post_at = data.get("last_post_at")
+        self.message_type = data["message_type"]
+        self.parent_id = data.get("parent_id")
+        self.resolved = data.get("resolved", False)
+        self.timestamp = data.get("timestamp")
+        self.updated_at = data.get("updated_at")
+        self.user_id = data["user_id"]
+        self.posts = [
+            BeatmapsetDiscussionPost(connector=self._connector, data=d)
+            for d in data.get("posts") or []
+        ]
+        self.starting_post = None
+
+        if data.get("starting_post"):
+            self.starting_post = BeatmapsetDiscussionPost(
+                connector=self._connector, data=data["starting_post"]
+            )
+
+        if data.get("beatmap"):
+            self._connector._add_beatmap_cache(data["beatmap"])
+
+        if data.get("beatmapset"):
+            self._connector._add_beatmapset_cache(data["beatmapset"])
+
+    def to_payload(self) -> BeatmapsetDiscussionPayload:
+        data = {
+            "id": self.id,
+            "beatmap_id": self.beatmap_id,
+            "beatmapset_id": self.beatmapset_id,
+            "can_be_resolved": self.can_be_resolved,
+            "can_grant_kudosu": self.can_grant_kudosu,
+            "created_at": self.created_at,
+            "current_user_attributes": self.current_user_attributes,
+            "deleted_at": self.deleted_at,
+            "deleted_by_id": self.deleted_by_id,
+            "kudosu_denied": self.kudosu_denied,
+            "last_post_at": self.last_post_at,
+            "message_type": self.message_type,
+            "parent_id": self.parent_id,
+            "resolved": self.resolved,
+            "timestamp": self.timestamp,
+            "updated_at": self.updated_at,
+            "user_id": self.user_id,
+        }
+
+        if self.posts:
+            data["posts"] = [post.to_payload() for post in self.posts]
+
+        if self.starting_post is not None:
+            data["starting_post"] = self.starting_post.to_payload()
+
+        return data
+
+    @classmethod
+    def from_payload(
+        cls, data: BeatmapsetDiscussionPayload, *, connector: Connector
+    ) -> BeatmapsetDiscussion:
+        return cls(connector=connector, data=data)
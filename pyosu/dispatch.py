@@ -0,0 +1,308 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import asyncio
+import logging
+import time
+
+from .enums import OverflowPolicy
+
+Handler = Callable[..., Coroutine[Any, Any, Any]]
+
+log = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A handler registered for an event. Each subscription owns a
+    bounded queue and a pool of workers, so a slow handler only
+    delays its own events.
+
+    When the queue is full the `policy` decides what happens:
+    "block" waits for room (backpressure on the publisher), "drop"
+    discards the new event and "latest" discards the oldest one.
+
+    Attributes:
+        event (:obj:`str`): Event name.
+        handler (Callable): Coroutine function receiving the event.
+        workers (:obj:`int`): Max concurrent handler calls.
+        policy (:obj:`str`): Overflow policy.
+        processed (:obj:`int`): Handled events.
+        failed (:obj:`int`): Events whose handler raised.
+        dropped (:obj:`int`): Events discarded by the policy.
+        total_latency (:obj:`float`): Seconds spent in the handler.
+        max_latency (:obj:`float`): Slowest handler call in seconds.
+    """
+
+    def __init__(
+        self,
+        event: str,
+        handler: Handler,
+        *,
+        workers: int = 1,
+        queue_size: int = 1000,
+        policy: str = OverflowPolicy.Block,
+    ) -> None:
+        if policy not in (
+            OverflowPolicy.Block,
+            OverflowPolicy.Drop,
+            OverflowPolicy.Latest,
+        ):
+            raise ValueError(f"Unknown overflow policy {policy!r}")
+
+        self.event = event
+        self.handler = handler
+        self.workers = workers
+        self.policy = policy
+        self.processed: int = 0
+        self.failed: int = 0
+        self.dropped: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+        self.queue_size = queue_size
+        # Created on first use so it binds to the running loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"<Subscription event={self.event!r} depth={self.depth}"
+            f" processed={self.processed} dropped={self.dropped}>"
+        )
+
+    @property
+    def depth(self) -> int:
+        """:obj:`int`: Events waiting in the queue."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def avg_latency(self) -> float:
+        """:obj:`float`: Average handler time in seconds."""
+        done = self.processed + self.failed
+        return self.total_latency / done if done else 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "event": self.event,
+            "handler": getattr(self.handler, "__qualname__", "handler"),
+            "depth": self.depth,
+            "processed": self.processed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "avg_latency": self.avg_latency,
+            "max_latency": self.max_latency,
+        }
+
+    def _start(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+
+        if not self._tasks:
+            self._tasks = [
+                asyncio.ensure_future(self._work())
+                for _ in range(self.workers)
+            ]
+
+    async def put(self, args: Tuple[Any, ...]) -> None:
+        self._start()
+
+        if self.policy == OverflowPolicy.Block:
+            await self._queue.put(args)
+            return
+
+        if self._queue.full():
+            self.dropped += 1
+
+            if self.policy == OverflowPolicy.Drop:
+                return
+
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+        self._queue.put_nowait(args)
+
+    async def _work(self) -> None:
+        while True:
+            args = await self._queue.get()
+            start = time.perf_counter()
+
+            try:
+                await self.handler(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failed += 1
+                log.exception("Handler for %r raised", self.event)
+            else:
+                self.processed += 1
+            finally:
+                elapsed = time.perf_counter() - start
+                self.total_latency += elapsed
+                self.max_latency = max(self.max_latency, elapsed)
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Waits until every queued event was handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+class EventBus:
+    """Asynchronous event dispatcher. Handlers are registered per
+    event (see `pyosu.EventType`) and run in their own bounded worker
+    pool, see `pyosu.Subscription`.
+
+    Args:
+        queue_size (:obj:`int`, optional): Default queue size of new
+            subscriptions. Defaults to 1000.
+        policy (:obj:`str`, optional): Default overflow policy of new
+            subscriptions. Defaults to "block".
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = 1000,
+        policy: str = OverflowPolicy.Block,
+    ) -> None:
+        self.queue_size = queue_size
+        self.policy = policy
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+
+    def subscribe(
+        self,
+        event: str,
+        handler: Handler,
+        *,
+        workers: int = 1,
+        queue_size: Optional[int] = None,
+        policy: Optional[str] = None,
+    ) -> Subscription:
+        """Registers a coroutine function for an event.
+
+        Args:
+            event (:obj:`str`): Event name.
+            handler (Callable): Coroutine function receiving the event.
+            workers (:obj:`int`, optional): Max concurrent calls of the
+                handler. Defaults to 1.
+            queue_size (:obj:`int`, optional): Max queued events, 0 for
+                unbounded. Defaults to the bus queue size.
+            policy (:obj:`str`, optional): "block", "drop" or "latest".
+                Defaults to the bus policy.
+
+        Returns:
+            pyosu.Subscription: Handle to unsubscribe or read metrics.
+        """
+        subscription = Subscription(
+            event,
+            handler,
+            workers=workers,
+            queue_size=(
+                queue_size if queue_size is not None else self.queue_size
+            ),
+            policy=policy if policy is not None else self.policy,
+        )
+        self._subscriptions.setdefault(event, []).append(subscription)
+        return subscription
+
+    def on(self, event: str, **options: Any) -> Callable[[Handler], Handler]:
+        """Decorator version of `subscribe`."""
+
+        def decorator(handler: Handler) -> Handler:
+            self.subscribe(event, handler, **options)
+            return handler
+
+        return decorator
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions[subscription.event].remove(subscription)
+        await subscription.close()
+
+    def has_subscribers(self, event: str) -> bool:
+        return bool(self._subscriptions.get(event))
+
+    async def publish(self, event: str, *args: Any) -> None:
+        """Sends an event to its subscribers. Waits only when a
+        subscription uses the "block" policy and its queue is full.
+        """
+        for subscription in self._subscriptions.get(event, ()):
+            await subscription.put(args)
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Returns queue depth, counters and handler latency of every
+        subscription.
+        """
+        return [
+            subscription.metrics()
+            for subscriptions in self._subscriptions.values()
+            for subscription in subscriptions
+        ]
+
+    async def join(self) -> None:
+        """Waits until every queued event was handled."""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in subscriptions:
+                await subscription.join()
+
+    async def close(
+        self, *, drain: bool = True, timeout: Optional[float] = 10.0
+    ) -> None:
+        """Stops every worker, handling queued events first if
+        `drain` is true.
+
+        Args:
+            drain (:obj:`bool`, optional): Wait for queued events.
+                Defaults to True.
+            timeout (:obj:`float`, optional): Max seconds to wait for
+                the queues, None to wait forever. Defaults to 10.
+        """
+        if drain:
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                log.warning(
+                    "Event queues not drained after %s seconds", timeout
+                )
+
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                await subscription.close()
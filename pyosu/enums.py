@@ -67,3 +67,23 @@ class BeatmapType(Enum):
 
     def __str__(self):
         return self.name
+
+
+class EventType:
+    Message = "message"
+    PMCreated = "pm_created"
+    Presence = "presence"
+    Silence = "silence"
+    Notification = "notification"
+    NotificationRead = "notification_read"
+    ChannelJoined = "channel_joined"
+    ChannelParted = "channel_parted"
+    ScoreSet = "score_set"
+    RecentScore = "recent_score"
+    RankChanged = "rank_changed"
+
+
+class OverflowPolicy:
+    Block = "block"
+    Drop = "drop"
+    Latest = "latest"
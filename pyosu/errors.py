@@ -0,0 +1,55 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class HTTPException(Exception):
+    """Raised when the API answers a request with an error status.
+
+    Attributes:
+        status (:obj:`int`): HTTP status code.
+        response (Any): Decoded response body.
+    """
+
+    def __init__(self, status: int, message: str, response: Any) -> None:
+        super().__init__(message, response)
+        self.status = status
+        self.response = response
+
+
+class NotFound(HTTPException):
+    """Raised when the requested resource does not exist (404)."""
+
+    def __init__(self, response: Any) -> None:
+        super().__init__(404, "Not found", response)
+
+
+class Unauthorized(HTTPException):
+    """Raised when the token is missing or lacks a scope (401, 403)."""
+
+    def __init__(self, status: int, response: Any) -> None:
+        super().__init__(status, "Unauthorized", response)
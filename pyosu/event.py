@@ -24,15 +24,49 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from datetime import datetime
+
+import re
+
+from .utils import cached_epoch, cached_timestamp
 
 if TYPE_CHECKING:
     from .types.obj import ObjectID
     from .types.event import Event as EventPayload
+    from .beatmap import Beatmap
+    from .beatmapset import Beatmapset
+    from .user import User
+
+
+_PAYLOAD_KEYS = ("id", "created_at", "type", "beatmap", "beatmapset", "user")
+_URL_ID = re.compile(r"/(?:b|s|u|beatmaps|beatmapsets|users)/(\d+)")
+
+
+def _url_id(ref: Optional[dict]) -> Optional[int]:
+    """Parses the ID out of an event reference url like "/b/123?m=0"."""
+    url = (ref or {}).get("url") or ""
+    match = _URL_ID.search(url)
+    return int(match.group(1)) if match else None
 
 
 class Event:
-    __slots__ = ("id", "created_at", "type", "beatmap", "beatmapset", "user")
+    __slots__ = (
+        "_timestamps",
+        "id",
+        "created_at",
+        "type",
+        "beatmap",
+        "beatmapset",
+        "user",
+        "beatmap_id",
+        "beatmapset_id",
+        "user_id",
+        "cached_beatmap",
+        "cached_beatmapset",
+        "cached_user",
+        "details",
+    )
 
     if TYPE_CHECKING:
         id: ObjectID
@@ -41,8 +75,16 @@ class Event:
         beatmap: Optional[dict]
         beatmapset: Optional[dict]
         user: Optional[dict]
+        beatmap_id: Optional[int]
+        beatmapset_id: Optional[int]
+        user_id: Optional[int]
+        cached_beatmap: Optional[Beatmap]
+        cached_beatmapset: Optional[Beatmapset]
+        cached_user: Optional[User]
+        details: Dict[str, Any]
 
     def __init__(self, *, data: EventPayload) -> None:
+        self._timestamps = {}
         self._update_data(data)
 
     def __repr__(self) -> str:
@@ -60,14 +102,52 @@ class Event:
     def __hash__(self) -> int:
         return self.id
 
+    @property
+    def created_at_datetime(self) -> datetime:
+        """:obj:`datetime.datetime`: Parsed `created_at`."""
+        return cached_timestamp(self, "created_at")
+
+    @property
+    def created_at_epoch(self) -> int:
+        """:obj:`int`: `created_at` as epoch seconds."""
+        return cached_epoch(self, "created_at")
+
     def _update_data(self, data: EventPayload) -> None:
         self.id = data["id"]
         self.created_at = data["created_at"]
         self.type = data["type"]
 
-        # Get those from cache
+        # References as {"title"/"username", "url"}, their objects are
+        # linked from cache by `pyosu.resolve_references`
         self.beatmap = data.get("beatmap")
         self.beatmapset = data.get("beatmapset")
         self.user = data.get("user")
+        self.beatmap_id = _url_id(self.beatmap)
+        self.beatmapset_id = _url_id(self.beatmapset)
+        self.user_id = _url_id(self.user)
+        self.cached_beatmap = None
+        self.cached_beatmapset = None
+        self.cached_user = None
 
         # Handle additional values
+        self.details = {
+            k: v for k, v in data.items() if k not in _PAYLOAD_KEYS
+        }
+
+    def to_payload(self) -> EventPayload:
+        data = {
+            "id": self.id,
+            "created_at": self.created_at,
+            "type": self.type,
+            **self.details,
+        }
+
+        for key in ("beatmap", "beatmapset", "user"):
+            if getattr(self, key) is not None:
+                data[key] = getattr(self, key)
+
+        return data
+
+    @classmethod
+    def from_payload(cls, data: EventPayload) -> Event:
+        return cls(data=data)
@@ -43,6 +43,17 @@ class ForumOption:
         self.text = data.get("text")
         self.vote_count = data.get("vote_count", 0)
 
+    def to_payload(self) -> dict:
+        return {
+            "id": self.id,
+            "text": self.text,
+            "vote_count": self.vote_count,
+        }
+
+    @classmethod
+    def from_payload(cls, data: dict) -> ForumOption:
+        return cls(data=data)
+
     @classmethod
     def create(cls, text: str, /):
         data = {"text": {"bbcode": text, "html": text}}
@@ -70,6 +81,26 @@ class ForumPoll:
         self.max_options = data.get("max_votes", 1)
         self.vote_change = data.get("allow_vote_change", False)
 
+    def to_payload(self) -> dict:
+        return {
+            "title": self.title,
+            "options": [
+                o.to_payload() if isinstance(o, ForumOption) else o
+                for o in self.options
+            ],
+            "ended_at": self.ended_at,
+            "last_vote_at": self.last_vote_at,
+            "started_at": self.started_at,
+            "hide_incomplete_results": self.hide_results,
+            "length_days": self.length_days,
+            "max_votes": self.max_options,
+            "allow_vote_change": self.vote_change,
+        }
+
+    @classmethod
+    def from_payload(cls, data: dict) -> ForumPoll:
+        return cls(data=data)
+
     @classmethod
     def create(
         cls,
@@ -112,6 +143,25 @@ class ForumPost:
         self.html = data["body"].get("html")
         self.raw = data["body"].get("raw")
 
+    def to_payload(self) -> ForumPostPayload:
+        return {
+            "id": self.id,
+            "topic_id": self.topic_id,
+            "user_id": self.user_id,
+            "created_at": self.created_at,
+            "deleted_at": self.deleted_at,
+            "edited_at": self.edited_at,
+            "edited_by_id": self.edited_by_id,
+            "forum_id": self.forum_id,
+            "body": {"html": self.html, "raw": self.raw},
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: ForumPostPayload, *, connector: Connector
+    ) -> ForumPost:
+        return cls(connector=connector, data=data)
+
     async def edit(self, body: str, /) -> ForumPost:
         data = await self._connector.http.edit_post(self.id, body)
         return ForumPost(connector=self._connector, data=data)
@@ -135,7 +185,7 @@ class ForumTopic:
         self.posts = data["posts"]
 
         self.id = data["topic"]["id"]
-        self.created_at = data["topic"]["id"]
+        self.created_at = data["topic"]["created_at"]
         self.deleted_at = data["topic"].get("deleted_at")
         self.first_post_id = data["topic"]["first_post_id"]
         self.forum_id = data["topic"]["forum_id"]
@@ -147,6 +197,32 @@ class ForumTopic:
         self.updated_at = data["topic"]["updated_at"]
         self.user_id = data["topic"]["user_id"]
 
+    def to_payload(self) -> ForumNavigationPayload:
+        return {
+            "search": self._search,
+            "posts": self.posts,
+            "topic": {
+                "id": self.id,
+                "created_at": self.created_at,
+                "deleted_at": self.deleted_at,
+                "first_post_id": self.first_post_id,
+                "forum_id": self.forum_id,
+                "is_locked": self.is_locked,
+                "last_post_id": self.last_post_id,
+                "post_count": self.post_count,
+                "title": self.title,
+                "type": self.type,
+                "updated_at": self.updated_at,
+                "user_id": self.user_id,
+            },
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: ForumNavigationPayload, *, connector: Connector
+    ) -> ForumTopic:
+        return cls(connector=connector, data=data)
+
     async def edit(self, title: str, /) -> ForumTopic:
         data = await self._connector.http.edit_topic(self.id, title=title)
         return ForumTopic(connector=self._connector, data=data)
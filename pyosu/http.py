@@ -33,13 +33,16 @@ from typing import (
     Coroutine,
     TypeVar,
     List,
+    Iterable,
 )
 
 import aiohttp
 import asyncio
 import json
 
+from .errors import NotFound, Unauthorized
 from .oauth import OAuth
+from .utils import cursor_params
 
 if TYPE_CHECKING:
     from .types import (
@@ -54,7 +57,6 @@ if TYPE_CHECKING:
         kudosu,
         event,
         score,
-        beatmap,
         rankings,
         news,
         discussions,
@@ -120,17 +122,33 @@ class HTTPClient:
                 response = await res.text()
 
             if res.status == 404:
-                raise Exception("Not found", response)
+                raise NotFound(response)
 
             if res.status in [401, 403]:
-                raise Exception("Unauthorized", response)
+                raise Unauthorized(res.status, response)
 
         return response
 
     def reopen_session(self) -> None:
-        if self.__session.closed:
+        if self.__session is None or self.__session.closed:
             self.__session = aiohttp.ClientSession()
 
+    async def ws_connect(
+        self, url: str, **kwargs: Any
+    ) -> aiohttp.ClientWebSocketResponse:
+        headers: Dict[str, str] = {
+            "User-Agent": self.user_agent,
+            "Authorization": f"Bearer {self.token}",
+        }
+
+        if self.proxy is not None:
+            kwargs["proxy"] = self.proxy
+        if self.proxy_auth is not None:
+            kwargs["proxy_auth"] = self.proxy_auth
+
+        self.reopen_session()
+        return await self.__session.ws_connect(url, headers=headers, **kwargs)
+
     async def oauth_login(
         self,
         grant_type: Optional[str] = None,
@@ -161,12 +179,14 @@ class HTTPClient:
 
     def lookup_beatmap(
         self,
-        map_id: ObjectID,
+        map_id: Optional[ObjectID] = None,
         checksum: Optional[str] = None,
         filename: Optional[str] = None,
     ) -> Response[beatmap.Beatmap]:
-        params: Dict[str, Any] = {"id": map_id}
+        params: Dict[str, Any] = {}
 
+        if map_id:
+            params["id"] = map_id
         if checksum:
             params["checksum"] = checksum
         if filename:
@@ -215,8 +235,8 @@ class HTTPClient:
         )
 
     def get_beatmaps(
-        self, beatmaps: List[ObjectID]
-    ) -> Response[List[beatmap.Beatmap]]:
+        self, beatmaps: Iterable[ObjectID]
+    ) -> Response[Dict[str, List[beatmap.Beatmap]]]:
         params = "&".join([f"ids[]={str(x)}" for x in beatmaps])
         path = f"/beatmaps?{params}"
 
@@ -236,8 +256,34 @@ class HTTPClient:
             Route("GET", "/beatmapsets/{bmapset}", bmapset=beatmapset_id)
         )
 
-    def search_beatmap(self, query: str) -> Response:
-        params: Dict[str, str] = {"q": query}
+    def search_beatmap(
+        self,
+        query: Optional[str] = None,
+        mode: Optional[int] = None,
+        status: Optional[str] = None,
+        genre: Optional[int] = None,
+        language: Optional[int] = None,
+        sort: Optional[str] = None,
+        nsfw: Optional[bool] = None,
+        cursor_string: Optional[str] = None,
+    ) -> Response[beatmapset.BeatmapsetSearch]:
+        params: Dict[str, Any] = {}
+        filters = {
+            "q": query,
+            "m": mode,
+            "s": status,
+            "g": genre,
+            "l": language,
+            "sort": sort,
+            "cursor_string": cursor_string,
+        }
+
+        for key, value in filters.items():
+            if value is not None:
+                params[key] = value
+
+        if nsfw is not None:
+            params["nsfw"] = "true" if nsfw else "false"
 
         return self.request(Route("GET", "/beatmapsets/search"), params=params)
 
@@ -252,14 +298,19 @@ class HTTPClient:
         types: str = "reply",
         user_id: ObjectID = None,
         with_deleted: str = None,
+        cursor_string: str = None,
     ) -> Response[discussions.BeatmapsetDiscussionPostList]:
         params: Dict[str, Any] = {
             "limit": limit,
-            "page": page,
             "sort": sort,
             "types[]": types,
         }
 
+        if cursor_string:
+            params["cursor_string"] = cursor_string
+        else:
+            params["page"] = page
+
         if discussion_id:
             params["beatmapset_discussion_id"] = discussion_id
 
@@ -283,14 +334,21 @@ class HTTPClient:
         sort: str = "id_desc",
         user_id: ObjectID = None,
         with_deleted: str = None,
+        cursor_string: str = None,
     ) -> Response[discussions.BeatmapsetDiscussionVoteList]:
         params: Dict[str, Any] = {
             "limit": limit,
-            "page": page,
-            "score": score,
             "sort": sort,
         }
 
+        if score:
+            params["score"] = score
+
+        if cursor_string:
+            params["cursor_string"] = cursor_string
+        else:
+            params["page"] = page
+
         if discussion_id:
             params["beatmapset_discussion_id"] = discussion_id
 
@@ -313,36 +371,47 @@ class HTTPClient:
         beatmapset_id: ObjectID = None,
         beatmapset_status: str = "all",
         limit: int = 10,
-        message_types: str = None,
+        message_types: Union[str, List[str]] = None,
         only_unresolved: bool = False,
         page: int = 0,
         sort: str = "id_desc",
         user_id: ObjectID = None,
         with_deleted: str = None,
+        cursor_string: str = None,
     ) -> Response[discussions.BeatmapsetDiscussionList]:
         params: Dict[str, Any] = {
             "beatmapset_status": beatmapset_status,
             "limit": limit,
-            "only_unresolved": only_unresolved,
-            "page": page,
+            "only_unresolved": "true" if only_unresolved else "false",
             "sort": sort,
         }
 
+        if cursor_string:
+            params["cursor_string"] = cursor_string
+        else:
+            params["page"] = page
+
         if beatmap_id:
             params["beatmap_id"] = beatmap_id
 
         if beatmapset_id:
             params["beatmapset_id"] = beatmapset_id
 
-        if message_types:
-            params["message_types[]"] = message_types
-
         if user_id:
             params["user"] = user_id
 
         if with_deleted:
             params["with_deleted"] = with_deleted
 
+        if message_types:
+            if isinstance(message_types, str):
+                message_types = [message_types]
+
+            params = [
+                *params.items(),
+                *[("message_types[]", t) for t in message_types],
+            ]
+
         return self.request(
             Route("GET", "/beatmapsets/discussions"), params=params
         )
@@ -413,11 +482,11 @@ class HTTPClient:
         self,
         channel_id: ObjectID = None,
         history_since: ObjectID = None,
-        includes: str = None,
+        includes: Union[str, List[str]] = None,
         limit: int = 10,
         since: int = None,
     ) -> Response[channel.ChannelUpdate]:
-        params: Dict[str, Any] = {"limit": limit}
+        params: Dict[str, Any] = {"limit": limit, "since": since or 0}
 
         if channel_id:
             params["channel_id"] = channel_id
@@ -426,10 +495,13 @@ class HTTPClient:
             params["history_since"] = history_since
 
         if includes:
-            params["includes[]"] = includes
+            if isinstance(includes, str):
+                includes = [includes]
 
-        if since:
-            params["since"] = since
+            params = [
+                *params.items(),
+                *[("includes[]", include) for include in includes],
+            ]
 
         return self.request(Route("GET", "/chat/updates"), params=params)
 
@@ -533,7 +605,7 @@ class HTTPClient:
         self,
         commentable_type: str = None,
         commentable_id: ObjectID = None,
-        cursor: str = None,
+        cursor: Union[str, Dict[str, Any]] = None,
         parent_id: ObjectID = 0,
         sort: str = "new",
     ) -> Response[comment.CommentBundle]:
@@ -549,7 +621,7 @@ class HTTPClient:
             params["commentable_id"] = commentable_id
 
         if cursor:
-            params["cursor"] = cursor
+            params.update(cursor_params(cursor))
 
         return self.request(Route("GET", "/comments"), params=params)
 
@@ -780,9 +852,12 @@ class HTTPClient:
     ############################## Notifications
 
     def get_notifications(
-        self, max_id: str = "sint"
+        self, max_id: Optional[ObjectID] = None
     ) -> Response[notifications.NotificationList]:
-        params: Dict[str, str] = {"max_id": max_id}
+        params: Dict[str, Any] = {}
+
+        if max_id:
+            params["max_id"] = max_id
 
         return self.request(Route("GET", "/notifications"), params=params)
 
@@ -803,8 +878,8 @@ class HTTPClient:
         self,
         mode: str = "osu",
         type: str = "score",
-        country: bool = False,
-        cursor: str = None,
+        country: Optional[str] = None,
+        cursor: Union[str, Dict[str, Any]] = None,
         filter: str = "all",
         spotlight: str = None,
         variant: str = None,
@@ -812,14 +887,17 @@ class HTTPClient:
         params: Dict[str, Any] = {"mode": mode, "type": type}
 
         if type == "performance":
-            params["country"] = country
-            params["variant"] = variant
+            if country:
+                params["country"] = country
 
-        if type == "charts":
+            if variant:
+                params["variant"] = variant
+
+        if type == "charts" and spotlight:
             params["spotlight"] = spotlight
 
         if cursor:
-            params["cursor"] = cursor
+            params.update(cursor_params(cursor))
 
         if filter:
             params["filter"] = filter
@@ -908,7 +986,9 @@ class HTTPClient:
 
         return self.request(r, params=params)
 
-    def get_users(self, users: List[ObjectID]) -> Response[List[user.User]]:
+    def get_users(
+        self, users: Iterable[ObjectID]
+    ) -> Response[Dict[str, List[user.User]]]:
         params = "&".join([f"ids[]={str(x)}" for x in users])
         path = f"/users?{params}"
 
@@ -94,3 +94,19 @@ class KudosuHistory:
             self.giver = None
 
         self.details = data.get("details")
+
+    def to_payload(self) -> KudosuHistoryPayload:
+        return {
+            "id": self.id,
+            "action": self.action,
+            "amount": self.amount,
+            "model": self.model,
+            "created_at": self.created_at,
+            "post": self.post._asdict(),
+            "giver": self.giver._asdict() if self.giver else None,
+            "details": self.details,
+        }
+
+    @classmethod
+    def from_payload(cls, data: KudosuHistoryPayload) -> KudosuHistory:
+        return cls(data=data)
@@ -0,0 +1,298 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+from array import array
+from collections import namedtuple
+
+import asyncio
+import logging
+
+from .dispatch import EventBus, Subscription
+from .enums import EventType
+from .ratelimit import TokenBucket
+from .scheduler import PollScheduler
+from .score import Score
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .dispatch import Handler
+    from .types.obj import ObjectID
+
+log = logging.getLogger(__name__)
+
+# previous is the position of the user before the new score, if any
+LeaderboardChange = namedtuple(
+    "LeaderboardChange", "beatmap_id score position previous"
+)
+
+
+class _Watch:
+    __slots__ = ("beatmap_id", "mode", "interval", "scores", "users")
+
+    def __init__(self, beatmap_id: int, mode: str, interval: float) -> None:
+        self.beatmap_id = beatmap_id
+        self.mode = mode
+        self.interval = interval
+        # Score and user IDs by position, None until the first check
+        self.scores: Optional[array] = None
+        self.users: Optional[array] = None
+
+
+class LeaderboardWatcher:
+    """Watches beatmap leaderboards for new scores.
+
+    Every beatmap keeps a compact snapshot with the score IDs of its
+    leaderboard by position. Each check diffs the new leaderboard
+    against it and only new scores are turned into
+    `pyosu.Score` objects and published as `score_set` events with
+    a `LeaderboardChange`.
+
+    Beatmaps are checked from a heap ordered by due time. A beatmap
+    that changed is checked twice as often, one that did not is
+    checked `backoff` times less often, within `min_interval` and
+    `max_interval`. All requests share a global `budget`.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        bus (:obj:`pyosu.EventBus`, optional): Bus receiving the events.
+            Defaults to a new bus.
+        budget (:obj:`pyosu.TokenBucket`, optional): Request budget,
+            can be shared with other watchers. Defaults to one request
+            per second with bursts of 5.
+        concurrency (:obj:`int`, optional): Max requests in flight.
+            Defaults to 4.
+        positions (:obj:`int`, optional): Only report scores entering
+            this many top positions, e.g. 1 for new #1s.
+            Defaults to 50.
+        min_interval (:obj:`float`, optional): Min seconds between
+            checks of a beatmap. Defaults to 60.
+        max_interval (:obj:`float`, optional): Max seconds between
+            checks of a beatmap. Defaults to 6 hours.
+        backoff (:obj:`float`, optional): Interval multiplier when a
+            leaderboard did not change. Defaults to 1.5.
+        type (:obj:`str`, optional): Leaderboard type (global, country,
+            friend). Defaults to global.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        bus: Optional[EventBus] = None,
+        budget: Optional[TokenBucket] = None,
+        concurrency: int = 4,
+        positions: int = 50,
+        min_interval: float = 60.0,
+        max_interval: float = 21600.0,
+        backoff: float = 1.5,
+        type: Optional[str] = None,
+    ) -> None:
+        self._connector = connector
+        self.bus: EventBus = bus if bus is not None else EventBus()
+        self.budget: TokenBucket = budget or TokenBucket(1.0, 5)
+        self.positions = positions
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.type = type
+        self.checks: int = 0
+        self.changes: int = 0
+        self._watches: Dict[int, _Watch] = {}
+        self._scheduler = PollScheduler(self._poll, concurrency=concurrency)
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<LeaderboardWatcher beatmaps={len(self._watches)}"
+            f" checks={self.checks} changes={self.changes}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def __contains__(self, beatmap_id: int) -> bool:
+        return beatmap_id in self._watches
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_handler(
+        self, event: str, handler: Handler, **options: Any
+    ) -> Subscription:
+        """Registers a coroutine function for an event in the bus.
+        Options are passed to `pyosu.EventBus.subscribe`.
+        """
+        return self.bus.subscribe(event, handler, **options)
+
+    def on(self, event: str, **options: Any) -> Callable[[Handler], Handler]:
+        """Decorator version of `add_handler`."""
+        return self.bus.on(event, **options)
+
+    def watch(
+        self,
+        beatmap_ids: Iterable[ObjectID],
+        *,
+        mode: str = "osu",
+        interval: Optional[float] = None,
+    ) -> None:
+        """Starts watching beatmaps. The first check of each beatmap
+        only stores its snapshot. Must be called with a running loop.
+
+        Args:
+            beatmap_ids (Iterable[ObjectID]): Beatmaps to watch.
+            mode (:obj:`str`, optional): Game mode. Defaults to "osu".
+            interval (:obj:`float`, optional): Initial seconds between
+                checks. Defaults to `min_interval`.
+        """
+        for beatmap_id in map(int, beatmap_ids):
+            if beatmap_id in self._watches:
+                continue
+
+            watch = _Watch(beatmap_id, mode, interval or self.min_interval)
+            self._watches[beatmap_id] = watch
+            self._scheduler.schedule(beatmap_id, 0)
+
+    def unwatch(self, beatmap_id: ObjectID) -> None:
+        """Stops watching a beatmap."""
+        self._watches.pop(int(beatmap_id), None)
+        self._scheduler.cancel(int(beatmap_id))
+
+    def snapshot(self, beatmap_id: ObjectID) -> Optional[array]:
+        """Returns the stored score IDs of a beatmap by position."""
+        watch = self._watches.get(int(beatmap_id))
+        return watch.scores if watch else None
+
+    def _diff(
+        self, watch: _Watch, scores: List[dict]
+    ) -> List[LeaderboardChange]:
+        snapshot = array("q", (int(s["id"]) for s in scores))
+        users = array("q", (int(s["user_id"]) for s in scores))
+        previous, watch.scores = watch.scores, snapshot
+        previous_users, watch.users = watch.users, users
+
+        if previous is None or previous == snapshot:
+            return []
+
+        known = set(previous)
+        positions = {user_id: i for i, user_id in enumerate(previous_users, 1)}
+        changes = []
+
+        for position, payload in enumerate(scores[: self.positions], 1):
+            if int(payload["id"]) in known:
+                continue
+
+            if payload.get("user"):
+                self._connector._add_user_cache(payload["user"])
+
+            score = Score(connector=self._connector, data=payload)
+            changes.append(
+                LeaderboardChange(
+                    watch.beatmap_id,
+                    score,
+                    position,
+                    positions.get(score.user_id),
+                )
+            )
+
+        return changes
+
+    async def check(self, beatmap_id: ObjectID) -> List[LeaderboardChange]:
+        """Fetches a watched leaderboard now and publishes its changes.
+
+        Returns:
+            List[LeaderboardChange]: New scores in the top `positions`.
+        """
+        watch = self._watches[int(beatmap_id)]
+        await self.budget.acquire()
+
+        data = await self._connector.http.get_beatmap_scores(
+            watch.beatmap_id, mode=watch.mode, type=self.type
+        )
+        changes = self._diff(watch, data.get("scores") or [])
+        self.checks += 1
+
+        if changes:
+            self.changes += len(changes)
+            watch.interval = max(self.min_interval, watch.interval / 2)
+        else:
+            watch.interval = min(
+                self.max_interval, watch.interval * self.backoff
+            )
+
+        for change in changes:
+            await self.bus.publish(EventType.ScoreSet, change)
+
+        return changes
+
+    async def _poll(self, beatmap_id: int) -> Optional[float]:
+        watch = self._watches.get(beatmap_id)
+        if watch is None:
+            return None
+
+        try:
+            await self.check(beatmap_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("Checking beatmap %s failed", beatmap_id)
+
+        return watch.interval
+
+    async def run(self) -> None:
+        """Checks due beatmaps forever."""
+        await self._scheduler.run()
+
+    def start(self) -> asyncio.Task:
+        """Starts watching in a background task."""
+        if not self.is_running:
+            self._task = asyncio.ensure_future(self.run())
+
+        return self._task
+
+    async def stop(self) -> None:
+        """Stops the background task. Snapshots and intervals are
+        kept, so the watcher can be started again.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
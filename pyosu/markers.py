@@ -0,0 +1,259 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Set, TYPE_CHECKING
+
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .types.obj import ObjectID
+
+log = logging.getLogger(__name__)
+
+
+class ReadMarkers:
+    """Coalesces read-marker updates.
+
+    Channel markers are debounced per channel: only the highest
+    message ID is sent once no new mark arrived for `delay` seconds,
+    or after `max_delay` seconds at most. Notification IDs are
+    collected and sent in a single `read_notifications` call every
+    `notification_delay` seconds.
+
+    Failed sends are queued again with the next marks and dropped
+    after `retries` failures in a row.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        delay (:obj:`float`, optional): Channel debounce in seconds.
+            Defaults to 2.
+        max_delay (:obj:`float`, optional): Max seconds a channel mark
+            is held back. Defaults to 10.
+        notification_delay (:obj:`float`, optional): Seconds between
+            notification batches. Defaults to 2.
+        retries (:obj:`int`, optional): Retries of a failed send.
+            Defaults to 3.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        delay: float = 2.0,
+        max_delay: float = 10.0,
+        notification_delay: float = 2.0,
+        retries: int = 3,
+    ) -> None:
+        self._connector = connector
+        self.delay = delay
+        self.max_delay = max_delay
+        self.notification_delay = notification_delay
+        self.retries = retries
+        self._pending: Dict[int, int] = {}
+        self._sent: Dict[int, int] = {}
+        self._deadlines: Dict[int, float] = {}
+        self._timers: Dict[int, asyncio.Task] = {}
+        self._notifications: Set[int] = set()
+        self._notification_timer: Optional[asyncio.Task] = None
+        self._failures: Dict[int, int] = {}
+        self._notification_failures: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReadMarkers channels={len(self._pending)}"
+            f" notifications={len(self._notifications)}>"
+        )
+
+    def mark_channel(self, channel_id: ObjectID, message_id: ObjectID) -> None:
+        """Marks a channel as read up to a message. Must be called with
+        a running loop.
+
+        Args:
+            channel_id (:obj:`ObjectID`): Channel ID.
+            message_id (:obj:`ObjectID`): Last read message ID.
+        """
+        channel_id, message_id = int(channel_id), int(message_id)
+
+        if message_id <= max(
+            self._pending.get(channel_id, 0), self._sent.get(channel_id, 0)
+        ):
+            return
+
+        self._queue_channel(channel_id, message_id)
+
+    def _queue_channel(self, channel_id: int, message_id: int) -> None:
+        self._pending[channel_id] = max(
+            message_id, self._pending.get(channel_id, 0)
+        )
+        loop = asyncio.get_event_loop()
+        self._deadlines[channel_id] = loop.time() + self.delay
+
+        if channel_id not in self._timers:
+            self._timers[channel_id] = asyncio.ensure_future(
+                self._debounce(channel_id)
+            )
+
+    def mark_notifications(self, notification_ids: Iterable[ObjectID]) -> None:
+        """Marks notifications as read with the next batch. Must be
+        called with a running loop.
+
+        Args:
+            notification_ids (Iterable[ObjectID]): Notification IDs.
+        """
+        self._queue_notifications(int(i) for i in notification_ids)
+
+    def _queue_notifications(self, notification_ids: Iterable[int]) -> None:
+        self._notifications.update(notification_ids)
+
+        if self._notifications and self._notification_timer is None:
+            self._notification_timer = asyncio.ensure_future(
+                self._notification_batch()
+            )
+
+    async def _debounce(self, channel_id: int) -> None:
+        loop = asyncio.get_event_loop()
+        limit = loop.time() + self.max_delay
+
+        try:
+            while True:
+                wait = min(self._deadlines[channel_id], limit) - loop.time()
+                if wait <= 0:
+                    break
+
+                await asyncio.sleep(wait)
+        finally:
+            del self._timers[channel_id]
+
+        await self._send_channel(channel_id)
+
+    async def _send_channel(self, channel_id: int) -> None:
+        message_id = self._pending.pop(channel_id, None)
+        self._deadlines.pop(channel_id, None)
+
+        if message_id is None:
+            return
+
+        try:
+            await self._connector.http.mark_channel_as_read(
+                channel_id,
+                message_id,
+                channel_id=channel_id,
+                message_id=message_id,
+            )
+        except Exception:
+            failures = self._failures.get(channel_id, 0) + 1
+            if failures > self.retries:
+                log.exception("Marking channel %s as read failed", channel_id)
+                self._failures.pop(channel_id, None)
+                return
+
+            log.warning(
+                "Marking channel %s as read failed, retrying", channel_id
+            )
+            self._failures[channel_id] = failures
+            self._queue_channel(channel_id, message_id)
+        else:
+            self._failures.pop(channel_id, None)
+            self._sent[channel_id] = max(
+                message_id, self._sent.get(channel_id, 0)
+            )
+
+    async def _notification_batch(self) -> None:
+        try:
+            await asyncio.sleep(self.notification_delay)
+        finally:
+            self._notification_timer = None
+
+        await self._send_notifications()
+
+    async def _send_notifications(self) -> None:
+        if not self._notifications:
+            return
+
+        ids = sorted(self._notifications)
+        self._notifications.clear()
+
+        try:
+            await self._connector.http.read_notifications(ids)
+        except Exception:
+            self._notification_failures += 1
+            if self._notification_failures > self.retries:
+                log.exception(
+                    "Marking %d notifications as read failed", len(ids)
+                )
+                self._notification_failures = 0
+                return
+
+            log.warning(
+                "Marking %d notifications as read failed, retrying", len(ids)
+            )
+            self._queue_notifications(ids)
+        else:
+            self._notification_failures = 0
+
+    async def _cancel_timers(self) -> None:
+        timers = list(self._timers.values())
+        if self._notification_timer is not None:
+            timers.append(self._notification_timer)
+
+        for timer in timers:
+            timer.cancel()
+
+        await asyncio.gather(*timers, return_exceptions=True)
+
+        # Timers cancelled before they started never clear themselves
+        self._timers.clear()
+        self._notification_timer = None
+
+    async def flush(self) -> None:
+        """Sends every pending marker now."""
+        await self._cancel_timers()
+        await asyncio.gather(
+            *(self._send_channel(i) for i in list(self._pending)),
+            self._send_notifications(),
+        )
+
+    async def close(self) -> None:
+        """Sends every pending marker once and drops the ones that
+        failed instead of retrying them.
+        """
+        await self.flush()
+        await self._cancel_timers()
+
+        if self._pending or self._notifications:
+            log.warning(
+                "Dropped %d channel and %d notification read markers",
+                len(self._pending),
+                len(self._notifications),
+            )
+
+        self._pending.clear()
+        self._deadlines.clear()
+        self._notifications.clear()
+        self._failures.clear()
+        self._notification_failures = 0
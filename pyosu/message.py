@@ -24,16 +24,21 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from datetime import datetime
+
+from .utils import cached_epoch, cached_timestamp
 
 if TYPE_CHECKING:
     from .connection import Connector
     from .types.user import User
+    from .types.message import ChatMessage as ChatMessagePayload
 
 
 class ChatMessage:
     def __init__(self, *, connector: Connector, data: object) -> None:
         self._connector = connector
+        self._timestamps = {}
         self._update_data(data)
 
     def __repr__(self) -> str:
@@ -46,6 +51,16 @@ class ChatMessage:
     def sender(self) -> Optional[User]:
         return self._connector.users.get(self.sender_id)
 
+    @property
+    def timestamp_datetime(self) -> datetime:
+        """:obj:`datetime.datetime`: Parsed `timestamp`."""
+        return cached_timestamp(self, "timestamp")
+
+    @property
+    def timestamp_epoch(self) -> int:
+        """:obj:`int`: `timestamp` as epoch seconds."""
+        return cached_epoch(self, "timestamp")
+
     def _update_data(self, data: object) -> None:
         self.id = int(data["message_id"])
         self.sender_id = int(data["sender_id"])
@@ -53,3 +68,19 @@ class ChatMessage:
         self.timestamp = data["timestamp"]
         self.content = data["content"]
         self.is_action = data["is_action"]
+
+    def to_payload(self) -> ChatMessagePayload:
+        return {
+            "message_id": self.id,
+            "sender_id": self.sender_id,
+            "channel_id": self.channel_id,
+            "timestamp": self.timestamp,
+            "content": self.content,
+            "is_action": self.is_action,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: ChatMessagePayload, *, connector: Connector
+    ) -> ChatMessage:
+        return cls(connector=connector, data=data)
@@ -27,6 +27,7 @@ from __future__ import annotations
 from typing import Any, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .connection import Connector
     from .types.news import NewsPostList as NewsPostListPayload
 
 
@@ -38,10 +39,27 @@ class NewsPostList:
         self._update_data(data)
 
     def _update_data(self, data: NewsPostListPayload) -> None:
-        self.cursor: data["cursor"]
-        self.news_posts: data["news_posts"]
-        self.current_year: data["current_year"]
-        self.year_news_posts: data["year_news_posts"]
-        self.year_listing: data["year_listing"]
-        self.search_limit: data["search_limit"]
-        self.search_sort: data["search_sort"]
+        self.cursor = data["cursor"]
+        self.news_posts = data["news_posts"]
+        self.current_year = data["current_year"]
+        self.year_news_posts = data["year_news_posts"]
+        self.year_listing = data["year_listing"]
+        self.search_limit = data["search_limit"]
+        self.search_sort = data["search_sort"]
+
+    def to_payload(self) -> NewsPostListPayload:
+        return {
+            "cursor": self.cursor,
+            "news_posts": self.news_posts,
+            "current_year": self.current_year,
+            "year_news_posts": self.year_news_posts,
+            "year_listing": self.year_listing,
+            "search_limit": self.search_limit,
+            "search_sort": self.search_sort,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: NewsPostListPayload, *, connector: Connector
+    ) -> NewsPostList:
+        return cls(connector=connector, data=data)
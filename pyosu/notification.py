@@ -0,0 +1,322 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+from collections import namedtuple
+from datetime import datetime
+
+from .enums import EventType
+from .pagination import CursorPaginator
+from .utils import cached_epoch, cached_timestamp
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .dispatch import EventBus
+    from .types.obj import ObjectID
+    from .types.notifications import Notification as NotificationPayload
+    from .user import User
+
+
+NotificationChanges = namedtuple("NotificationChanges", "new read unread")
+
+
+class Notification:
+    __slots__ = (
+        "_timestamps",
+        "_connector",
+        "id",
+        "name",
+        "created_at",
+        "object_type",
+        "object_id",
+        "source_user_id",
+        "is_read",
+        "details",
+    )
+
+    if TYPE_CHECKING:
+        _connector: Connector
+        id: int
+        name: str
+        created_at: str
+        object_type: str
+        object_id: ObjectID
+        source_user_id: Optional[ObjectID]
+        is_read: bool
+        details: Optional[dict]
+
+    def __init__(
+        self, *, connector: Connector, data: NotificationPayload
+    ) -> None:
+        self._connector = connector
+        self._timestamps = {}
+        self._update_data(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Notification id={self.id} name={self.name!r}"
+            f" object_type={self.object_type} object_id={self.object_id}>"
+        )
+
+    def __eq__(self, o: Any) -> bool:
+        return isinstance(o, type(self)) and o.id == self.id
+
+    def __hash__(self) -> int:
+        return self.id
+
+    @property
+    def source_user(self) -> Optional[User]:
+        return self._connector.users.get(self.source_user_id)
+
+    @property
+    def created_at_datetime(self) -> datetime:
+        """:obj:`datetime.datetime`: Parsed `created_at`."""
+        return cached_timestamp(self, "created_at")
+
+    @property
+    def created_at_epoch(self) -> int:
+        """:obj:`int`: `created_at` as epoch seconds."""
+        return cached_epoch(self, "created_at")
+
+    def _update_data(self, data: NotificationPayload) -> None:
+        self.id = int(data["id"])
+        self.name = data["name"]
+        self.created_at = data["created_at"]
+        self.object_type = data["object_type"]
+        self.object_id = data["object_id"]
+        self.source_user_id = data.get("source_user_id")
+        self.is_read = data.get("is_read", False)
+        self.details = data.get("details")
+
+    def to_payload(self) -> NotificationPayload:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "created_at": self.created_at,
+            "object_type": self.object_type,
+            "object_id": self.object_id,
+            "source_user_id": self.source_user_id,
+            "is_read": self.is_read,
+            "details": self.details,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: NotificationPayload, *, connector: Connector
+    ) -> Notification:
+        return cls(connector=connector, data=data)
+
+    def mark_as_read(self) -> None:
+        """Marks the notification as read with the next batch of
+        `pyosu.ReadMarkers`.
+        """
+        self.is_read = True
+        self._connector.read_markers.mark_notifications((self.id,))
+
+
+def iter_notifications(
+    connector: Connector,
+    *,
+    max_id: Optional[ObjectID] = None,
+    limit: Optional[int] = None,
+) -> CursorPaginator[Notification]:
+    """Iterates notifications from newest to oldest, paging backward
+    with `max_id` until `has_more` is false.
+    """
+
+    async def fetch(
+        cursor: Optional[int],
+    ) -> Tuple[List[Notification], Optional[int]]:
+        data = await connector.http.get_notifications(max_id=cursor)
+        page = [
+            Notification(connector=connector, data=n)
+            for n in data.get("notifications") or []
+        ]
+        page.sort(key=lambda n: n.id, reverse=True)
+
+        if not page or not data.get("has_more"):
+            return page, None
+
+        return page, page[-1].id - 1
+
+    return CursorPaginator(fetch, cursor=max_id, limit=limit)
+
+
+class NotificationInbox:
+    """Local notification state keyed by ID.
+
+    `sync` pages notifications from the newest until it reaches an
+    already known one, so repeated polls only process new
+    notifications and read state changes. Notifications pushed by
+    `pyosu.NotificationSocket` can be fed with `attach`.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+    """
+
+    def __init__(self, connector: Connector) -> None:
+        self._connector = connector
+        self.notifications: Dict[int, Notification] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"<NotificationInbox notifications={len(self.notifications)}"
+            f" unread={len(self.unread)}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self.notifications)
+
+    def __contains__(self, notification_id: int) -> bool:
+        return notification_id in self.notifications
+
+    @property
+    def unread(self) -> List[Notification]:
+        """List[pyosu.Notification]: Unread notifications, newest first."""
+        return sorted(
+            (n for n in self.notifications.values() if not n.is_read),
+            key=lambda n: n.id,
+            reverse=True,
+        )
+
+    def add(
+        self, notifications: Iterable[Notification]
+    ) -> NotificationChanges:
+        """Merges notifications into the cache.
+
+        Returns:
+            NotificationChanges: New notifications and the ones whose
+                read state changed.
+        """
+        changes = NotificationChanges([], [], [])
+
+        for notification in notifications:
+            cached = self.notifications.get(notification.id)
+
+            if cached is None:
+                self.notifications[notification.id] = notification
+                changes.new.append(notification)
+            elif cached.is_read != notification.is_read:
+                cached.is_read = notification.is_read
+                (changes.read if cached.is_read else changes.unread).append(
+                    cached
+                )
+
+        return changes
+
+    def mark_read(self, notification_ids: Iterable[int]) -> List[Notification]:
+        """Marks cached notifications as read locally.
+
+        Returns:
+            List[pyosu.Notification]: Notifications that were unread.
+        """
+        changed = []
+
+        for notification_id in notification_ids:
+            notification = self.notifications.get(int(notification_id))
+            if notification is not None and not notification.is_read:
+                notification.is_read = True
+                changed.append(notification)
+
+        return changed
+
+    async def sync(self) -> NotificationChanges:
+        """Fetches pages of notifications until a page with a known
+        notification is reached. Read state changes are detected on
+        every fetched page.
+
+        Returns:
+            NotificationChanges: New notifications and read state
+                changes.
+        """
+        changes = NotificationChanges([], [], [])
+        max_id = None
+
+        while True:
+            data = await self._connector.http.get_notifications(max_id=max_id)
+            page = [
+                Notification(connector=self._connector, data=n)
+                for n in data.get("notifications") or []
+            ]
+            known = any(n.id in self.notifications for n in page)
+
+            for field, items in zip(changes, self.add(page)):
+                field.extend(items)
+
+            if known or not page or not data.get("has_more"):
+                return changes
+
+            max_id = min(n.id for n in page) - 1
+
+    def groups(
+        self, *, unread_only: bool = True
+    ) -> Dict[Tuple[str, ObjectID], List[Notification]]:
+        """Groups notifications by `object_type` and `object_id`,
+        newest first, so all notifications about the same object can
+        be handled at once.
+        """
+        grouped: Dict[Tuple[str, ObjectID], List[Notification]] = {}
+
+        for notification in sorted(
+            self.notifications.values(), key=lambda n: n.id, reverse=True
+        ):
+            if unread_only and notification.is_read:
+                continue
+
+            key = (notification.object_type, notification.object_id)
+            grouped.setdefault(key, []).append(notification)
+
+        return grouped
+
+    def mark_group_read(self, object_type: str, object_id: ObjectID) -> None:
+        """Marks every notification about an object as read with the
+        next batch of `pyosu.ReadMarkers`.
+        """
+        group = self.groups().get((object_type, object_id), [])
+        self.mark_read(n.id for n in group)
+        self._connector.read_markers.mark_notifications(n.id for n in group)
+
+    def attach(self, bus: EventBus) -> None:
+        """Keeps the cache updated with notifications and read events
+        published on the bus.
+        """
+
+        async def on_notification(notification: Notification) -> None:
+            self.add((notification,))
+
+        async def on_read(notification_ids: List[int]) -> None:
+            self.mark_read(notification_ids)
+
+        bus.subscribe(EventType.Notification, on_notification)
+        bus.subscribe(EventType.NotificationRead, on_read)
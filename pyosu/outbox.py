@@ -0,0 +1,305 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+from collections import deque
+
+import asyncio
+import logging
+
+from .channel import ChatChannel
+from .message import ChatMessage
+from .ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .types.obj import ObjectID
+    from .user import User
+
+log = logging.getLogger(__name__)
+
+# ("channel", channel_id), or ("user", user_id) for every PM to a user
+# so the messages to one person share a queue whatever the target was
+QueueKey = Tuple[str, int]
+
+
+class _Outgoing:
+    __slots__ = ("content", "is_action", "future")
+
+    def __init__(
+        self, content: str, is_action: bool, future: asyncio.Future
+    ) -> None:
+        self.content = content
+        self.is_action = is_action
+        self.future = future
+
+
+class MessageQueue:
+    """Outgoing chat queue. Messages are paced per channel and
+    globally with token buckets, so bursts do not hit the chat spam
+    limits.
+
+    Short messages queued for the same channel are merged into one
+    message when `merge` is enabled and the result fits in
+    `max_length`. Messages to a user are queued by user ID, whether the
+    target is the user or their PM channel, and the PM channel is only
+    created once, later messages use the new channel. Failed sends are
+    retried with exponential backoff.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        channel_rate (:obj:`float`, optional): Messages per second on a
+            channel. Defaults to 1.
+        channel_burst (:obj:`int`, optional): Burst size on a channel.
+            Defaults to 3.
+        global_rate (:obj:`float`, optional): Messages per second on all
+            channels. Defaults to 2.
+        global_burst (:obj:`int`, optional): Burst size on all channels.
+            Defaults to 10.
+        merge (:obj:`bool`, optional): Merge queued messages.
+            Defaults to True.
+        max_length (:obj:`int`, optional): Max length of a merged
+            message. Defaults to 450.
+        separator (:obj:`str`, optional): Text between merged messages.
+            Defaults to " | ".
+        retries (:obj:`int`, optional): Retries of a failed send.
+            Defaults to 3.
+        retry_delay (:obj:`float`, optional): Seconds before the first
+            retry, doubled on every attempt. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        channel_rate: float = 1.0,
+        channel_burst: int = 3,
+        global_rate: float = 2.0,
+        global_burst: int = 10,
+        merge: bool = True,
+        max_length: int = 450,
+        separator: str = " | ",
+        retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self._connector = connector
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.merge = merge
+        self.max_length = max_length
+        self.separator = separator
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._global = TokenBucket(global_rate, global_burst)
+        self._buckets: Dict[QueueKey, TokenBucket] = {}
+        self._pending: Dict[QueueKey, Deque[_Outgoing]] = {}
+        self._workers: Dict[QueueKey, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._pending.values())
+
+    def _key(self, target: Union[ChatChannel, User, ObjectID]) -> QueueKey:
+        if hasattr(target, "pm_channel"):
+            return "user", target.id
+
+        if isinstance(target, ChatChannel):
+            me = self._connector.user
+            partners = [
+                user_id
+                for user_id in target.users
+                if me is None or user_id != me.id
+            ]
+
+            if target.type == "PM" and partners:
+                # Share the queue of messages sent to the user directly
+                user_id = partners[0]
+                if self._connector._get_cached_pmchannel(user_id) is None:
+                    self._connector._add_pm_channel_cache(user_id, target)
+
+                return "user", user_id
+
+            channel_id = target.id
+        else:
+            channel_id = int(target)
+
+        for user_id, channel in self._connector.pm_channels.items():
+            if channel.id == channel_id:
+                return "user", user_id
+
+        return "channel", channel_id
+
+    def send(
+        self,
+        target: Union[ChatChannel, User, ObjectID],
+        content: str,
+        *,
+        is_action: bool = False,
+    ) -> asyncio.Future:
+        """Queues a message. Must be called with a running loop.
+
+        Args:
+            target (Union[pyosu.ChatChannel, pyosu.User, pyosu.ObjectID]):
+                A channel, a user to PM or a channel ID.
+            content (:obj:`str`): Message to send.
+            is_action (:obj:`bool`, optional): Send as /me action.
+                Defaults to False.
+
+        Returns:
+            asyncio.Future: Resolves to the sent pyosu.ChatMessage.
+        """
+        key = self._key(target)
+        future = asyncio.get_event_loop().create_future()
+        outgoing = _Outgoing(content, is_action, future)
+        self._pending.setdefault(key, deque()).append(outgoing)
+
+        if key not in self._workers:
+            self._workers[key] = asyncio.ensure_future(self._drain(key))
+
+        return future
+
+    def _next_batch(self, queue: Deque[_Outgoing]) -> List[_Outgoing]:
+        batch = [queue.popleft()]
+
+        if not self.merge or batch[0].is_action:
+            return batch
+
+        length = len(batch[0].content)
+        while queue and not queue[0].is_action:
+            length += len(self.separator) + len(queue[0].content)
+            if length > self.max_length:
+                break
+
+            batch.append(queue.popleft())
+
+        return batch
+
+    async def _drain(self, key: QueueKey) -> None:
+        queue = self._pending[key]
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = TokenBucket(self.channel_rate, self.channel_burst)
+            self._buckets[key] = bucket
+
+        try:
+            while queue:
+                batch = self._next_batch(queue)
+                batch = [o for o in batch if not o.future.cancelled()]
+                if not batch:
+                    continue
+
+                content = self.separator.join(o.content for o in batch)
+
+                try:
+                    await bucket.acquire()
+                    await self._global.acquire()
+                    message = await self._deliver(
+                        key, content, batch[0].is_action
+                    )
+                except Exception as e:
+                    for outgoing in batch:
+                        if not outgoing.future.done():
+                            outgoing.future.set_exception(e)
+                    continue
+
+                for outgoing in batch:
+                    if not outgoing.future.done():
+                        outgoing.future.set_result(message)
+        finally:
+            del self._workers[key]
+            if not queue:
+                del self._pending[key]
+
+    async def _deliver(
+        self, key: QueueKey, content: str, is_action: bool
+    ) -> ChatMessage:
+        http = self._connector.http
+
+        for attempt in range(self.retries + 1):
+            try:
+                kind, target_id = key
+
+                if kind == "user":
+                    channel = self._connector._get_cached_pmchannel(target_id)
+
+                    if channel is None:
+                        data = await http.create_new_pm(
+                            target_id, content, is_action=is_action
+                        )
+                        self._connector.create_pm_channel(target_id, data)
+                        return ChatMessage(
+                            connector=self._connector, data=data["message"]
+                        )
+
+                    target_id = channel.id
+
+                data = await http.send_message_to_channel(
+                    target_id, content, is_action=is_action
+                )
+                return ChatMessage(connector=self._connector, data=data)
+            except Exception:
+                if attempt >= self.retries:
+                    raise
+
+                delay = self.retry_delay * 2**attempt
+                log.warning(
+                    "Sending to %s %s failed, retrying in %.1fs",
+                    *key,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def flush(self) -> None:
+        """Waits until every queued message was sent or failed."""
+        while self._workers:
+            await asyncio.gather(
+                *self._workers.values(), return_exceptions=True
+            )
+
+    async def close(self, *, flush: bool = True) -> None:
+        """Stops the queue, sending queued messages first if `flush`
+        is true. Unsent messages are cancelled.
+        """
+        if flush:
+            await self.flush()
+
+        for task in list(self._workers.values()):
+            task.cancel()
+
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+        for queue in self._pending.values():
+            for outgoing in queue:
+                outgoing.future.cancel()
+
+        self._pending.clear()
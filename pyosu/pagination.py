@@ -0,0 +1,294 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from collections import deque
+from operator import attrgetter
+
+import asyncio
+
+T = TypeVar("T")
+
+# Receives (offset, limit) and returns a page of items
+OffsetFetcher = Callable[[int, int], Awaitable[List[T]]]
+# Receives a cursor and returns a page of items with the next cursor
+CursorFetcher = Callable[[Any], Awaitable[Tuple[List[T], Any]]]
+
+
+async def paginate_offset(
+    fetch: OffsetFetcher,
+    *,
+    page_size: int = 50,
+    prefetch: int = 2,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> AsyncIterator[T]:
+    """Iterates an offset paginated endpoint while up to `prefetch`
+    following pages are requested concurrently.
+
+    Iteration stops on the first short page or when `limit` items
+    have been yielded. Pending requests are cancelled on exit.
+
+    Args:
+        fetch (Callable): Coroutine function receiving (offset, limit).
+        page_size (:obj:`int`, optional): Items per request.
+            Defaults to 50.
+        prefetch (:obj:`int`, optional): Pages requested ahead of the
+            one being consumed. Defaults to 2.
+        limit (:obj:`int`, optional): Max number of items to yield.
+            Defaults to None (all items).
+        offset (:obj:`int`, optional): Starting offset. Defaults to 0.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be greater than 0")
+
+    end = None if limit is None else offset + limit
+    pending: Deque[Tuple[asyncio.Task, int]] = deque()
+    next_offset = offset
+
+    def schedule() -> None:
+        nonlocal next_offset
+        while len(pending) <= prefetch:
+            if end is not None and next_offset >= end:
+                return
+
+            size = page_size
+            if end is not None:
+                size = min(page_size, end - next_offset)
+
+            task = asyncio.ensure_future(fetch(next_offset, size))
+            pending.append((task, size))
+            next_offset += size
+
+    try:
+        schedule()
+
+        while pending:
+            task, size = pending.popleft()
+            page = await task
+
+            for item in page:
+                yield item
+
+            if len(page) < size:
+                return
+
+            schedule()
+    finally:
+        for task, _ in pending:
+            task.cancel()
+
+
+async def fetch_offset_pages(
+    fetch: OffsetFetcher,
+    total: int,
+    *,
+    page_size: int = 50,
+    concurrency: int = 8,
+    offset: int = 0,
+    key: Optional[Callable[[T], Hashable]] = attrgetter("id"),
+) -> List[T]:
+    """Fetches every page of an offset paginated endpoint whose total
+    size is known beforehand. All offsets are computed up front and
+    requested in parallel, with at most `concurrency` requests in flight.
+
+    Pages are reassembled in order and items repeated across pages
+    (shifted while fetching) are dropped. If the last page is full,
+    the remaining items are read with `paginate_offset`.
+
+    Args:
+        fetch (Callable): Coroutine function receiving (offset, limit).
+        total (:obj:`int`): Known number of items.
+        page_size (:obj:`int`, optional): Items per request.
+            Defaults to 50.
+        concurrency (:obj:`int`, optional): Max requests in flight.
+            Defaults to 8.
+        offset (:obj:`int`, optional): Starting offset. Defaults to 0.
+        key (Callable, optional): Returns the identity of an item,
+            None to keep duplicates. Defaults to the item `id`.
+
+    Returns:
+        List: All items in order.
+    """
+    if page_size < 1 or concurrency < 1:
+        raise ValueError("page_size and concurrency must be greater than 0")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_page(page_offset: int) -> List[T]:
+        async with semaphore:
+            return await fetch(page_offset, page_size)
+
+    offsets = range(offset, max(total, offset), page_size)
+    tasks = [asyncio.ensure_future(fetch_page(o)) for o in offsets]
+
+    try:
+        pages = list(await asyncio.gather(*tasks))
+    finally:
+        # A failed page leaves its siblings running otherwise
+        for task in tasks:
+            task.cancel()
+
+    if pages and len(pages[-1]) == page_size:
+        tail = []
+        async for item in paginate_offset(
+            fetch,
+            page_size=page_size,
+            prefetch=concurrency - 1,
+            offset=offsets[-1] + page_size,
+        ):
+            tail.append(item)
+        pages.append(tail)
+
+    items: List[T] = []
+    seen = set()
+
+    for page in pages:
+        for item in page:
+            if key is not None:
+                identity = key(item)
+                if identity in seen:
+                    continue
+                seen.add(identity)
+
+            items.append(item)
+
+    return items
+
+
+class CursorPaginator(Generic[T]):
+    """Async iterator over a cursor paginated endpoint. The next page
+    is requested as soon as the current one arrives, so the request
+    runs while the consumer handles the current items.
+
+    `cursor` always points to the page being consumed and `offset`
+    counts the items of that page already yielded. Passing both back
+    later resumes the iteration right after the last yielded item.
+    `offset` indexes the page as returned by `fetch`, items skipped as
+    duplicates included.
+
+    Args:
+        fetch (Callable): Coroutine function receiving a cursor and
+            returning a tuple with the items and the next cursor.
+        cursor (optional): Cursor to start from. Defaults to None
+            (first page).
+        offset (:obj:`int`, optional): Items of the first page to
+            skip. Defaults to 0.
+        limit (:obj:`int`, optional): Max number of items to yield.
+            Defaults to None (all items).
+        key (Callable, optional): Returns the identity of an item,
+            items already yielded by the same iteration (shifted
+            between pages) are skipped. Defaults to None (keep
+            duplicates).
+    """
+
+    def __init__(
+        self,
+        fetch: CursorFetcher,
+        *,
+        cursor: Any = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        key: Optional[Callable[[T], Hashable]] = None,
+    ) -> None:
+        self._fetch = fetch
+        self._key = key
+        self.cursor: Any = cursor
+        self.offset: int = offset
+        self.limit: Optional[int] = limit
+        self.exhausted: bool = False
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        remaining = self.limit
+        seen = set()
+        task = None
+
+        if remaining is None or remaining > 0:
+            task = asyncio.ensure_future(self._fetch(self.cursor))
+
+        try:
+            while task is not None:
+                page, next_cursor = await task
+                task = None
+
+                items = page[self.offset :]
+                fresh = []
+                for item in items:
+                    if self._key is None:
+                        fresh.append(True)
+                        continue
+
+                    identity = self._key(item)
+                    fresh.append(identity not in seen)
+                    seen.add(identity)
+
+                # A page of shifted duplicates still moves to the next one
+                count = sum(fresh)
+                if (
+                    next_cursor
+                    and page
+                    and (remaining is None or count < remaining)
+                ):
+                    task = asyncio.ensure_future(self._fetch(next_cursor))
+
+                for item, is_fresh in zip(items, fresh):
+                    if is_fresh:
+                        if remaining == 0:
+                            # The cursor stays on this page, `offset`
+                            # marks where to resume
+                            return
+
+                        if remaining is not None:
+                            remaining -= 1
+
+                    self.offset += 1
+                    if is_fresh:
+                        yield item
+
+                self.cursor, self.offset = next_cursor, 0
+
+                if remaining == 0 and next_cursor and page:
+                    return
+
+            self.exhausted = True
+        finally:
+            if task is not None:
+                task.cancel()
@@ -0,0 +1,281 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Set, TYPE_CHECKING
+
+import asyncio
+import logging
+
+from .channel import ChatChannel
+from .message import ChatMessage
+from .dispatch import EventBus, Subscription
+from .enums import EventType
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .types.channel import ChannelUpdate as ChannelUpdatePayload
+    from .types.message import UserSilence
+    from .dispatch import Handler
+
+log = logging.getLogger(__name__)
+
+
+class ChatPoller:
+    """Long running chat update engine built on `/chat/updates`.
+
+    A single request per tick returns new messages of every joined
+    channel, presence and silences. Polls are fast while there is
+    activity and back off exponentially when idle.
+
+    `since` (last message ID) and `history_since` (last silence ID)
+    are kept across errors and restarts, so polling resumes without
+    losing or repeating messages. They can be saved and passed back
+    to a new poller.
+
+    Events are published to an `pyosu.EventBus`:
+        message (:obj:`pyosu.ChatMessage`): A new chat message.
+        pm_created (:obj:`pyosu.ChatChannel`): A new PM channel.
+        presence (List[:obj:`pyosu.ChatChannel`]): Joined channels
+            changed.
+        silence (:obj:`dict`): A user was silenced.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        bus (:obj:`pyosu.EventBus`, optional): Bus receiving the events.
+            Defaults to a new bus.
+        since (:obj:`int`, optional): Last seen message ID. Defaults to
+            the newest message of the current presence.
+        history_since (:obj:`int`, optional): Last seen silence ID.
+        min_interval (:obj:`float`, optional): Seconds between polls
+            while active. Defaults to 1.
+        max_interval (:obj:`float`, optional): Max seconds between polls
+            while idle. Defaults to 30.
+        backoff (:obj:`float`, optional): Idle interval multiplier.
+            Defaults to 2.
+        limit (:obj:`int`, optional): Messages per request.
+            Defaults to 50.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        bus: Optional[EventBus] = None,
+        since: Optional[int] = None,
+        history_since: Optional[int] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        limit: int = 50,
+    ) -> None:
+        self._connector = connector
+        self.bus: EventBus = bus if bus is not None else EventBus()
+        self.since: Optional[int] = since
+        self.history_since: Optional[int] = history_since
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.limit = limit
+        self.interval: float = min_interval
+        self._channels: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_handler(
+        self, event: str, handler: Handler, **options: Any
+    ) -> Subscription:
+        """Registers a coroutine function for an event in the bus.
+        Options are passed to `pyosu.EventBus.subscribe`.
+        """
+        return self.bus.subscribe(event, handler, **options)
+
+    def on(self, event: str, **options: Any) -> Callable[[Handler], Handler]:
+        """Decorator version of `add_handler`."""
+        return self.bus.on(event, **options)
+
+    async def _initial_since(self) -> int:
+        data = await self._connector.http.get_updates(
+            includes=["presence"], since=0, limit=1
+        )
+        channels = data.get("presence") or []
+        self._channels = {int(c["channel_id"]) for c in channels}
+        return max(
+            [int(c.get("last_message_id") or 0) for c in channels],
+            default=0,
+        )
+
+    async def poll_once(self) -> int:
+        """Requests one update and dispatches its events.
+
+        Returns:
+            int: Number of new messages.
+        """
+        if self.since is None:
+            self.since = await self._initial_since()
+
+        data: ChannelUpdatePayload = await self._connector.http.get_updates(
+            history_since=self.history_since,
+            includes=["messages", "presence", "silences"],
+            limit=self.limit,
+            since=self.since,
+        )
+
+        messages = self._handle_messages(data.get("messages") or [])
+        channels = self._handle_presence(data.get("presence"))
+        created = self._handle_pm_channels(channels or [])
+        silences = self._handle_silences(data.get("silences") or [])
+
+        # Positions only advance past events that were published, so a
+        # failed publish is retried on the next poll
+        if channels is not None:
+            await self.bus.publish(EventType.Presence, channels)
+            self._channels = {channel.id for channel in channels}
+
+        for channel in created:
+            await self.bus.publish(EventType.PMCreated, channel)
+
+        for silence in silences:
+            await self.bus.publish(EventType.Silence, silence)
+            self.history_since = max(
+                int(silence["id"]), self.history_since or 0
+            )
+
+        for message in messages:
+            await self.bus.publish(EventType.Message, message)
+            self.since = message.id
+
+        return len(messages)
+
+    def _handle_messages(self, data: List[dict]) -> List[ChatMessage]:
+        messages = []
+
+        for payload in sorted(data, key=lambda m: int(m["message_id"])):
+            if int(payload["message_id"]) <= self.since:
+                continue
+
+            if payload.get("sender"):
+                self._connector._add_user_cache(payload["sender"])
+
+            messages.append(
+                ChatMessage(connector=self._connector, data=payload)
+            )
+
+        return messages
+
+    def _handle_presence(
+        self, data: Optional[List[dict]]
+    ) -> Optional[List[ChatChannel]]:
+        if data is None:
+            return None
+
+        ids = {int(c["channel_id"]) for c in data}
+        if ids == self._channels:
+            return None
+
+        return [ChatChannel(connector=self._connector, data=c) for c in data]
+
+    def _handle_pm_channels(
+        self, channels: List[ChatChannel]
+    ) -> List[ChatChannel]:
+        user = self._connector.user
+        created = []
+
+        if user is None:
+            return created
+
+        for channel in channels:
+            if channel.type != "PM":
+                continue
+
+            for user_id in channel.users:
+                if user_id == user.id:
+                    continue
+
+                if self._connector._get_cached_pmchannel(user_id) is None:
+                    created.append(channel)
+
+                self._connector._add_pm_channel_cache(user_id, channel)
+
+        return created
+
+    def _handle_silences(self, data: List[UserSilence]) -> List[UserSilence]:
+        return sorted(
+            (s for s in data if int(s["id"]) > (self.history_since or 0)),
+            key=lambda s: int(s["id"]),
+        )
+
+    async def run(self) -> None:
+        """Polls forever. Request errors are logged and retried with
+        the idle backoff.
+        """
+        while True:
+            try:
+                count = await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Chat update failed, retrying")
+                count = 0
+
+            if count >= self.limit:
+                # There might be more messages waiting
+                self.interval = self.min_interval
+                continue
+
+            if count:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(
+                    self.interval * self.backoff, self.max_interval
+                )
+
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        """Starts polling in a background task."""
+        if not self.is_running:
+            self.interval = self.min_interval
+            self._task = asyncio.ensure_future(self.run())
+
+        return self._task
+
+    async def stop(self) -> None:
+        """Stops the background task. The poller can be started again
+        and it will resume from the last seen message.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
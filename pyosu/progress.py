@@ -0,0 +1,270 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from collections import namedtuple
+
+import sqlite3
+import time
+
+from .utils import to_epoch
+
+if TYPE_CHECKING:
+    from .user import User, UserStatistics
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    user_id INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    taken_at INTEGER NOT NULL,
+    global_rank INTEGER,
+    country_rank INTEGER,
+    pp REAL NOT NULL,
+    hit_accuracy REAL NOT NULL,
+    play_count INTEGER NOT NULL,
+    play_time INTEGER NOT NULL,
+    ranked_score INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    total_hits INTEGER NOT NULL,
+    maximum_combo INTEGER NOT NULL,
+    level REAL NOT NULL,
+    PRIMARY KEY (user_id, mode, taken_at)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ranks (
+    user_id INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (user_id, mode, day)
+) WITHOUT ROWID;
+"""
+
+_FIELDS = (
+    "global_rank country_rank pp hit_accuracy play_count play_time"
+    " ranked_score total_score total_hits maximum_combo level"
+)
+
+StatisticsSample = namedtuple("StatisticsSample", "taken_at " + _FIELDS)
+
+_COLUMNS = ", ".join(StatisticsSample._fields)
+_DAY = 86400
+
+
+def _values(statistics: UserStatistics) -> Tuple[Any, ...]:
+    level = statistics.level or {}
+    return (
+        statistics.global_rank,
+        statistics.country_rank,
+        float(statistics.pp or 0),
+        float(statistics.hit_accuracy or 0),
+        statistics.play_count,
+        statistics.play_time,
+        statistics.ranked_score,
+        statistics.total_score,
+        statistics.total_hits,
+        statistics.maximum_combo,
+        level.get("current", 0) + level.get("progress", 0) / 100,
+    )
+
+
+class StatisticsRecorder:
+    """Append-only time series of user statistics per user and mode.
+
+    A sample is only stored when it differs from the last one of the
+    user in that mode. The daily ranks of `User.rank_history` are
+    stored by day, so overlapping histories are merged. Ranks are only
+    stored under the mode of the history itself.
+
+    Args:
+        path (:obj:`str`, optional): Database file.
+            Defaults to an in-memory database.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._last: Dict[Tuple[int, str], Tuple[Any, ...]] = {}
+
+    def __repr__(self) -> str:
+        count = self._db.execute("SELECT COUNT(*) FROM samples").fetchone()
+        return f"<StatisticsRecorder path={self.path!r} samples={count[0]}>"
+
+    def __enter__(self) -> StatisticsRecorder:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+    def _last_values(self, user_id: int, mode: str) -> Optional[Tuple]:
+        key = (user_id, mode)
+        if key not in self._last:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM samples"
+                " WHERE user_id = ? AND mode = ?"
+                " ORDER BY taken_at DESC LIMIT 1",
+                key,
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._last[key] = tuple(row[1:])
+
+        return self._last[key]
+
+    def record(
+        self,
+        user: User,
+        *,
+        mode: Optional[str] = None,
+        taken_at: Optional[Any] = None,
+    ) -> bool:
+        """Records the statistics and rank history of a user fetched
+        with `Client.fetch_user`.
+
+        Args:
+            user (:obj:`pyosu.User`): User with statistics.
+            mode (:obj:`str`, optional): Mode of the statistics.
+                Defaults to the rank history or default mode. A rank
+                history of another mode is not stored.
+            taken_at (Union[datetime, int, str], optional): Sample time.
+                Defaults to now.
+
+        Returns:
+            bool: Whether a new sample was stored.
+        """
+        history = user.rank_history or {}
+        mode = str(mode or history.get("mode") or user.playmode or "osu")
+        taken_at = int(time.time()) if taken_at is None else to_epoch(taken_at)
+        stored = False
+
+        with self._db:
+            if history.get("data") and history.get("mode") == mode:
+                today = taken_at // _DAY
+                days = history["data"]
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO ranks VALUES (?, ?, ?, ?)",
+                    (
+                        (user.id, mode, today - len(days) + 1 + i, rank)
+                        for i, rank in enumerate(days)
+                    ),
+                )
+
+            if user.statistics is not None:
+                values = _values(user.statistics)
+                if values != self._last_values(user.id, mode):
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO samples VALUES"
+                        f" (?, ?, ?, {', '.join('?' * len(values))})",
+                        (user.id, mode, taken_at, *values),
+                    )
+                    self._last[(user.id, mode)] = values
+                    stored = True
+
+        return stored
+
+    def record_many(
+        self, users: Iterable[User], *, mode: Optional[str] = None
+    ) -> int:
+        """Records several users at once.
+
+        Returns:
+            int: Number of new samples.
+        """
+        return sum(self.record(user, mode=mode) for user in users)
+
+    def samples(
+        self,
+        user_id: int,
+        mode: str = "osu",
+        *,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        bucket: Optional[int] = None,
+    ) -> List[StatisticsSample]:
+        """Returns the samples of a user in a time range, oldest first.
+
+        Args:
+            user_id (:obj:`int`): User ID.
+            mode (:obj:`str`, optional): Game mode. Defaults to "osu".
+            start (Union[datetime, int, str], optional): Range start.
+            end (Union[datetime, int, str], optional): Range end.
+            bucket (:obj:`int`, optional): Downsamples to the last
+                sample of every `bucket` seconds.
+
+        Returns:
+            List[pyosu.StatisticsSample]
+        """
+        where = "WHERE user_id = ? AND mode = ?"
+        params: List[Any] = [user_id, mode]
+
+        if start is not None:
+            where += " AND taken_at >= ?"
+            params.append(to_epoch(start))
+
+        if end is not None:
+            where += " AND taken_at <= ?"
+            params.append(to_epoch(end))
+
+        if bucket:
+            # SQLite takes bare columns from the row holding the MAX
+            sql = (
+                f"SELECT MAX(taken_at), {_COLUMNS.split(', ', 1)[1]}"
+                f" FROM samples {where} GROUP BY taken_at / ?"
+                " ORDER BY 1"
+            )
+            params.append(int(bucket))
+        else:
+            sql = f"SELECT {_COLUMNS} FROM samples {where} ORDER BY taken_at"
+
+        return [
+            StatisticsSample(*row) for row in self._db.execute(sql, params)
+        ]
+
+    def rank_history(
+        self,
+        user_id: int,
+        mode: str = "osu",
+        *,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> List[Tuple[int, int]]:
+        """Returns the daily global rank of a user as (epoch, rank)
+        pairs, oldest first. Days without rank are stored as 0.
+        """
+        low = 0 if start is None else to_epoch(start) // _DAY
+        high = 1 << 40 if end is None else to_epoch(end) // _DAY
+        rows = self._db.execute(
+            "SELECT day, rank FROM ranks WHERE user_id = ? AND mode = ?"
+            " AND day BETWEEN ? AND ? ORDER BY day",
+            (user_id, mode, low, high),
+        )
+        return [(day * _DAY, rank) for day, rank in rows]
@@ -27,6 +27,7 @@ from __future__ import annotations
 from typing import Any, Optional, List, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .connection import Connector
     from .types.rankings import Spotlight as SpotlightPayload
     from .types.rankings import Rankings as RankingsPayload
     from .types.obj import ObjectID
@@ -68,13 +69,32 @@ class Spotlight:
         self.mode_specific = data["mode_specific"]
         self.participant_count = data.get("participant_count")
 
+    def to_payload(self) -> SpotlightPayload:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "mode_specific": self.mode_specific,
+            "participant_count": self.participant_count,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: SpotlightPayload, *, connector: Connector
+    ) -> Spotlight:
+        return cls(connector=connector, data=data)
+
 
 class Ranking:
     __slots__ = (
         "_connector",
         "beatmapsets",
         "cursor",
-        "ranking" "spotlight" "total",
+        "ranking",
+        "spotlight",
+        "total",
     )
 
     if TYPE_CHECKING:
@@ -91,6 +111,21 @@ class Ranking:
     def _update_data(self, data: RankingsPayload) -> None:
         self.beatmapsets = data.get("beatmapsets")
         self.cursor = data.get("cursor")
-        self.ranking = data["rankings"]
+        self.ranking = data["ranking"]
         self.spotlight = data.get("spotlight")
         self.total = data["total"]
+
+    def to_payload(self) -> RankingsPayload:
+        return {
+            "beatmapsets": self.beatmapsets,
+            "cursor": self.cursor,
+            "ranking": self.ranking,
+            "spotlight": self.spotlight,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: RankingsPayload, *, connector: Connector
+    ) -> Ranking:
+        return cls(connector=connector, data=data)
@@ -0,0 +1,98 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket rate limiter. Tokens are refilled continuously at
+    `rate` per second up to `capacity`, allowing short bursts.
+
+    Args:
+        rate (:obj:`float`): Tokens added per second.
+        capacity (:obj:`float`, optional): Max stored tokens.
+            Defaults to `rate` (one second of burst).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<TokenBucket rate={self.rate} capacity={self.capacity}"
+            f" tokens={self.tokens:.2f}>"
+        )
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._updated is not None:
+            elapsed = now - self._updated
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.rate
+            )
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """:obj:`float`: Tokens currently available."""
+        if self._updated is None:
+            return self._tokens
+
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Takes tokens if available without waiting."""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+
+        return False
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Waits until tokens are available and takes them. Callers
+        are served in arrival order.
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the capacity")
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
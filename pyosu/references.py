@@ -0,0 +1,160 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Set, Union, TYPE_CHECKING
+
+import asyncio
+import logging
+
+from .errors import NotFound
+from .event import Event
+from .score import Score
+
+if TYPE_CHECKING:
+    from .connection import Connector
+
+log = logging.getLogger(__name__)
+
+Reference = Union[Score, Event]
+
+
+async def resolve_references(
+    connector: Connector,
+    items: Iterable[Reference],
+    *,
+    concurrency: int = 4,
+) -> List[Reference]:
+    """Links the beatmaps, beatmapsets and users referenced by scores
+    and events to cached objects.
+
+    Missing beatmaps and users are fetched in chunks of
+    `Connector.users_chunk_size` with `get_beatmaps` and `get_users`.
+    Beatmapsets come along with their beatmaps, only beatmapsets that
+    are referenced alone are fetched one by one. Beatmaps and
+    beatmapsets embedded in score payloads are cached when the score
+    is built, so they are not requested again. References the API
+    does not know, e.g. deleted beatmapsets, are left unlinked.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        items (Iterable[Union[pyosu.Score, pyosu.Event]]): Scores and
+            events to resolve.
+        concurrency (:obj:`int`, optional): Max requests in flight.
+            Defaults to 4.
+
+    Returns:
+        List[Union[pyosu.Score, pyosu.Event]]: The same items, linked.
+    """
+    items = list(items)
+    beatmap_ids: Set[int] = set()
+    beatmapset_ids: Set[int] = set()
+    user_ids: Set[int] = set()
+
+    for item in items:
+        beatmapset_ids.add(item.beatmapset_id)
+        user_ids.add(item.user_id)
+        beatmap_ids.add(item.beatmap_id)
+
+    beatmap_ids.discard(None)
+    beatmap_ids.difference_update(connector.beatmaps)
+    user_ids.discard(None)
+    user_ids.difference_update(connector.users)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    size = connector.users_chunk_size
+
+    async def fetch_beatmaps(chunk: List[int]) -> None:
+        async with semaphore:
+            data = await connector.http.get_beatmaps(chunk)
+
+        for payload in data["beatmaps"]:
+            beatmap = connector._add_beatmap_cache(payload, commit=False)
+            if payload.get("beatmapset"):
+                connector._add_beatmapset_cache(payload["beatmapset"])
+            beatmap_ids.discard(beatmap.id)
+
+    async def fetch_users(chunk: List[int]) -> None:
+        async with semaphore:
+            data = await connector.http.get_users(chunk)
+
+        for payload in data["users"]:
+            connector._refresh_user_cache(payload)
+
+    async def fetch_beatmapset(beatmapset_id: int) -> None:
+        try:
+            async with semaphore:
+                data = await connector.http.get_beatmapset(beatmapset_id)
+        except NotFound:
+            log.debug("Referenced beatmapset %s was not found", beatmapset_id)
+            return
+
+        connector._add_beatmapset_cache(data)
+
+    beatmaps = sorted(beatmap_ids)
+    users = sorted(user_ids)
+    await asyncio.gather(
+        *(
+            fetch_beatmaps(beatmaps[i : i + size])
+            for i in range(0, len(beatmaps), size)
+        ),
+        *(
+            fetch_users(users[i : i + size])
+            for i in range(0, len(users), size)
+        ),
+    )
+
+    if connector.beatmap_index is not None and beatmaps:
+        connector.beatmap_index.commit()
+
+    # Left after the beatmap lookups, not carried by any beatmap
+    beatmapset_ids.discard(None)
+    beatmapset_ids.difference_update(connector.beatmapsets)
+    await asyncio.gather(*map(fetch_beatmapset, sorted(beatmapset_ids)))
+
+    if beatmap_ids:
+        log.debug("%d referenced beatmaps were not found", len(beatmap_ids))
+
+    for item in items:
+        beatmap = connector.beatmaps.get(item.beatmap_id)
+        user = connector.users.get(item.user_id)
+
+        beatmapset = connector.beatmapsets.get(item.beatmapset_id)
+        if beatmapset is None and beatmap is not None:
+            beatmapset = connector.beatmapsets.get(beatmap.beatmapset_id)
+
+        if isinstance(item, Score):
+            item.beatmap = beatmap or item.beatmap
+            item.beatmapset = beatmapset or item.beatmapset
+            item.user = user or item.user
+            if item.beatmapset is not None:
+                item.beatmapset_id = item.beatmapset.id
+            continue
+
+        item.cached_beatmap = beatmap
+        item.cached_beatmapset = beatmapset
+        item.cached_user = user
+
+    return items
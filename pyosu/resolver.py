@@ -0,0 +1,247 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Tuple, TYPE_CHECKING
+
+import asyncio
+import sqlite3
+import time
+
+from .errors import NotFound
+
+if TYPE_CHECKING:
+    from .beatmap import Beatmap
+    from .connection import Connector
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checksums (
+    checksum TEXT PRIMARY KEY,
+    beatmap_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS filenames (
+    filename TEXT PRIMARY KEY,
+    beatmap_id INTEGER NOT NULL
+);
+"""
+
+# (kind, value) with kind "checksum" or "filename"
+LookupKey = Tuple[str, str]
+
+
+class BeatmapResolver:
+    """Resolves beatmaps by checksum or filename from a local index.
+
+    The checksum and filename indexes are kept in memory and persisted
+    to SQLite, beatmaps received in bulk are committed in one batch.
+    Every beatmap cached by the connector is indexed, so most lookups
+    never reach the API. Concurrent misses for the same key share one
+    `lookup_beatmap` request, and keys the API does not know are
+    remembered for `negative_ttl` seconds.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        path (:obj:`str`, optional): Database file.
+            Defaults to an in-memory database.
+        negative_ttl (:obj:`float`, optional): Seconds an unknown key
+            is not looked up again. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        path: str = ":memory:",
+        *,
+        negative_ttl: float = 3600.0,
+    ) -> None:
+        self._connector = connector
+        self.path = path
+        self.negative_ttl = negative_ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self.checksums: Dict[str, int] = dict(
+            self._db.execute("SELECT checksum, beatmap_id FROM checksums")
+        )
+        self.filenames: Dict[str, int] = dict(
+            self._db.execute("SELECT filename, beatmap_id FROM filenames")
+        )
+        self._unknown: Dict[LookupKey, float] = {}
+        self._inflight: Dict[LookupKey, asyncio.Future] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"<BeatmapResolver checksums={len(self.checksums)}"
+            f" filenames={len(self.filenames)} hits={self.hits}"
+            f" misses={self.misses}>"
+        )
+
+    def __enter__(self) -> BeatmapResolver:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commits pending index entries and closes the database."""
+        self._db.commit()
+        self._db.close()
+
+    def add(
+        self,
+        beatmap: Beatmap,
+        *,
+        filename: Optional[str] = None,
+        commit: bool = True,
+    ) -> None:
+        """Indexes a beatmap by its checksum and optionally a filename.
+
+        Args:
+            beatmap (:obj:`pyosu.Beatmap`): Beatmap to index.
+            filename (:obj:`str`, optional): Filename of the beatmap.
+            commit (:obj:`bool`, optional): Persist the entries now. Set
+                to False when adding many and call `commit` after.
+                Defaults to True.
+        """
+        added = False
+
+        if beatmap.checksum and beatmap.checksum not in self.checksums:
+            added = True
+            self.checksums[beatmap.checksum] = beatmap.id
+            self._unknown.pop(("checksum", beatmap.checksum), None)
+            self._db.execute(
+                "INSERT OR REPLACE INTO checksums VALUES (?, ?)",
+                (beatmap.checksum, beatmap.id),
+            )
+
+        if filename and filename not in self.filenames:
+            added = True
+            self.filenames[filename] = beatmap.id
+            self._unknown.pop(("filename", filename), None)
+            self._db.execute(
+                "INSERT OR REPLACE INTO filenames VALUES (?, ?)",
+                (filename, beatmap.id),
+            )
+
+        if added and commit:
+            self.commit()
+
+    def add_many(self, beatmaps: Iterable[Beatmap]) -> None:
+        """Indexes beatmaps and commits them."""
+        for beatmap in beatmaps:
+            self.add(beatmap, commit=False)
+
+        self.commit()
+
+    def commit(self) -> None:
+        """Persists index entries added since the last commit."""
+        self._db.commit()
+
+    def get(
+        self, *, checksum: Optional[str] = None, filename: Optional[str] = None
+    ) -> Optional[int]:
+        """Returns the beatmap ID of a checksum or filename from the
+        local index, without requests.
+        """
+        if checksum is not None:
+            return self.checksums.get(checksum)
+
+        return self.filenames.get(filename)
+
+    async def resolve_id(
+        self, *, checksum: Optional[str] = None, filename: Optional[str] = None
+    ) -> Optional[int]:
+        """Returns the beatmap ID of a checksum or filename, looking it
+        up when it is not indexed.
+
+        Returns:
+            Optional[int]: Beatmap ID, None when the API does not know
+                the checksum or filename.
+        """
+        if checksum is None and filename is None:
+            raise ValueError("A checksum or a filename is required")
+
+        beatmap_id = self.get(checksum=checksum, filename=filename)
+        if beatmap_id is not None:
+            self.hits += 1
+            return beatmap_id
+
+        key = ("checksum", checksum) if checksum else ("filename", filename)
+        expires = self._unknown.get(key)
+
+        if expires is not None:
+            if expires > time.monotonic():
+                self.hits += 1
+                return None
+            del self._unknown[key]
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._lookup(key))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(future)
+
+    async def _lookup(self, key: LookupKey) -> Optional[int]:
+        kind, value = key
+        self.misses += 1
+
+        try:
+            data = await self._connector.http.lookup_beatmap(
+                None, **{kind: value}
+            )
+        except NotFound:
+            self._unknown[key] = time.monotonic() + self.negative_ttl
+            return None
+
+        beatmap = self._connector._add_beatmap_cache(data)
+        self.add(beatmap, filename=value if kind == "filename" else None)
+
+        return beatmap.id
+
+    async def resolve(
+        self, *, checksum: Optional[str] = None, filename: Optional[str] = None
+    ) -> Optional[Beatmap]:
+        """Returns the beatmap of a checksum or filename. Indexed
+        beatmaps come from the connector cache when possible.
+
+        Returns:
+            Optional[pyosu.Beatmap]: The beatmap, None when the API
+                does not know the checksum or filename.
+        """
+        beatmap_id = await self.resolve_id(
+            checksum=checksum, filename=filename
+        )
+        if beatmap_id is None:
+            return None
+
+        beatmap = self._connector.beatmaps.get(beatmap_id)
+        if beatmap is None:
+            data = await self._connector.http.get_beatmap(beatmap_id)
+            beatmap = self._connector._add_beatmap_cache(data)
+
+        return beatmap
@@ -0,0 +1,144 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import asyncio
+import heapq
+import logging
+
+log = logging.getLogger(__name__)
+
+# Receives a key and returns the seconds until its next poll, or None
+# to stop polling it
+Poll = Callable[[int], Awaitable[Optional[float]]]
+
+
+class PollScheduler:
+    """Runs a poll per key when it is due. Keys are kept in a heap
+    ordered by due time, so the longest waiting key always goes first,
+    and at most `concurrency` polls run at once.
+
+    Args:
+        poll (Callable): Coroutine function receiving a key and
+            returning the delay until its next poll.
+        concurrency (:obj:`int`, optional): Max polls running at once.
+            Defaults to 4.
+    """
+
+    def __init__(self, poll: Poll, *, concurrency: int = 4) -> None:
+        self._poll = poll
+        self.concurrency = concurrency
+        self.due: Dict[int, float] = {}
+        self._heap: List[Tuple[float, int]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self.due)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.due
+
+    def schedule(self, key: int, delay: float) -> None:
+        """Sets the next poll of a key, replacing the previous one.
+        Must be called with a running loop.
+        """
+        due = asyncio.get_event_loop().time() + delay
+        self.due[key] = due
+        heapq.heappush(self._heap, (due, key))
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def cancel(self, key: int) -> None:
+        """Stops polling a key."""
+        self.due.pop(key, None)
+
+    async def _run_poll(self, key: int, slots: asyncio.Semaphore) -> None:
+        delay = None
+
+        try:
+            delay = await self._poll(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("Poll of %s failed", key)
+        finally:
+            slots.release()
+
+        if key not in self.due:
+            return
+
+        if delay is None:
+            self.cancel(key)
+        else:
+            self.schedule(key, delay)
+
+    async def run(self) -> None:
+        """Runs due polls forever."""
+        loop = asyncio.get_event_loop()
+        slots = asyncio.Semaphore(self.concurrency)
+        running = set()
+        self._wakeup = asyncio.Event()
+
+        # Polls cancelled by a previous stop were never rescheduled
+        self._heap = [(due, key) for key, due in self.due.items()]
+        heapq.heapify(self._heap)
+
+        try:
+            while True:
+                self._wakeup.clear()
+
+                if not self._heap:
+                    await self._wakeup.wait()
+                    continue
+
+                due, key = self._heap[0]
+                delay = due - loop.time()
+
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._heap)
+
+                # Skip cancelled keys and outdated heap entries
+                if self.due.get(key) != due:
+                    continue
+
+                await slots.acquire()
+                task = asyncio.ensure_future(self._run_poll(key, slots))
+                running.add(task)
+                task.add_done_callback(running.discard)
+        finally:
+            for task in running:
+                task.cancel()
+
+            await asyncio.gather(*running, return_exceptions=True)
+            self._wakeup = None
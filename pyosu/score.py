@@ -25,14 +25,23 @@ SOFTWARE.
 from __future__ import annotations
 
 from typing import Any, Optional, TYPE_CHECKING
+from datetime import datetime
+
+from .utils import cached_epoch, cached_timestamp
 
 if TYPE_CHECKING:
     from .types.score import BaseScore
+    from .types.score import Score as ScorePayload
+    from .connection import Connector
     from .types.obj import ObjectID
+    from .beatmap import Beatmap
+    from .beatmapset import Beatmapset
+    from .user import User
 
 
 class Score:
     __slots__ = (
+        "_timestamps",
         "_connector",
         "id",
         "best_id",
@@ -49,6 +58,9 @@ class Score:
         "mode",
         "mode_int",
         "replay",
+        "beatmap_id",
+        "beatmap",
+        "beatmapset_id",
         "beatmapset",
         "rank_country",
         "rank_global",
@@ -74,17 +86,20 @@ class Score:
         mode: Any
         mode_int: int
         replay: Any
-        beatmap: Any
-        beatmapset: Optional[Any]
+        beatmap_id: Optional[int]
+        beatmap: Optional[Beatmap]
+        beatmapset_id: Optional[int]
+        beatmapset: Optional[Beatmapset]
         rank_country: Optional[Any]
         rank_global: Optional[Any]
         weight: Optional[Any]
-        user: Optional[Any]
+        user: Optional[User]
         match: Optional[Any]
         position: Optional[int]
 
     def __init__(self, *, connector: Connector, data: BaseScore) -> None:
         self._connector = connector
+        self._timestamps = {}
         self._update_data(data)
 
     def __repr__(self) -> str:
@@ -97,9 +112,19 @@ class Score:
     def __hash__(self) -> int:
         return self.id
 
+    @property
+    def created_at_datetime(self) -> datetime:
+        """:obj:`datetime.datetime`: Parsed `created_at`."""
+        return cached_timestamp(self, "created_at")
+
+    @property
+    def created_at_epoch(self) -> int:
+        """:obj:`int`: `created_at` as epoch seconds."""
+        return cached_epoch(self, "created_at")
+
     def _update_data(self, data: BaseScore) -> None:
         self.id = data["id"]
-        self.best_id = data.get("base_id")
+        self.best_id = data.get("best_id")
         self.user_id = data["user_id"]
         self.accuracy = data["accuracy"]
         self.mods = data["mods"]
@@ -113,12 +138,82 @@ class Score:
         self.mode = data["mode"]
         self.mode_int = data["mode_int"]
         self.replay = data["replay"]
-        # ! Set from cache or use ID
-        # self.beatmap = beatmap
-        self.beatmapset = data.get("beatmapset")
         self.rank_country = data.get("rank_country")
         self.rank_global = data.get("rank_global")
         self.weight = data.get("weight")
-        self.user = data.get("user")
+
+        # Embedded beatmaps and beatmapsets are cached, bare IDs are
+        # linked from cache, see `pyosu.resolve_references`
+        beatmap = data.get("beatmap")
+        if beatmap and "version" in beatmap:
+            self.beatmap = self._connector._add_beatmap_cache(beatmap)
+            self.beatmap_id = self.beatmap.id
+        else:
+            self.beatmap_id = (
+                beatmap["id"] if beatmap else data.get("beatmap_id")
+            )
+            self.beatmap = self._connector.beatmaps.get(self.beatmap_id)
+
+        beatmapset = data.get("beatmapset")
+        if beatmapset and "title" in beatmapset:
+            self.beatmapset = self._connector._add_beatmapset_cache(beatmapset)
+            self.beatmapset_id = self.beatmapset.id
+        else:
+            self.beatmapset_id = (
+                beatmapset["id"] if beatmapset else data.get("beatmapset_id")
+            )
+            if self.beatmapset_id is None and self.beatmap is not None:
+                self.beatmapset_id = self.beatmap.beatmapset_id
+
+            self.beatmapset = self._connector.beatmapsets.get(
+                self.beatmapset_id
+            )
+
+        if data.get("user"):
+            self.user = self._connector._add_user_cache(data["user"])
+        else:
+            self.user = self._connector.users.get(int(self.user_id))
+
         self.match = data.get("match")
         self.position = data.get("position")  # If user score
+
+    def to_payload(self) -> ScorePayload:
+        data = {
+            "id": self.id,
+            "best_id": self.best_id,
+            "user_id": self.user_id,
+            "accuracy": self.accuracy,
+            "mods": self.mods,
+            "score": self.score,
+            "max_combo": self.max_combo,
+            "perfect": self.perfect,
+            "passed": self.passed,
+            "pp": self.pp,
+            "rank": self.rank,
+            "created_at": self.created_at,
+            "mode": self.mode,
+            "mode_int": self.mode_int,
+            "replay": self.replay,
+            "rank_country": self.rank_country,
+            "rank_global": self.rank_global,
+            "weight": self.weight,
+            "user": self.user._to_compact_user_json() if self.user else None,
+            "match": self.match,
+        }
+
+        if self.beatmap_id is not None:
+            data["beatmap_id"] = self.beatmap_id
+
+        if self.beatmapset_id is not None:
+            data["beatmapset_id"] = self.beatmapset_id
+
+        if self.position is not None:
+            data["position"] = self.position
+
+        return data
+
+    @classmethod
+    def from_payload(
+        cls, data: ScorePayload, *, connector: Connector
+    ) -> Score:
+        return cls(connector=connector, data=data)
@@ -0,0 +1,283 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+from bisect import bisect_left
+
+import re
+
+from .serialization import dumps_many, loads_many
+
+if TYPE_CHECKING:
+    from .beatmapset import Beatmapset
+    from .connection import Connector
+
+# (difficulty_rating, bpm, total_length, mode) of a child beatmap
+BeatmapStats = Tuple[float, float, int, str]
+Range = Tuple[Optional[float], Optional[float]]
+
+_TOKEN = re.compile(r"\w+")
+
+TEXT_FIELDS = (
+    "title",
+    "title_unicode",
+    "artist",
+    "artist_unicode",
+    "creator",
+    "source",
+    "tags",
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Splits text into case folded word tokens."""
+    if not text:
+        return []
+
+    return _TOKEN.findall(text.casefold())
+
+
+def _in_range(value: Optional[float], bounds: Optional[Range]) -> bool:
+    if bounds is None:
+        return True
+
+    if value is None:
+        return False
+
+    low, high = bounds
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+class BeatmapsetIndex:
+    """In-process search over beatmapsets.
+
+    Text fields are tokenized into an inverted index. Every query
+    token matches terms starting with it, found with a binary search
+    over the sorted terms. Numeric filters match beatmapsets with at
+    least one beatmap inside every range.
+
+    Beatmapsets can be added at any time, adding a known one replaces
+    it. Assigning the index to `Connector.beatmapset_index` indexes
+    every beatmapset the client caches.
+
+    Args:
+        beatmapsets (Iterable[pyosu.Beatmapset], optional): Beatmapsets
+            to index.
+    """
+
+    def __init__(self, beatmapsets: Iterable[Beatmapset] = ()) -> None:
+        self.beatmapsets: Dict[int, Beatmapset] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self._terms: Optional[List[str]] = []
+        self._tokens: Dict[int, Set[str]] = {}
+        self._stats: Dict[int, List[BeatmapStats]] = {}
+
+        for beatmapset in beatmapsets:
+            self.add(beatmapset)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BeatmapsetIndex beatmapsets={len(self.beatmapsets)}"
+            f" terms={len(self.postings)}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self.beatmapsets)
+
+    def __contains__(self, beatmapset_id: int) -> bool:
+        return beatmapset_id in self.beatmapsets
+
+    def add(self, beatmapset: Beatmapset) -> None:
+        """Indexes a beatmapset, replacing a previous version."""
+        if beatmapset.id in self.beatmapsets:
+            self.remove(beatmapset.id)
+
+        tokens = set()
+        for field in TEXT_FIELDS:
+            tokens.update(tokenize(getattr(beatmapset, field, None)))
+
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                self._terms = None
+            ids.add(beatmapset.id)
+
+        self.beatmapsets[beatmapset.id] = beatmapset
+        self._tokens[beatmapset.id] = tokens
+        self._stats[beatmapset.id] = [
+            (
+                beatmap.difficulty_rating,
+                beatmap.bpm if beatmap.bpm is not None else beatmapset.bpm,
+                beatmap.total_length,
+                beatmap.mode,
+            )
+            for beatmap in getattr(beatmapset, "beatmaps", None) or ()
+        ]
+
+    def add_many(self, beatmapsets: Iterable[Beatmapset]) -> None:
+        """Indexes beatmapsets."""
+        for beatmapset in beatmapsets:
+            self.add(beatmapset)
+
+    def remove(self, beatmapset_id: int) -> None:
+        """Removes a beatmapset from the index."""
+        self.beatmapsets.pop(beatmapset_id, None)
+        self._stats.pop(beatmapset_id, None)
+
+        for token in self._tokens.pop(beatmapset_id, ()):
+            ids = self.postings[token]
+            ids.discard(beatmapset_id)
+
+            if not ids:
+                del self.postings[token]
+                self._terms = None
+
+    def _prefixed(self, prefix: str) -> Iterator[str]:
+        # Sorted terms are rebuilt once after a batch of changes
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+
+        terms = self._terms
+        for i in range(bisect_left(terms, prefix), len(terms)):
+            term = terms[i]
+            if not term.startswith(prefix):
+                return
+            yield term
+
+    def _match(self, token: str) -> Set[int]:
+        ids: Set[int] = set()
+        for term in self._prefixed(token):
+            ids |= self.postings[term]
+        return ids
+
+    def _filter(
+        self,
+        beatmapset_id: int,
+        difficulty: Optional[Range],
+        bpm: Optional[Range],
+        length: Optional[Range],
+        mode: Optional[str],
+    ) -> bool:
+        if (difficulty, bpm, length, mode) == (None, None, None, None):
+            return True
+
+        return any(
+            _in_range(stats[0], difficulty)
+            and _in_range(stats[1], bpm)
+            and _in_range(stats[2], length)
+            and (mode is None or stats[3] == mode)
+            for stats in self._stats[beatmapset_id]
+        )
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        difficulty: Optional[Range] = None,
+        bpm: Optional[Range] = None,
+        length: Optional[Range] = None,
+        mode: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = 50,
+    ) -> List[Beatmapset]:
+        """Searches indexed beatmapsets, best matches first, then by
+        play count.
+
+        Args:
+            query (:obj:`str`, optional): Text. Every token must prefix
+                a word of the title, artist, creator, source or tags.
+            difficulty (Tuple[float, float], optional): Star rating
+                range, either bound can be None.
+            bpm (Tuple[float, float], optional): BPM range.
+            length (Tuple[int, int], optional): Length range in seconds.
+            mode (:obj:`str`, optional): Only beatmaps of this mode
+                count for the ranges.
+            status (:obj:`str`, optional): Beatmapset status.
+            limit (:obj:`int`, optional): Max results. Defaults to 50.
+
+        Returns:
+            List[pyosu.Beatmapset]: Matching beatmapsets.
+        """
+        tokens = tokenize(query)
+        exact: Dict[int, int] = {}
+
+        if tokens:
+            # Start from the rarest token to keep intersections small
+            matches = sorted((self._match(t) for t in tokens), key=len)
+            candidates = set.intersection(*matches)
+
+            for token in tokens:
+                for beatmapset_id in self.postings.get(token, ()):
+                    if beatmapset_id in candidates:
+                        exact[beatmapset_id] = exact.get(beatmapset_id, 0) + 1
+        else:
+            candidates = set(self.beatmapsets)
+
+        results = [
+            self.beatmapsets[i]
+            for i in candidates
+            if (status is None or self.beatmapsets[i].status == status)
+            and self._filter(i, difficulty, bpm, length, mode)
+        ]
+        results.sort(
+            key=lambda b: (exact.get(b.id, 0), b.play_count or 0),
+            reverse=True,
+        )
+
+        return results if limit is None else results[:limit]
+
+    def save(self, path: str, *, backend: str = "json") -> None:
+        """Writes a snapshot of the indexed beatmapsets to a file."""
+        with open(path, "wb") as f:
+            f.write(dumps_many(self.beatmapsets.values(), backend=backend))
+
+    @classmethod
+    def load(
+        cls, path: str, *, connector: Connector, backend: str = "json"
+    ) -> BeatmapsetIndex:
+        """Rebuilds an index from a snapshot written by `save`. The
+        beatmapsets and their beatmaps are added to the connector
+        cache.
+        """
+        with open(path, "rb") as f:
+            beatmapsets = loads_many(
+                f.read(), connector=connector, backend=backend
+            )
+
+        for beatmapset in beatmapsets:
+            connector.beatmapsets.setdefault(beatmapset.id, beatmapset)
+
+        return cls(beatmapsets)
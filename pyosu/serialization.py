@@ -0,0 +1,213 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+import importlib
+import json
+
+from .beatmap import Beatmap, BeatmapScores
+from .beatmapset import Beatmapset
+from .build import BuildChangelog, UpdateStream, Versions
+from .channel import ChatChannel
+from .comment import Comment
+from .discussion import (
+    BeatmapsetDiscussion,
+    BeatmapsetDiscussionPost,
+    BeatmapsetDiscussionVote,
+)
+from .event import Event
+from .forum import ForumOption, ForumPoll, ForumPost, ForumTopic
+from .kudosu import KudosuHistory
+from .message import ChatMessage
+from .news import NewsPostList
+from .notification import Notification
+from .rankings import Ranking, Spotlight
+from .score import Score
+from .user import User, UserStatistics
+from .wiki import WikiPage
+
+if TYPE_CHECKING:
+    from .connection import Connector
+
+
+# Models that do not hold a connector
+STANDALONE_MODELS = (
+    BuildChangelog,
+    UpdateStream,
+    Versions,
+    Event,
+    ForumOption,
+    ForumPoll,
+    KudosuHistory,
+)
+
+MODELS: Dict[str, type] = {
+    model.__name__: model
+    for model in (
+        Beatmap,
+        BeatmapScores,
+        Beatmapset,
+        BeatmapsetDiscussion,
+        BeatmapsetDiscussionPost,
+        BeatmapsetDiscussionVote,
+        ChatChannel,
+        ChatMessage,
+        Comment,
+        ForumPost,
+        ForumTopic,
+        NewsPostList,
+        Notification,
+        Ranking,
+        Score,
+        Spotlight,
+        User,
+        UserStatistics,
+        WikiPage,
+        *STANDALONE_MODELS,
+    )
+}
+
+BACKENDS = ("json", "orjson", "msgpack")
+
+
+def _backend_module(backend: str) -> Any:
+    # Optional backends are only imported when first used
+    try:
+        return importlib.import_module(backend)
+    except ImportError:
+        raise RuntimeError(
+            f"{backend} backend requires {backend} installed"
+        ) from None
+
+
+def _encode(obj: Any, backend: str) -> bytes:
+    if backend == "json":
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    if backend == "orjson":
+        return _backend_module("orjson").dumps(obj)
+
+    if backend == "msgpack":
+        return _backend_module("msgpack").packb(obj, use_bin_type=True)
+
+    raise ValueError(f"Unknown backend {backend!r}, expected {BACKENDS}")
+
+
+def _decode(raw: bytes, backend: str) -> Any:
+    if backend == "json":
+        return json.loads(raw)
+
+    if backend == "orjson":
+        return _backend_module("orjson").loads(raw)
+
+    if backend == "msgpack":
+        return _backend_module("msgpack").unpackb(raw, raw=False)
+
+    raise ValueError(f"Unknown backend {backend!r}, expected {BACKENDS}")
+
+
+def to_record(model: Any) -> Dict[str, Any]:
+    """Wraps a model payload with its model name so it can
+    be rebuilt later with `from_record`.
+    """
+    name = type(model).__name__
+    if name not in MODELS:
+        raise TypeError(f"{name} is not a serializable model")
+
+    return {"model": name, "payload": model.to_payload()}
+
+
+def from_record(
+    record: Dict[str, Any], *, connector: Optional[Connector] = None
+) -> Any:
+    """Rebuilds a model from a record created by `to_record`."""
+    model = MODELS[record["model"]]
+
+    if issubclass(model, STANDALONE_MODELS):
+        return model.from_payload(record["payload"])
+
+    if connector is None:
+        raise ValueError(f"{model.__name__} requires a connector")
+
+    return model.from_payload(record["payload"], connector=connector)
+
+
+def dumps(model: Any, *, backend: str = "json") -> bytes:
+    """Serializes a model into bytes.
+
+    Args:
+        model: Any pyosu model with `to_payload`.
+        backend (:obj:`str`, optional): One of "json", "orjson" or
+            "msgpack". Defaults to "json".
+
+    Returns:
+        bytes: Encoded model.
+
+    """
+    return _encode(to_record(model), backend)
+
+
+def dumps_many(models: Iterable[Any], *, backend: str = "json") -> bytes:
+    """Serializes a list of models into bytes in a single call.
+    Models can be of different types.
+    """
+    return _encode([to_record(model) for model in models], backend)
+
+
+def loads(
+    raw: bytes,
+    *,
+    connector: Optional[Connector] = None,
+    backend: str = "json",
+) -> Any:
+    """Rebuilds a model serialized with `dumps`.
+
+    Args:
+        raw (:obj:`bytes`): Encoded model.
+        connector (:obj:`pyosu.Connector`, optional): Connector for the
+            models that need one. Usually `client._connection`.
+        backend (:obj:`str`, optional): Backend used to encode the model.
+            Defaults to "json".
+
+    Returns:
+        A pyosu model.
+
+    """
+    return from_record(_decode(raw, backend), connector=connector)
+
+
+def loads_many(
+    raw: bytes,
+    *,
+    connector: Optional[Connector] = None,
+    backend: str = "json",
+) -> List[Any]:
+    """Rebuilds a list of models serialized with `dumps_many`."""
+    return [
+        from_record(record, connector=connector)
+        for record in _decode(raw, backend)
+    ]
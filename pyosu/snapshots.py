@@ -0,0 +1,435 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+from array import array
+from datetime import datetime
+
+import sqlite3
+import time
+
+from .utils import to_epoch
+
+if TYPE_CHECKING:
+    from .user import UserStatistics
+
+# rank, pp, accuracy and play count of a user in a snapshot
+Row = Tuple[int, float, float, int]
+Time = Union[datetime, int, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    taken_at INTEGER NOT NULL,
+    keyframe INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    user_ids BLOB NOT NULL,
+    ranks BLOB NOT NULL,
+    pp BLOB NOT NULL,
+    accuracy BLOB NOT NULL,
+    play_count BLOB NOT NULL,
+    removed BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_key ON snapshots (key, taken_at);
+CREATE TABLE IF NOT EXISTS user_ranks (
+    user_id INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    snapshot_id INTEGER NOT NULL,
+    rank INTEGER,
+    pp REAL,
+    PRIMARY KEY (user_id, key, snapshot_id)
+) WITHOUT ROWID;
+"""
+
+# Fixed size typecodes, so blobs read the same on every platform. pp
+# and accuracy are doubles so stored rows compare equal to new ones
+_ARRAYS = (("user_ids", "q"), ("ranks", "q"), ("pp", "d"))
+_ARRAYS += (("accuracy", "d"), ("play_count", "q"))
+
+
+def ranking_key(
+    mode: str = "osu",
+    type: str = "performance",
+    country: Optional[str] = None,
+    variant: Optional[str] = None,
+) -> str:
+    """Builds the key identifying a ranking in a `RankingHistory`,
+    e.g. "osu/performance/JP".
+    """
+    key = f"{mode}/{type}/{country or 'all'}"
+    return f"{key}/{variant}" if variant else key
+
+
+def _blob(typecode: str, values: Iterable[Any]) -> bytes:
+    return array(typecode, values).tobytes()
+
+
+def _unblob(typecode: str, raw: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(raw)
+    return values
+
+
+class RankingSnapshot:
+    """A ranking at one point in time, stored as typed arrays ordered
+    by rank.
+    """
+
+    __slots__ = (
+        "id",
+        "key",
+        "taken_at",
+        "user_ids",
+        "ranks",
+        "pp",
+        "accuracy",
+        "play_count",
+    )
+
+    def __init__(
+        self, id: int, key: str, taken_at: int, rows: Dict[int, Row]
+    ) -> None:
+        self.id = id
+        self.key = key
+        self.taken_at = taken_at
+        ordered = sorted(rows.items(), key=lambda item: item[1][0])
+        self.user_ids = array("q", (user_id for user_id, _ in ordered))
+        self.ranks = array("q", (row[0] for _, row in ordered))
+        self.pp = array("d", (row[1] for _, row in ordered))
+        self.accuracy = array("d", (row[2] for _, row in ordered))
+        self.play_count = array("q", (row[3] for _, row in ordered))
+
+    def __repr__(self) -> str:
+        return (
+            f"<RankingSnapshot id={self.id} key={self.key!r}"
+            f" taken_at={self.taken_at} size={len(self)}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def rows(self) -> Dict[int, Row]:
+        """Returns the row of every user by user ID."""
+        return {
+            user_id: (rank, pp, accuracy, play_count)
+            for user_id, rank, pp, accuracy, play_count in zip(
+                self.user_ids,
+                self.ranks,
+                self.pp,
+                self.accuracy,
+                self.play_count,
+            )
+        }
+
+
+class RankingHistory:
+    """SQLite store of ranking snapshots.
+
+    Snapshots are stored as typed arrays. Every `keyframe_interval`
+    snapshots of a ranking a full snapshot is stored, the ones in
+    between only keep the users whose row changed and the users that
+    left. The rank and pp changes of every user are also indexed, so
+    the history of a user is read without decoding snapshots.
+
+    Args:
+        path (:obj:`str`, optional): Database file.
+            Defaults to an in-memory database.
+        keyframe_interval (:obj:`int`, optional): Snapshots between full
+            snapshots. Defaults to 7.
+    """
+
+    def __init__(
+        self, path: str = ":memory:", *, keyframe_interval: int = 7
+    ) -> None:
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._last: Dict[str, RankingSnapshot] = {}
+
+    def __repr__(self) -> str:
+        count = self._db.execute("SELECT COUNT(*) FROM snapshots").fetchone()
+        return f"<RankingHistory path={self.path!r} snapshots={count[0]}>"
+
+    def __enter__(self) -> RankingHistory:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+    def _latest(self, key: str) -> Optional[RankingSnapshot]:
+        if key not in self._last:
+            row = self._db.execute(
+                "SELECT id FROM snapshots WHERE key = ?"
+                " ORDER BY taken_at DESC, id DESC LIMIT 1",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._last[key] = self.load(row[0])
+
+        return self._last[key]
+
+    def _since_keyframe(self, key: str) -> int:
+        row = self._db.execute(
+            "SELECT COUNT(*) FROM snapshots WHERE key = ? AND id > COALESCE("
+            "(SELECT MAX(id) FROM snapshots WHERE key = ? AND keyframe = 1),"
+            " 0)",
+            (key, key),
+        ).fetchone()
+        return row[0]
+
+    def add(
+        self,
+        key: str,
+        entries: Iterable[UserStatistics],
+        *,
+        taken_at: Optional[Time] = None,
+    ) -> int:
+        """Stores a snapshot of a ranking. Entries must be in ranking
+        order, their position is stored as rank.
+
+        Args:
+            key (:obj:`str`): Ranking key, see `ranking_key`.
+            entries (Iterable[pyosu.UserStatistics]): Ranking entries.
+            taken_at (Union[datetime, int, str], optional): Snapshot
+                time. Defaults to now.
+
+        Returns:
+            int: Snapshot ID.
+        """
+        rows: Dict[int, Row] = {}
+        for rank, entry in enumerate(entries, 1):
+            rows[int(entry.user_id)] = (
+                rank,
+                entry.pp or 0.0,
+                entry.hit_accuracy or 0.0,
+                entry.play_count or 0,
+            )
+
+        return self._store(key, rows, taken_at)
+
+    async def record(
+        self,
+        key: str,
+        entries: AsyncIterable[UserStatistics],
+        *,
+        taken_at: Optional[Time] = None,
+    ) -> int:
+        """Stores a snapshot straight from a rankings iterator such as
+        `Client.iter_rankings`.
+
+        Returns:
+            int: Snapshot ID.
+        """
+        return self.add(
+            key, [entry async for entry in entries], taken_at=taken_at
+        )
+
+    def _store(
+        self, key: str, rows: Dict[int, Row], taken_at: Optional[Time]
+    ) -> int:
+        taken_at = int(time.time()) if taken_at is None else to_epoch(taken_at)
+        previous = self._latest(key)
+        keyframe = (
+            previous is None
+            or self._since_keyframe(key) + 1 >= self.keyframe_interval
+        )
+
+        old = previous.rows() if previous is not None else {}
+        changed = {u: r for u, r in rows.items() if old.get(u) != r}
+        left = [u for u in old if u not in rows]
+        stored, removed = (rows, []) if keyframe else (changed, left)
+
+        with self._db:
+            snapshot_id = self._db.execute(
+                "INSERT INTO snapshots (key, taken_at, keyframe, size,"
+                " user_ids, ranks, pp, accuracy, play_count, removed)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    taken_at,
+                    int(keyframe),
+                    len(rows),
+                    _blob("q", stored),
+                    _blob("q", (r[0] for r in stored.values())),
+                    _blob("d", (r[1] for r in stored.values())),
+                    _blob("d", (r[2] for r in stored.values())),
+                    _blob("q", (r[3] for r in stored.values())),
+                    _blob("q", removed),
+                ),
+            ).lastrowid
+
+            # Users that left get a row without rank
+            self._db.executemany(
+                "INSERT INTO user_ranks (user_id, key, snapshot_id, rank, pp)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (user_id, key, snapshot_id, row[0], row[1])
+                    for user_id, row in changed.items()
+                ]
+                + [
+                    (user_id, key, snapshot_id, None, None) for user_id in left
+                ],
+            )
+
+        self._last[key] = RankingSnapshot(snapshot_id, key, taken_at, rows)
+        return snapshot_id
+
+    def snapshots(self, key: str) -> List[Tuple[int, int]]:
+        """Returns the ID and time of every snapshot of a ranking,
+        oldest first.
+        """
+        return self._db.execute(
+            "SELECT id, taken_at FROM snapshots WHERE key = ?"
+            " ORDER BY taken_at, id",
+            (key,),
+        ).fetchall()
+
+    def load(self, snapshot_id: int) -> RankingSnapshot:
+        """Decodes a snapshot from its last full snapshot and the
+        deltas after it.
+        """
+        row = self._db.execute(
+            "SELECT key, taken_at FROM snapshots WHERE id = ?", (snapshot_id,)
+        ).fetchone()
+
+        if row is None:
+            raise ValueError(f"Unknown snapshot {snapshot_id}")
+
+        key, taken_at = row
+        chain = self._db.execute(
+            "SELECT user_ids, ranks, pp, accuracy, play_count, removed"
+            " FROM snapshots WHERE key = ? AND id <= ? AND id >= ("
+            "SELECT MAX(id) FROM snapshots"
+            " WHERE key = ? AND keyframe = 1 AND id <= ?) ORDER BY id",
+            (key, snapshot_id, key, snapshot_id),
+        )
+
+        rows: Dict[int, Row] = {}
+        for raw in chain:
+            columns = [
+                _unblob(typecode, blob)
+                for (_, typecode), blob in zip(_ARRAYS, raw)
+            ]
+
+            for user_id in _unblob("q", raw[5]):
+                rows.pop(user_id, None)
+
+            for user_id, *values in zip(*columns):
+                rows[user_id] = tuple(values)
+
+        return RankingSnapshot(snapshot_id, key, taken_at, rows)
+
+    def _nearest(self, key: str, at: Time) -> Optional[int]:
+        row = self._db.execute(
+            "SELECT id FROM snapshots WHERE key = ? AND taken_at <= ?"
+            " ORDER BY taken_at DESC, id DESC LIMIT 1",
+            (key, to_epoch(at)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def user_history(
+        self, user_id: int, key: Optional[str] = None
+    ) -> List[Tuple[int, int, float]]:
+        """Returns the time, rank and pp of a user in every snapshot,
+        oldest first.
+
+        Args:
+            user_id (:obj:`int`): User ID.
+            key (:obj:`str`, optional): Only snapshots of this ranking.
+        """
+        # Latest indexed change of the user at or before each snapshot
+        sql = (
+            "SELECT s.taken_at, r.rank, r.pp FROM snapshots s"
+            " JOIN user_ranks r ON r.user_id = ? AND r.key = s.key"
+            " AND r.snapshot_id = (SELECT MAX(snapshot_id) FROM user_ranks"
+            " WHERE user_id = ? AND key = s.key AND snapshot_id <= s.id)"
+            " WHERE r.rank IS NOT NULL"
+        )
+        params: List[Any] = [user_id, user_id]
+
+        if key is not None:
+            sql += " AND s.key = ?"
+            params.append(key)
+
+        return self._db.execute(
+            sql + " ORDER BY s.taken_at, s.id", params
+        ).fetchall()
+
+    def movers(
+        self,
+        key: str,
+        start: Time,
+        end: Time,
+        *,
+        limit: int = 10,
+        ascending: bool = False,
+    ) -> List[Tuple[int, int, int]]:
+        """Returns the users that moved the most between the snapshots
+        taken at or before `start` and `end`. Users missing from either
+        snapshot are left out.
+
+        Args:
+            key (:obj:`str`): Ranking key.
+            start (Union[datetime, int, str]): First date.
+            end (Union[datetime, int, str]): Second date.
+            limit (:obj:`int`, optional): Max users. Defaults to 10.
+            ascending (:obj:`bool`, optional): True for the users that
+                dropped the most. Defaults to False (climbed).
+
+        Returns:
+            List[Tuple[int, int, int]]: User ID, old rank and new rank.
+        """
+        first, last = self._nearest(key, start), self._nearest(key, end)
+        if first is None or last is None:
+            return []
+
+        old = self.load(first).rows()
+        moves = [
+            (user_id, old[user_id][0], row[0])
+            for user_id, row in self.load(last).rows().items()
+            if user_id in old
+        ]
+        moves.sort(key=lambda move: move[1] - move[2], reverse=not ascending)
+        return moves[:limit]
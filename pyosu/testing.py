@@ -0,0 +1,177 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import asyncio
+import json
+
+from aiohttp import web, WSMsgType
+
+
+class NotificationServer:
+    """Local stand-in for the notification websocket, to test and
+    benchmark `pyosu.NotificationSocket` offline.
+
+    Frames sent by clients are kept in `received`. Frames are pushed
+    to every connected client with `send` and its helpers, and `drop`
+    closes every connection to exercise reconnection.
+
+    Args:
+        host (:obj:`str`, optional): Bind address.
+            Defaults to "127.0.0.1".
+        port (:obj:`int`, optional): Bind port. Defaults to a free port.
+        token (:obj:`str`, optional): Bearer token required from
+            clients. Defaults to accepting any client.
+
+    Example:
+        server = NotificationServer()
+        await server.start()
+        socket = NotificationSocket(connector, endpoint=server.url)
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: Optional[str] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.token = token
+        self.received: List[Dict[str, Any]] = []
+        self.connections: int = 0
+        self._sockets: Set[web.WebSocketResponse] = set()
+        self._runner: Optional[web.AppRunner] = None
+        self._changed: Optional[asyncio.Condition] = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/"
+
+    async def start(self) -> str:
+        """Starts listening.
+
+        Returns:
+            str: Websocket URL of the server.
+        """
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+
+        self._changed = asyncio.Condition()
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+        return self.url
+
+    async def close(self) -> None:
+        """Closes every connection and stops the server."""
+        await self.drop()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if self.token is not None:
+            if request.headers.get("Authorization") != f"Bearer {self.token}":
+                raise web.HTTPUnauthorized()
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        self._sockets.add(ws)
+        self.connections += 1
+        await self._notify()
+
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    self.received.append(json.loads(msg.data))
+                    await self._notify()
+        finally:
+            self._sockets.discard(ws)
+            await self._notify()
+
+        return ws
+
+    async def wait_for(
+        self, *, connections: int = 1, received: int = 0
+    ) -> None:
+        """Waits until clients connected `connections` times in total
+        and `received` frames arrived.
+        """
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self.connections >= connections
+                and len(self.received) >= received
+            )
+
+    async def send(self, event: str, data: Any = None) -> None:
+        """Sends a frame to every connected client."""
+        frame = {"event": event}
+        if data is not None:
+            frame["data"] = data
+
+        raw = json.dumps(frame)
+        await asyncio.gather(*(ws.send_str(raw) for ws in self._sockets))
+
+    async def send_notification(self, payload: Dict[str, Any]) -> None:
+        """Sends a new notification."""
+        await self.send("new", payload)
+
+    async def send_read(self, notification_ids: Iterable[int]) -> None:
+        """Sends notifications read from another session."""
+        await self.send(
+            "read",
+            {"notifications": [{"id": i} for i in notification_ids]},
+        )
+
+    async def send_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        users: Iterable[Dict[str, Any]] = (),
+    ) -> None:
+        """Sends new chat messages."""
+        await self.send(
+            "chat.message.new", {"messages": messages, "users": list(users)}
+        )
+
+    async def drop(self) -> None:
+        """Closes every connection, clients should reconnect."""
+        await asyncio.gather(
+            *(ws.close() for ws in list(self._sockets)),
+            return_exceptions=True,
+        )
@@ -0,0 +1,338 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+import asyncio
+import logging
+import time
+
+from .dispatch import EventBus, Subscription
+from .enums import EventType
+from .ratelimit import TokenBucket
+from .scheduler import PollScheduler
+from .score import Score
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .dispatch import Handler
+    from .types.obj import ObjectID
+    from .user import User
+
+log = logging.getLogger(__name__)
+
+
+class _Tracked:
+    __slots__ = ("user_id", "last_id", "interval")
+
+    def __init__(self, user_id: int, last_id: Optional[int]) -> None:
+        self.user_id = user_id
+        # Newest seen score ID, None until the first poll
+        self.last_id = last_id
+        self.interval: float = 0.0
+
+
+class ScoreTracker:
+    """Streams new recent scores of many users.
+
+    Every user keeps the ID of the newest score seen, so only newer
+    scores are published as `recent_score` events with a
+    `pyosu.Score`. The first poll of a user only stores it.
+
+    Poll intervals follow each user's activity, refreshed with batched
+    `get_users` lookups every `refresh_interval`:
+        online or just played: `online_interval`
+        visited in the last day: `active_interval`
+        visited in the last week: `idle_interval`
+        otherwise: `dormant_interval`
+
+    Users are polled from a heap ordered by due time, so users with the
+    same interval are served in turn. All requests share a global
+    `budget`.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        bus (:obj:`pyosu.EventBus`, optional): Bus receiving the events.
+            Defaults to a new bus.
+        budget (:obj:`pyosu.TokenBucket`, optional): Request budget,
+            can be shared with other watchers. Defaults to one request
+            per second with bursts of 5.
+        concurrency (:obj:`int`, optional): Max requests in flight.
+            Defaults to 4.
+        mode (:obj:`str`, optional): Game mode. Defaults to "osu".
+        include_fails (:obj:`bool`, optional): Include failed scores.
+            Defaults to False.
+        limit (:obj:`int`, optional): Recent scores per request.
+            Defaults to 20.
+        online_interval (:obj:`float`, optional): Defaults to 60.
+        active_interval (:obj:`float`, optional): Defaults to 600.
+        idle_interval (:obj:`float`, optional): Defaults to 3600.
+        dormant_interval (:obj:`float`, optional): Defaults to 6 hours.
+        refresh_interval (:obj:`float`, optional): Seconds between
+            activity refreshes. Defaults to 600.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        bus: Optional[EventBus] = None,
+        budget: Optional[TokenBucket] = None,
+        concurrency: int = 4,
+        mode: str = "osu",
+        include_fails: bool = False,
+        limit: int = 20,
+        online_interval: float = 60.0,
+        active_interval: float = 600.0,
+        idle_interval: float = 3600.0,
+        dormant_interval: float = 21600.0,
+        refresh_interval: float = 600.0,
+    ) -> None:
+        self._connector = connector
+        self.bus: EventBus = bus if bus is not None else EventBus()
+        self.budget: TokenBucket = budget or TokenBucket(1.0, 5)
+        self.mode = mode
+        self.include_fails = include_fails
+        self.limit = limit
+        self.online_interval = online_interval
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.dormant_interval = dormant_interval
+        self.refresh_interval = refresh_interval
+        self.polls: int = 0
+        self.scores: int = 0
+        self._tracked: Dict[int, _Tracked] = {}
+        self._scheduler = PollScheduler(self._poll, concurrency=concurrency)
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScoreTracker users={len(self._tracked)}"
+            f" polls={self.polls} scores={self.scores}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._tracked
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def last_ids(self) -> Dict[int, Optional[int]]:
+        """:obj:`dict`: Newest seen score ID by user, to resume with."""
+        return {t.user_id: t.last_id for t in self._tracked.values()}
+
+    def add_handler(
+        self, event: str, handler: Handler, **options: Any
+    ) -> Subscription:
+        """Registers a coroutine function for an event in the bus.
+        Options are passed to `pyosu.EventBus.subscribe`.
+        """
+        return self.bus.subscribe(event, handler, **options)
+
+    def on(self, event: str, **options: Any) -> Callable[[Handler], Handler]:
+        """Decorator version of `add_handler`."""
+        return self.bus.on(event, **options)
+
+    def track(
+        self,
+        user_ids: Iterable[ObjectID],
+        *,
+        last_ids: Optional[Dict[int, int]] = None,
+    ) -> None:
+        """Starts tracking users. Must be called with a running loop.
+
+        Args:
+            user_ids (Iterable[ObjectID]): Users to track.
+            last_ids (Dict[int, int], optional): Newest seen score ID
+                by user, e.g. from `last_ids`, to resume without
+                missing scores.
+        """
+        last_ids = last_ids or {}
+
+        for user_id in map(int, user_ids):
+            if user_id in self._tracked:
+                continue
+
+            tracked = _Tracked(user_id, last_ids.get(user_id))
+            tracked.interval = self.interval_for(
+                self._connector.users.get(user_id)
+            )
+            self._tracked[user_id] = tracked
+            self._scheduler.schedule(user_id, 0)
+
+    def untrack(self, user_id: ObjectID) -> None:
+        """Stops tracking a user."""
+        self._tracked.pop(int(user_id), None)
+        self._scheduler.cancel(int(user_id))
+
+    def interval_for(self, user: Optional[User]) -> float:
+        """Returns the poll interval matching the activity of a user."""
+        if user is None or user.is_online:
+            return self.online_interval
+
+        last_visit = user.last_visit_epoch
+        if last_visit is None:
+            return self.idle_interval
+
+        elapsed = time.time() - last_visit
+        if elapsed < 86400:
+            return self.active_interval
+        if elapsed < 604800:
+            return self.idle_interval
+
+        return self.dormant_interval
+
+    async def poll(self, user_id: ObjectID) -> List[Score]:
+        """Fetches the recent scores of a tracked user now and
+        publishes the new ones.
+
+        Returns:
+            List[pyosu.Score]: New scores, oldest first.
+        """
+        tracked = self._tracked[int(user_id)]
+        await self.budget.acquire()
+
+        data = await self._connector.http.get_user_scores(
+            tracked.user_id,
+            "recent",
+            include_fails=self.include_fails,
+            mode=self.mode,
+            limit=self.limit,
+        )
+        self.polls += 1
+
+        ids = [int(s["id"]) for s in data]
+        if tracked.last_id is None:
+            tracked.last_id = max(ids, default=0)
+            return []
+
+        new = [
+            Score(connector=self._connector, data=payload)
+            for payload in sorted(data, key=lambda s: int(s["id"]))
+            if int(payload["id"]) > tracked.last_id
+        ]
+
+        if new:
+            tracked.last_id = new[-1].id
+            tracked.interval = self.online_interval
+            self.scores += len(new)
+
+        for score in new:
+            await self.bus.publish(EventType.RecentScore, score)
+
+        return new
+
+    async def _poll(self, user_id: int) -> Optional[float]:
+        tracked = self._tracked.get(user_id)
+        if tracked is None:
+            return None
+
+        try:
+            await self.poll(user_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("Polling scores of user %s failed", user_id)
+
+        return tracked.interval
+
+    async def refresh(self) -> None:
+        """Looks up every tracked user in batches and adapts their
+        intervals. Users that became more active are polled sooner.
+        """
+        user_ids = list(self._tracked)
+        size = self._connector.users_chunk_size
+        loop = asyncio.get_event_loop()
+
+        for i in range(0, len(user_ids), size):
+            await self.budget.acquire()
+            data = await self._connector.http.get_users(user_ids[i : i + size])
+
+            for payload in data["users"]:
+                user = self._connector._refresh_user_cache(payload)
+                tracked = self._tracked.get(user.id)
+                if tracked is None:
+                    continue
+
+                interval = self.interval_for(user)
+                due = self._scheduler.due.get(user.id)
+
+                if (
+                    interval < tracked.interval
+                    and due is not None
+                    and due - loop.time() > interval
+                ):
+                    self._scheduler.schedule(user.id, interval)
+
+                tracked.interval = interval
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Refreshing tracked users failed")
+
+            await asyncio.sleep(self.refresh_interval)
+
+    async def run(self) -> None:
+        """Polls due users and refreshes their activity forever."""
+        refresher = asyncio.ensure_future(self._refresh_forever())
+
+        try:
+            await self._scheduler.run()
+        finally:
+            refresher.cancel()
+            await asyncio.gather(refresher, return_exceptions=True)
+
+    def start(self) -> asyncio.Task:
+        """Starts tracking in a background task."""
+        if not self.is_running:
+            self._task = asyncio.ensure_future(self.run())
+
+        return self._task
+
+    async def stop(self) -> None:
+        """Stops the background task. Seen score IDs are kept, so the
+        tracker can be started again.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
@@ -83,3 +83,9 @@ class Beatmapset(BeatmapsetCompact, total=False):
     submitted_date: Optional[str]
     tags: str
     has_favourited: bool
+
+
+class BeatmapsetSearch(TypedDict):
+    beatmapsets: List[Beatmapset]
+    cursor_string: Optional[str]
+    total: int
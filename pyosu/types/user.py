@@ -23,7 +23,7 @@ SOFTWARE.
 """
 
 from .obj import ObjectID
-from typing import Optional, List, TypedDict
+from typing import Dict, Optional, List, TypedDict
 
 
 class UserCompact(TypedDict):
@@ -42,6 +42,11 @@ class UserCompact(TypedDict):
     pm_friends_only: bool
 
 
+class RankHistory(TypedDict):
+    mode: str
+    data: List[int]
+
+
 class User(UserCompact, total=False):
     cover_url: str
     has_supported: bool
@@ -62,3 +67,24 @@ class User(UserCompact, total=False):
     location: Optional[str]
     interests: Optional[str]
     occupation: Optional[str]
+    statistics: "UserStatistics"
+    statistics_rulesets: Dict[str, "UserStatistics"]
+    rank_history: Optional[RankHistory]
+
+
+class UserStatistics(TypedDict, total=False):
+    grade_counts: object
+    hit_accuracy: float
+    is_ranked: bool
+    level: object
+    maximum_combo: int
+    play_count: int
+    play_time: int
+    pp: float
+    global_rank: Optional[int]
+    country_rank: Optional[int]
+    ranked_score: int
+    replays_watched_by_others: int
+    total_hits: int
+    total_score: int
+    user: UserCompact
@@ -24,7 +24,19 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Union, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Union,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+from datetime import datetime
+
+from .utils import cached_epoch, cached_timestamp
 
 from .beatmap import Beatmap, BeatmapPlaycount
 from .beatmapset import Beatmapset
@@ -33,16 +45,38 @@ from .enums import GameMode, BeatmapType
 from .kudosu import KudosuHistory
 from .event import Event
 from .message import ChatMessage
+from .pagination import paginate_offset, fetch_offset_pages
 
 if TYPE_CHECKING:
     from .types.obj import ObjectID
     from .types.user import User as UserPayload
+    from .types.user import UserStatistics as UserStatisticsPayload
+    from .types.user import RankHistory as RankHistoryPayload
     from .channel import ChatChannel
     from .connection import Connector
+    from .enums import ScoreType
+    from .pagination import OffsetFetcher
+
+
+# Profile attribute holding the number of items of each type
+_SCORE_COUNTS = {
+    "best": "scores_best_count",
+    "firsts": "scores_first_count",
+    "recent": "scores_recent_count",
+}
+_BEATMAP_COUNTS = {
+    "favourite": "favourite_beatmapset_count",
+    "graveyard": "graveyard_beatmapset_count",
+    "loved": "loved_beatmapset_count",
+    "most_played": "beatmap_playcounts_count",
+    "pending": "pending_beatmapset_count",
+    "ranked": "ranked_beatmapset_count",
+}
 
 
 class BaseUser:
     __slots__ = (
+        "_timestamps",
         "id",
         "username",
         "avatar_url",
@@ -76,6 +110,18 @@ class BaseUser:
         "location",
         "interests",
         "occupation",
+        "beatmap_playcounts_count",
+        "favourite_beatmapset_count",
+        "graveyard_beatmapset_count",
+        "loved_beatmapset_count",
+        "pending_beatmapset_count",
+        "ranked_beatmapset_count",
+        "scores_best_count",
+        "scores_first_count",
+        "scores_recent_count",
+        "statistics",
+        "statistics_rulesets",
+        "rank_history",
     )
 
     if TYPE_CHECKING:
@@ -112,9 +158,22 @@ class BaseUser:
         location: Optional[str]
         interests: Optional[str]
         occupation: Optional[str]
+        beatmap_playcounts_count: Optional[int]
+        favourite_beatmapset_count: Optional[int]
+        graveyard_beatmapset_count: Optional[int]
+        loved_beatmapset_count: Optional[int]
+        pending_beatmapset_count: Optional[int]
+        ranked_beatmapset_count: Optional[int]
+        scores_best_count: Optional[int]
+        scores_first_count: Optional[int]
+        scores_recent_count: Optional[int]
+        statistics: Optional[UserStatistics]
+        statistics_rulesets: Dict[str, UserStatistics]
+        rank_history: Optional[RankHistoryPayload]
 
     def __init__(self, *, connector: Connector, data: UserPayload) -> None:
         self._connector = connector
+        self._timestamps = {}
         self._update_data(data)
 
     def __repr__(self) -> str:
@@ -136,6 +195,26 @@ class BaseUser:
     def __hash__(self) -> int:
         return self.id
 
+    @property
+    def last_visit_datetime(self) -> Optional[datetime]:
+        """Optional[:obj:`datetime.datetime`]: Parsed `last_visit`."""
+        return cached_timestamp(self, "last_visit")
+
+    @property
+    def last_visit_epoch(self) -> Optional[int]:
+        """Optional[:obj:`int`]: `last_visit` as epoch seconds."""
+        return cached_epoch(self, "last_visit")
+
+    @property
+    def join_date_datetime(self) -> Optional[datetime]:
+        """Optional[:obj:`datetime.datetime`]: Parsed `join_date`."""
+        return cached_timestamp(self, "join_date")
+
+    @property
+    def join_date_epoch(self) -> Optional[int]:
+        """Optional[:obj:`int`]: `join_date` as epoch seconds."""
+        return cached_epoch(self, "join_date")
+
     def _update_data(self, data: UserPayload) -> None:
         self.id = int(data["id"])
         self.username = data["username"]
@@ -152,7 +231,7 @@ class BaseUser:
         self.profile_colour = data.get("profile_colour", None)
         self.cover_url = data.get("cover_url", None)
         self.has_supported = data.get("has_supported", False)
-        self.join_date = data.get("join_data", None)
+        self.join_date = data.get("join_date", None)
         self.kudosu_available = data.get("kudosu_available", 0)
         self.kudosu_total = data.get("kudosu_total", 0)
         self.max_blocks = data.get("max_blocks", 0)
@@ -169,6 +248,46 @@ class BaseUser:
         self.location = data.get("location", None)
         self.interests = data.get("interests", None)
         self.occupation = data.get("occupation", None)
+        self.beatmap_playcounts_count = data.get("beatmap_playcounts_count")
+        self.favourite_beatmapset_count = data.get(
+            "favourite_beatmapset_count"
+        )
+        self.graveyard_beatmapset_count = data.get(
+            "graveyard_beatmapset_count"
+        )
+        self.loved_beatmapset_count = data.get("loved_beatmapset_count")
+        self.pending_beatmapset_count = data.get("pending_beatmapset_count")
+        self.ranked_beatmapset_count = data.get("ranked_beatmapset_count")
+        self.scores_best_count = data.get("scores_best_count")
+        self.scores_first_count = data.get("scores_first_count")
+        self.scores_recent_count = data.get("scores_recent_count")
+
+        # Compact payloads omit these blocks, keep the ones already known
+        statistics = data.get("statistics")
+        if statistics is not None:
+            self.statistics = UserStatistics(
+                connector=self._connector, data=statistics, user_id=self.id
+            )
+        elif not hasattr(self, "statistics"):
+            self.statistics = None
+
+        rulesets = data.get("statistics_rulesets")
+        if rulesets is not None:
+            self.statistics_rulesets = {
+                mode: UserStatistics(
+                    connector=self._connector, data=stats, user_id=self.id
+                )
+                for mode, stats in rulesets.items()
+                if stats is not None
+            }
+        elif not hasattr(self, "statistics_rulesets"):
+            self.statistics_rulesets = {}
+
+        # Full profiles carry the key, null when the mode has no ranks
+        if "rank_history" in data:
+            self.rank_history = data["rank_history"]
+        elif not hasattr(self, "rank_history"):
+            self.rank_history = None
 
     def _to_compact_user_json(self) -> Dict[str, Any]:
         return {
@@ -187,6 +306,73 @@ class BaseUser:
             "pm_friends_only": self.pm_friends_only,
         }
 
+    def _merge_data(self, data: UserPayload) -> None:
+        # Compact payloads (e.g. /users lookups) omit most of the
+        # profile, only replace the fields they carry
+        payload = self.to_payload()
+        for key in ("statistics", "statistics_rulesets", "rank_history"):
+            del payload[key]
+
+        payload.update(data)
+        self._update_data(payload)
+
+    def to_payload(self) -> UserPayload:
+        """Returns the user as a payload with the same shape
+        as the API response.
+
+        Returns:
+            Dict[str, Any]: A User payload.
+
+        """
+        return {
+            **self._to_compact_user_json(),
+            "cover_url": self.cover_url,
+            "has_supported": self.has_supported,
+            "join_date": self.join_date,
+            "kudosu_available": self.kudosu_available,
+            "kudosu_total": self.kudosu_total,
+            "max_blocks": self.max_blocks,
+            "max_friends": self.max_friends,
+            "post_count": self.post_count,
+            "playmode": self.playmode,
+            "playstyle": self.playstyle,
+            "profile_order": self.profile_order,
+            "title": self.title,
+            "title_url": self.title_url,
+            "discord": self.discord,
+            "twitter": self.twitter,
+            "website": self.website,
+            "location": self.location,
+            "interests": self.interests,
+            "occupation": self.occupation,
+            "beatmap_playcounts_count": self.beatmap_playcounts_count,
+            "favourite_beatmapset_count": self.favourite_beatmapset_count,
+            "graveyard_beatmapset_count": self.graveyard_beatmapset_count,
+            "loved_beatmapset_count": self.loved_beatmapset_count,
+            "pending_beatmapset_count": self.pending_beatmapset_count,
+            "ranked_beatmapset_count": self.ranked_beatmapset_count,
+            "scores_best_count": self.scores_best_count,
+            "scores_first_count": self.scores_first_count,
+            "scores_recent_count": self.scores_recent_count,
+            "statistics": (
+                self.statistics.to_payload() if self.statistics else None
+            ),
+            "statistics_rulesets": {
+                mode: stats.to_payload()
+                for mode, stats in self.statistics_rulesets.items()
+            },
+            "rank_history": self.rank_history,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: UserPayload, *, connector: Connector
+    ) -> BaseUser:
+        """Builds a user from a payload returned by `to_payload`
+        or by the API.
+        """
+        return cls(connector=connector, data=data)
+
 
 class User(BaseUser):
     """Representation of an osu! User.
@@ -235,6 +421,29 @@ class User(BaseUser):
         location (:obj:`str`, optional): User's location.
         interests (:obj:`str`, optional): User's personal interests.
         occupation (:obj:`str`, optional): User's job/occupation.
+        beatmap_playcounts_count (:obj:`int`, optional): Number of
+            played beatmaps.
+        favourite_beatmapset_count (:obj:`int`, optional): Number of
+            favourite beatmapsets.
+        graveyard_beatmapset_count (:obj:`int`, optional): Number of
+            graveyard beatmapsets.
+        loved_beatmapset_count (:obj:`int`, optional): Number of
+            loved beatmapsets.
+        pending_beatmapset_count (:obj:`int`, optional): Number of
+            pending beatmapsets.
+        ranked_beatmapset_count (:obj:`int`, optional): Number of
+            ranked beatmapsets.
+        scores_best_count (:obj:`int`, optional): Number of best scores.
+        scores_first_count (:obj:`int`, optional): Number of first
+            place scores.
+        scores_recent_count (:obj:`int`, optional): Number of recent
+            scores.
+        statistics (:obj:`pyosu.UserStatistics`, optional): Statistics
+            in the requested or default game mode.
+        statistics_rulesets (:obj:`dict`): Statistics of every fetched
+            game mode, by mode.
+        rank_history (:obj:`dict`, optional): Global rank of the last
+            90 days as {"mode": str, "data": List[int]}.
 
     """
 
@@ -295,6 +504,38 @@ class User(BaseUser):
         )
         return [KudosuHistory(data=d) for d in data]
 
+    def iter_kudosu(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        page_size: int = 50,
+        prefetch: int = 2,
+    ) -> AsyncIterator[KudosuHistory]:
+        """Iterates the whole user kudosu history, requesting the
+        next pages while the current one is consumed.
+
+        Args:
+            limit (:obj:`int`, optional): Max number of items to yield.
+                Defaults to None (all items).
+            offset (:obj:`int`, optional): Starting offset. Defaults to 0.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            prefetch (:obj:`int`, optional): Pages requested ahead.
+                Defaults to 2.
+
+        Returns:
+            AsyncIterator[pyosu.KudosuHistory]
+
+        """
+        return paginate_offset(
+            lambda o, n: self.fetch_kudosu(limit=n, offset=o),
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            offset=offset,
+        )
+
     async def fetch_scores(
         self,
         type: ScoreType,
@@ -332,6 +573,48 @@ class User(BaseUser):
         )
         return [Score(connector=self._connector, data=d) for d in data]
 
+    def iter_scores(
+        self,
+        type: ScoreType,
+        *,
+        include_fails: bool = False,
+        mode: GameMode = GameMode.Osu,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        page_size: int = 50,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Score]:
+        """Iterates user scores of a given type, requesting the
+        next pages while the current one is consumed.
+
+        Args:
+            type (:obj:`pyosu.ScoreType`): A Score type to return.
+            include_fails (:obj:`bool`, optional): True to include fails.
+                Defaults to False.
+            mode (:obj:`pyosu.GameMode`, optional): Scores game mode.
+                Defaults to pyosu.GameMode.Osu
+            limit (:obj:`int`, optional): Max number of items to yield.
+                Defaults to None (all items).
+            offset (:obj:`int`, optional): Starting offset. Defaults to 0.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            prefetch (:obj:`int`, optional): Pages requested ahead.
+                Defaults to 2.
+
+        Returns:
+            AsyncIterator[pyosu.Score]
+
+        """
+        return paginate_offset(
+            lambda o, n: self.fetch_scores(
+                type, include_fails=include_fails, mode=mode, limit=n, offset=o
+            ),
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            offset=offset,
+        )
+
     async def fetch_beatmaps(
         self,
         *,
@@ -361,7 +644,47 @@ class User(BaseUser):
         data = await self._connector.http.get_user_beatmaps(
             self.id, str(type), limit=limit, offset=offset
         )
+        return self._parse_beatmaps(type, data)
+
+    def iter_beatmaps(
+        self,
+        *,
+        type: BeatmapType = BeatmapType.most_played,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        page_size: int = 50,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Union[Beatmapset, BeatmapPlaycount]]:
+        """Iterates beatmaps from a user, requesting the next pages
+        while the current one is consumed. Items are the same as
+        in `fetch_beatmaps`.
+
+        Args:
+            type (:obj:`pyosu.BeatmapType`, optional): A BeatmapType
+                to select. Defaults to pyosu.BeatmapType.most_played
+            limit (:obj:`int`, optional): Max number of items to yield.
+                Defaults to None (all items).
+            offset (:obj:`int`, optional): Starting offset. Defaults to 0.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            prefetch (:obj:`int`, optional): Pages requested ahead.
+                Defaults to 2.
 
+        Returns:
+            AsyncIterator[Union[Beatmapset, BeatmapPlayCount]]
+
+        """
+        return paginate_offset(
+            lambda o, n: self.fetch_beatmaps(type=type, limit=n, offset=o),
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _parse_beatmaps(
+        self, type: BeatmapType, data: List[Dict[str, Any]]
+    ) -> Union[Beatmapset, BeatmapPlaycount]:
         if type == BeatmapType.most_played:
             return [
                 BeatmapPlaycount(
@@ -394,6 +717,190 @@ class User(BaseUser):
         )
         return [Event(data=d) for d in data]
 
+    def iter_activity(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        page_size: int = 50,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Event]:
+        """Iterates recent activity from the user, requesting the
+        next pages while the current one is consumed.
+
+        Args:
+            limit (:obj:`int`, optional): Max number of items to yield.
+                Defaults to None (all items).
+            offset (:obj:`int`, optional): Starting offset. Defaults to 0.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            prefetch (:obj:`int`, optional): Pages requested ahead.
+                Defaults to 2.
+
+        Returns:
+            AsyncIterator[pyosu.Event]
+
+        """
+        return paginate_offset(
+            lambda o, n: self.fetch_activity(limit=n, offset=o),
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def _fetch_all(
+        self,
+        fetch: OffsetFetcher,
+        total: Optional[int],
+        page_size: int,
+        concurrency: int,
+    ) -> List[Any]:
+        if total is None:
+            return [
+                item
+                async for item in paginate_offset(
+                    fetch, page_size=page_size, prefetch=concurrency - 1
+                )
+            ]
+
+        return await fetch_offset_pages(
+            fetch, total, page_size=page_size, concurrency=concurrency
+        )
+
+    async def fetch_all_scores(
+        self,
+        type: ScoreType,
+        *,
+        include_fails: bool = False,
+        mode: GameMode = GameMode.Osu,
+        total: Optional[int] = None,
+        page_size: int = 50,
+        concurrency: int = 8,
+    ) -> List[Score]:
+        """Fetchs all user scores of a given type. When the total is
+        known every page is requested in parallel.
+
+        Args:
+            type (:obj:`pyosu.ScoreType`): A Score type to return.
+            include_fails (:obj:`bool`, optional): True to include fails.
+                Defaults to False.
+            mode (:obj:`pyosu.GameMode`, optional): Scores game mode.
+                Defaults to pyosu.GameMode.Osu
+            total (:obj:`int`, optional): Number of scores. Defaults to
+                the `scores_<type>_count` of the user profile.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            concurrency (:obj:`int`, optional): Max requests in flight.
+                Defaults to 8.
+
+        Returns:
+            List[pyosu.Score]: A list containing pyosu.Score objects.
+
+        """
+        if total is None:
+            total = getattr(self, _SCORE_COUNTS[str(type)], None)
+
+        return await self._fetch_all(
+            lambda o, n: self.fetch_scores(
+                type, include_fails=include_fails, mode=mode, limit=n, offset=o
+            ),
+            total,
+            page_size,
+            concurrency,
+        )
+
+    async def fetch_all_beatmaps(
+        self,
+        *,
+        type: BeatmapType = BeatmapType.most_played,
+        total: Optional[int] = None,
+        page_size: int = 50,
+        concurrency: int = 8,
+    ) -> List[Union[Beatmapset, BeatmapPlaycount]]:
+        """Fetchs all beatmaps of a given type from a user. When the
+        total is known every page is requested in parallel.
+
+        Args:
+            type (:obj:`pyosu.BeatmapType`, optional): A BeatmapType
+                to select. Defaults to pyosu.BeatmapType.most_played
+            total (:obj:`int`, optional): Number of beatmaps. Defaults to
+                the matching count of the user profile.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            concurrency (:obj:`int`, optional): Max requests in flight.
+                Defaults to 8.
+
+        Returns:
+            List[Union[Beatmapset, BeatmapPlayCount]]
+
+        """
+        if total is None:
+            total = getattr(self, _BEATMAP_COUNTS[str(type)], None)
+
+        return await self._fetch_all(
+            lambda o, n: self.fetch_beatmaps(type=type, limit=n, offset=o),
+            total,
+            page_size,
+            concurrency,
+        )
+
+    async def fetch_all_kudosu(
+        self,
+        *,
+        total: Optional[int] = None,
+        page_size: int = 50,
+        concurrency: int = 8,
+    ) -> List[KudosuHistory]:
+        """Fetchs the whole user kudosu history. The profile does not
+        include its size, pass `total` to request pages in parallel.
+
+        Args:
+            total (:obj:`int`, optional): Number of history items.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            concurrency (:obj:`int`, optional): Max requests in flight.
+                Defaults to 8.
+
+        Returns:
+            List[pyosu.KudosuHistory]: A list of pyosu.KudosuHistory
+
+        """
+        return await self._fetch_all(
+            lambda o, n: self.fetch_kudosu(limit=n, offset=o),
+            total,
+            page_size,
+            concurrency,
+        )
+
+    async def fetch_all_activity(
+        self,
+        *,
+        total: Optional[int] = None,
+        page_size: int = 50,
+        concurrency: int = 8,
+    ) -> List[Event]:
+        """Fetchs all recent activity from the user. The profile does
+        not include its size, pass `total` to request pages in parallel.
+
+        Args:
+            total (:obj:`int`, optional): Number of events.
+            page_size (:obj:`int`, optional): Items per request.
+                Defaults to 50.
+            concurrency (:obj:`int`, optional): Max requests in flight.
+                Defaults to 8.
+
+        Returns:
+            List[pyosu.Event]: A list containing pyosu.Event objects.
+
+        """
+        return await self._fetch_all(
+            lambda o, n: self.fetch_activity(limit=n, offset=o),
+            total,
+            page_size,
+            concurrency,
+        )
+
     async def send(self, message: str) -> ChatMessage:
         """Sends a message to the user.
 
@@ -441,3 +948,140 @@ class User(BaseUser):
         return self._connector.create_pm_channel(self.id, data), ChatMessage(
             connector=self._connector, data=data["message"]
         )
+
+
+class UserStatistics:
+    """Statistics of a user in a game mode, as returned by
+    rankings and user profiles.
+
+    Attributes:
+        user_id (:obj:`int`, optional): Owner of the statistics.
+        user (:obj:`pyosu.User`, optional): Cached owner if the payload
+            included it.
+        global_rank (:obj:`int`, optional): Global performance rank.
+        country_rank (:obj:`int`, optional): Country performance rank.
+        pp (:obj:`float`): Performance points.
+        hit_accuracy (:obj:`float`): Accuracy percentage.
+        play_count (:obj:`int`): Number of plays.
+        play_time (:obj:`int`): Play time in seconds.
+        ranked_score (:obj:`int`): Ranked score.
+        total_score (:obj:`int`): Total score.
+        total_hits (:obj:`int`): Total hits.
+        maximum_combo (:obj:`int`): Highest combo.
+        replays_watched_by_others (:obj:`int`): Replays watched.
+        is_ranked (:obj:`bool`): Specifies if the user is ranked.
+        grade_counts (:obj:`dict`): Count of each grade.
+        level (:obj:`dict`): Level and progress.
+
+    """
+
+    __slots__ = (
+        "_connector",
+        "user_id",
+        "user",
+        "global_rank",
+        "country_rank",
+        "pp",
+        "hit_accuracy",
+        "play_count",
+        "play_time",
+        "ranked_score",
+        "total_score",
+        "total_hits",
+        "maximum_combo",
+        "replays_watched_by_others",
+        "is_ranked",
+        "grade_counts",
+        "level",
+    )
+
+    if TYPE_CHECKING:
+        _connector: Connector
+        user_id: Optional[int]
+        user: Optional[User]
+        global_rank: Optional[int]
+        country_rank: Optional[int]
+        pp: float
+        hit_accuracy: float
+        play_count: int
+        play_time: int
+        ranked_score: int
+        total_score: int
+        total_hits: int
+        maximum_combo: int
+        replays_watched_by_others: int
+        is_ranked: bool
+        grade_counts: Dict[str, int]
+        level: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        connector: Connector,
+        data: UserStatisticsPayload,
+        user_id: Optional[int] = None,
+    ) -> None:
+        self._connector = connector
+        self.user_id = data.get("user_id", user_id)
+        self._update_data(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserStatistics user_id={self.user_id}"
+            f" global_rank={self.global_rank} pp={self.pp}"
+            f" accuracy={self.hit_accuracy}>"
+        )
+
+    def _update_data(self, data: UserStatisticsPayload) -> None:
+        self.global_rank = data.get("global_rank")
+        self.country_rank = data.get("country_rank")
+        self.pp = data.get("pp", 0)
+        self.hit_accuracy = data.get("hit_accuracy", 0)
+        self.play_count = data.get("play_count", 0)
+        self.play_time = data.get("play_time", 0)
+        self.ranked_score = data.get("ranked_score", 0)
+        self.total_score = data.get("total_score", 0)
+        self.total_hits = data.get("total_hits", 0)
+        self.maximum_combo = data.get("maximum_combo", 0)
+        self.replays_watched_by_others = data.get(
+            "replays_watched_by_others", 0
+        )
+        self.is_ranked = data.get("is_ranked", False)
+        self.grade_counts = data.get("grade_counts", {})
+        self.level = data.get("level", {})
+        self.user = None
+
+        if "user" in data:
+            self.user = self._connector._add_user_cache(data["user"])
+            self.user_id = self.user.id
+
+    def to_payload(self) -> UserStatisticsPayload:
+        data = {
+            "global_rank": self.global_rank,
+            "country_rank": self.country_rank,
+            "pp": self.pp,
+            "hit_accuracy": self.hit_accuracy,
+            "play_count": self.play_count,
+            "play_time": self.play_time,
+            "ranked_score": self.ranked_score,
+            "total_score": self.total_score,
+            "total_hits": self.total_hits,
+            "maximum_combo": self.maximum_combo,
+            "replays_watched_by_others": self.replays_watched_by_others,
+            "is_ranked": self.is_ranked,
+            "grade_counts": self.grade_counts,
+            "level": self.level,
+        }
+
+        if self.user is not None:
+            data["user"] = self.user._to_compact_user_json()
+        elif self.user_id is not None:
+            data["user_id"] = self.user_id
+
+        return data
+
+    @classmethod
+    def from_payload(
+        cls, data: UserStatisticsPayload, *, connector: Connector
+    ) -> UserStatistics:
+        return cls(connector=connector, data=data)
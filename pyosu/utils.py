@@ -25,11 +25,176 @@ SOFTWARE.
 from __future__ import annotations
 from .types.obj import ObjectID
 
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from datetime import datetime, timezone
+from functools import lru_cache
+from array import array
+
+import bisect
 import base64
 import json
 
+T = TypeVar("T")
+
 
 def cursor_to_string(cursor_id: ObjectID) -> str:
     data = json.dumps({"id": int(cursor_id)})
     b64 = base64.b64encode(data.encode("utf-8"))
     return str(b64, "utf-8")
+
+
+def cursor_params(
+    cursor: Union[str, Dict[str, Any]], name: str = "cursor"
+) -> Dict[str, Any]:
+    """Converts a cursor returned by the API into query parameters.
+    Object cursors are sent as `cursor[key]=value`.
+    """
+    if isinstance(cursor, dict):
+        return {f"{name}[{k}]": v for k, v in cursor.items()}
+
+    return {name: cursor}
+
+
+def _parse_timestamp(value: str) -> datetime:
+    if value[-1] in "Zz":
+        value = value[:-1] + "+00:00"
+
+    date = datetime.fromisoformat(value)
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return date
+
+
+@lru_cache(maxsize=4096)
+def _intern_timestamp(value: str) -> Tuple[datetime, int]:
+    # Scores and events of a page share most of their timestamps
+    date = _parse_timestamp(value)
+    return date, int(date.timestamp())
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parses an ISO-8601 timestamp from the API. Recent values are
+    kept in a bounded cache, so repeated values are parsed once.
+
+    Args:
+        value (:obj:`str`): Timestamp such as "2022-03-01T10:00:00+00:00".
+
+    Returns:
+        datetime: A timezone aware datetime (UTC when not specified).
+    """
+    return _intern_timestamp(value)[0]
+
+
+def timestamp_to_epoch(value: str) -> int:
+    """Converts an ISO-8601 timestamp from the API to epoch seconds."""
+    return _intern_timestamp(value)[1]
+
+
+def _cached_entry(model: Any, name: str) -> Optional[Tuple[Any, ...]]:
+    value = getattr(model, name)
+    if value is None:
+        return None
+
+    cache = getattr(model, "_timestamps", None)
+    if cache is None:
+        return (value, *_intern_timestamp(value))
+
+    entry = cache.get(name)
+    if entry is None or entry[0] != value:
+        entry = cache[name] = (value, *_intern_timestamp(value))
+
+    return entry
+
+
+def cached_timestamp(model: Any, name: str) -> Optional[datetime]:
+    """Parses the timestamp attribute `name` of a model once. The
+    result is kept in the model's `_timestamps` slot and only looked
+    up again when the raw value changes.
+    """
+    entry = _cached_entry(model, name)
+    return None if entry is None else entry[1]
+
+
+def cached_epoch(model: Any, name: str) -> Optional[int]:
+    """Same as `cached_timestamp` but in epoch seconds."""
+    entry = _cached_entry(model, name)
+    return None if entry is None else entry[2]
+
+
+def to_epoch(value: Any) -> int:
+    """Converts an epoch, datetime or ISO-8601 string to epoch seconds."""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+
+    if isinstance(value, str):
+        return timestamp_to_epoch(value)
+
+    return int(value)
+
+
+class TimeIndex(Generic[T]):
+    """Sorted epoch column over a list of models. Time-range queries
+    run on the integer column and never parse timestamps.
+
+    Args:
+        items (Iterable): Models to index.
+        key (:obj:`str`, optional): Name of the timestamp attribute.
+            Defaults to "created_at".
+    """
+
+    def __init__(self, items: Iterable[T] = (), *, key: str = "created_at"):
+        self.key = key
+        self.epochs: array = array("q")
+        self.items: List[T] = []
+
+        pairs = []
+        for item in items:
+            epoch = cached_epoch(item, key)
+            if epoch is not None:
+                pairs.append((epoch, item))
+
+        pairs.sort(key=lambda pair: pair[0])
+        for epoch, item in pairs:
+            self.epochs.append(epoch)
+            self.items.append(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def add(self, item: T) -> None:
+        epoch = cached_epoch(item, self.key)
+        if epoch is None:
+            return
+
+        index = bisect.bisect_right(self.epochs, epoch)
+        self.epochs.insert(index, epoch)
+        self.items.insert(index, item)
+
+    def between(self, start: Any = None, end: Any = None) -> List[T]:
+        """Returns the items with start <= timestamp <= end. Bounds can
+        be epochs, datetimes or ISO-8601 strings.
+        """
+        lo, hi = 0, len(self.epochs)
+
+        if start is not None:
+            lo = bisect.bisect_left(self.epochs, to_epoch(start))
+
+        if end is not None:
+            hi = bisect.bisect_right(self.epochs, to_epoch(end))
+
+        return self.items[lo:hi]
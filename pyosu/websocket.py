@@ -0,0 +1,302 @@
+"""
+MIT License
+
+Copyright (c) 2022 Grapphy 
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+
+import asyncio
+import logging
+
+import aiohttp
+
+from .channel import ChatChannel
+from .dispatch import EventBus, Subscription
+from .enums import EventType
+from .message import ChatMessage
+from .notification import Notification
+
+if TYPE_CHECKING:
+    from .connection import Connector
+    from .dispatch import Handler
+
+log = logging.getLogger(__name__)
+
+
+class NotificationSocket:
+    """Consumer of the notification websocket.
+
+    Frames are turned into events published to an `pyosu.EventBus`:
+        notification (:obj:`pyosu.Notification`): A new notification.
+        notification_read (List[:obj:`int`]): IDs of notifications
+            read from another session.
+        message (:obj:`pyosu.ChatMessage`): A new chat message, only
+            when `chat` is enabled.
+        channel_joined (:obj:`pyosu.ChatChannel`): A channel was joined.
+        channel_parted (:obj:`pyosu.ChatChannel`): A channel was left.
+
+    The socket reconnects with exponential backoff. After every
+    connection, notifications missed while disconnected are fetched
+    with `max_id` paging. When the socket keeps failing, notifications
+    are polled instead until it comes back.
+
+    Args:
+        connector (:obj:`pyosu.Connector`): Client connector.
+        bus (:obj:`pyosu.EventBus`, optional): Bus receiving the events.
+            Defaults to a new bus.
+        endpoint (:obj:`str`, optional): Websocket URL. Defaults to the
+            `notification_endpoint` returned by the API.
+        chat (:obj:`bool`, optional): Receive chat messages over the
+            socket. Do not enable along with `pyosu.ChatPoller`.
+            Defaults to True.
+        last_id (:obj:`int`, optional): Last seen notification ID.
+            Defaults to the newest notification on first connection.
+        min_backoff (:obj:`float`, optional): Seconds before the first
+            reconnection. Defaults to 1.
+        max_backoff (:obj:`float`, optional): Max seconds between
+            reconnections. Defaults to 60.
+        fallback_after (:obj:`int`, optional): Failed connections before
+            polling. Defaults to 3.
+        heartbeat (:obj:`float`, optional): Seconds between pings.
+            Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        *,
+        bus: Optional[EventBus] = None,
+        endpoint: Optional[str] = None,
+        chat: bool = True,
+        last_id: Optional[int] = None,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        fallback_after: int = 3,
+        heartbeat: float = 30.0,
+    ) -> None:
+        self._connector = connector
+        self.bus: EventBus = bus if bus is not None else EventBus()
+        self.endpoint: Optional[str] = endpoint
+        self.chat = chat
+        self.last_id: Optional[int] = last_id
+        self.last_message_id: int = 0
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.fallback_after = fallback_after
+        self.heartbeat = heartbeat
+        self.failures: int = 0
+        self.connected: bool = False
+        self._task: Optional[asyncio.Task] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_handler(
+        self, event: str, handler: Handler, **options: Any
+    ) -> Subscription:
+        """Registers a coroutine function for an event in the bus.
+        Options are passed to `pyosu.EventBus.subscribe`.
+        """
+        return self.bus.subscribe(event, handler, **options)
+
+    def on(self, event: str, **options: Any) -> Callable[[Handler], Handler]:
+        """Decorator version of `add_handler`."""
+        return self.bus.on(event, **options)
+
+    async def poll_once(self) -> int:
+        """Fetches notifications newer than `last_id` with `max_id`
+        paging and publishes them.
+
+        Returns:
+            int: Number of new notifications.
+        """
+        http = self._connector.http
+        max_id = None
+        missed: Dict[int, dict] = {}
+
+        while True:
+            data = await http.get_notifications(max_id=max_id)
+            self.endpoint = self.endpoint or data.get("notification_endpoint")
+            page = data.get("notifications") or []
+
+            if self.last_id is None:
+                self.last_id = max((int(n["id"]) for n in page), default=0)
+                return 0
+
+            for payload in page:
+                if int(payload["id"]) > self.last_id:
+                    missed[int(payload["id"])] = payload
+
+            oldest = min((int(n["id"]) for n in page), default=0)
+            if not data.get("has_more") or oldest <= self.last_id:
+                break
+
+            max_id = oldest - 1
+
+        for notification_id in sorted(missed):
+            await self._publish_notification(missed[notification_id])
+
+        return len(missed)
+
+    async def _publish_notification(self, payload: dict) -> None:
+        notification = Notification(connector=self._connector, data=payload)
+
+        if self.last_id is not None and notification.id <= self.last_id:
+            return
+
+        self.last_id = notification.id
+        await self.bus.publish(EventType.Notification, notification)
+
+    async def _handle_frame(self, frame: Dict[str, Any]) -> bool:
+        event = frame.get("event")
+        data = frame.get("data") or {}
+
+        if event == "new":
+            await self._publish_notification(data)
+
+        elif event == "read":
+            ids = [int(n["id"]) for n in data.get("notifications") or []]
+            await self.bus.publish(EventType.NotificationRead, ids)
+
+        elif event == "chat.message.new":
+            self._connector._add_users_cache(data.get("users"))
+
+            for payload in sorted(
+                data.get("messages") or [], key=lambda m: int(m["message_id"])
+            ):
+                if int(payload["message_id"]) <= self.last_message_id:
+                    continue
+
+                self.last_message_id = int(payload["message_id"])
+                message = ChatMessage(connector=self._connector, data=payload)
+                await self.bus.publish(EventType.Message, message)
+
+        elif event in ("chat.channel.join", "chat.channel.part"):
+            channel = ChatChannel(connector=self._connector, data=data)
+            await self.bus.publish(
+                (
+                    EventType.ChannelJoined
+                    if event == "chat.channel.join"
+                    else EventType.ChannelParted
+                ),
+                channel,
+            )
+
+        elif event == "logout":
+            return False
+
+        else:
+            log.debug("Ignoring notification frame %r", event)
+
+        return True
+
+    async def _listen(self) -> bool:
+        ws = await self._connector.http.ws_connect(
+            self.endpoint, heartbeat=self.heartbeat
+        )
+        self._ws = ws
+        self.connected = True
+        self.failures = 0
+
+        try:
+            if self.chat:
+                await ws.send_json({"event": "chat.start"})
+
+            # Catch up with notifications sent while disconnected
+            await self.poll_once()
+
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    if not await self._handle_frame(msg.json()):
+                        return False
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    break
+
+            return True
+        finally:
+            self.connected = False
+            self._ws = None
+            await ws.close()
+
+    async def run(self) -> None:
+        """Listens forever, reconnecting with backoff. Returns when
+        the server logs the session out.
+        """
+        delay = self.min_backoff
+
+        while True:
+            try:
+                if self.endpoint is None:
+                    await self.poll_once()
+
+                if not await self._listen():
+                    return
+
+                delay = self.min_backoff
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failures += 1
+                log.warning(
+                    "Notification socket failed (%d), retrying in %.1fs",
+                    self.failures,
+                    delay,
+                )
+
+            if self.failures >= self.fallback_after:
+                try:
+                    await self.poll_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    log.exception("Polling notifications failed")
+
+            await asyncio.sleep(delay)
+
+            if self.failures:
+                delay = min(delay * 2, self.max_backoff)
+
+    def start(self) -> asyncio.Task:
+        """Starts listening in a background task."""
+        if not self.is_running:
+            self._task = asyncio.ensure_future(self.run())
+
+        return self._task
+
+    async def stop(self) -> None:
+        """Closes the socket. It can be started again and will
+        resume from the last seen notification.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
@@ -81,3 +81,21 @@ class WikiPage:
         self.title = data["title"]
         self.available_locales = data["available_locales"]
         self.subtitle = data.get("subtitle")
+
+    def to_payload(self) -> WikiPagePayload:
+        return {
+            "layout": self.layout,
+            "locale": self.locale,
+            "markdown": self.markdown,
+            "path": self.path,
+            "tags": self.tags,
+            "title": self.title,
+            "available_locales": self.available_locales,
+            "subtitle": self.subtitle,
+        }
+
+    @classmethod
+    def from_payload(
+        cls, data: WikiPagePayload, *, connector: Connector
+    ) -> WikiPage:
+        return cls(connector=connector, data=data)
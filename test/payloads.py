@@ -0,0 +1,40 @@
+"""API payloads shared by the tests."""
+
+
+def user_payload(user_id, **fields):
+    data = {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "avatar_url": f"https://a.ppy.sh/{user_id}",
+        "country_code": "AU",
+        "default_group": "default",
+        "is_active": True,
+        "is_bot": False,
+        "is_deleted": False,
+        "is_online": False,
+        "is_supporter": False,
+        "pm_friends_only": False,
+    }
+    data.update(fields)
+    return data
+
+
+def score_payload(score_id, user_id, **fields):
+    data = {
+        "id": score_id,
+        "user_id": user_id,
+        "accuracy": 0.98,
+        "mods": [],
+        "score": 1000000,
+        "max_combo": 500,
+        "perfect": False,
+        "passed": True,
+        "pp": 100.0,
+        "rank": "S",
+        "created_at": "2022-03-01T10:00:00+00:00",
+        "mode": "osu",
+        "mode_int": 0,
+        "replay": False,
+    }
+    data.update(fields)
+    return data
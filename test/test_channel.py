@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+
+from pyosu.channel import ChatChannel
+from pyosu.connection import Connector
+
+
+def message(message_id):
+    return {
+        "message_id": message_id,
+        "channel_id": 10,
+        "sender_id": 2,
+        "timestamp": f"2022-03-01T10:{message_id % 60:02d}:00+00:00",
+        "content": f"message {message_id}",
+        "is_action": False,
+    }
+
+
+class FakeHTTP:
+    def __init__(self, count, *, overlap=False, delay=0):
+        self.ids = list(range(1, count + 1))
+        self.overlap = overlap
+        self.delay = delay
+        self.requested = []
+        self.cancelled = 0
+
+    async def get_channel_messages(self, channel_id, limit, since, until):
+        self.requested.append((since, until))
+
+        if self.delay and len(self.requested) > 1:
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+
+        # Overlapping windows repeat the message at the cursor
+        ids = self.ids
+        if since is not None:
+            ids = [i for i in ids if i > since - self.overlap][:limit]
+        else:
+            if until is not None:
+                ids = [i for i in ids if i < until + self.overlap]
+            ids = ids[-limit:]
+
+        return [message(i) for i in ids]
+
+
+class TestChannelHistory(unittest.IsolatedAsyncioTestCase):
+    def channel(self, http):
+        data = {
+            "channel_id": 10,
+            "name": "#osu",
+            "icon": None,
+            "type": "PUBLIC",
+            "moderated": False,
+        }
+        return ChatChannel(connector=Connector(http=http), data=data)
+
+    async def collect(self, http, **kwargs):
+        return [m.id async for m in self.channel(http).history(**kwargs)]
+
+    async def test_default_is_forward(self):
+        http = FakeHTTP(120)
+        ids = await self.collect(http, limit=None)
+
+        self.assertEqual(ids, list(range(71, 121)))
+        self.assertEqual(http.requested, [(None, None), (120, None)])
+
+    async def test_forward_since(self):
+        http = FakeHTTP(120)
+        ids = await self.collect(http, limit=None, since=10)
+
+        self.assertEqual(ids, list(range(11, 121)))
+        self.assertEqual(http.requested, [(10, None), (60, None), (110, None)])
+
+    async def test_reverse(self):
+        http = FakeHTTP(120)
+        ids = await self.collect(http, limit=None, reverse=True)
+
+        self.assertEqual(ids, list(range(120, 0, -1)))
+        self.assertEqual(
+            http.requested, [(None, None), (None, 71), (None, 21)]
+        )
+
+    async def test_until_walks_backward(self):
+        http = FakeHTTP(120)
+        ids = await self.collect(http, limit=60, until=101)
+
+        self.assertEqual(ids, list(range(100, 40, -1)))
+
+    async def test_overlapping_windows(self):
+        http = FakeHTTP(120, overlap=True)
+
+        ids = await self.collect(http, limit=None, since=10)
+        self.assertEqual(ids, list(range(11, 121)))
+
+        ids = await self.collect(http, limit=None, reverse=True)
+        self.assertEqual(ids, list(range(120, 0, -1)))
+
+    async def test_stop_id(self):
+        http = FakeHTTP(120)
+
+        ids = await self.collect(http, limit=None, reverse=True, stop_id=100)
+        self.assertEqual(ids, list(range(120, 100, -1)))
+
+        ids = await self.collect(http, limit=None, since=10, stop_id=15)
+        self.assertEqual(ids, [11, 12, 13, 14])
+
+    async def test_prefetches_next_window(self):
+        http = FakeHTTP(120)
+        history = self.channel(http).history(limit=None, since=10)
+
+        first = await history.__anext__()
+        self.assertEqual(first.id, 11)
+        await asyncio.sleep(0)
+        self.assertEqual(len(http.requested), 2)
+
+        await history.aclose()
+
+    async def test_limit_skips_prefetch(self):
+        http = FakeHTTP(120)
+        ids = await self.collect(http, limit=50, since=10)
+
+        self.assertEqual(len(ids), 50)
+        self.assertEqual(http.requested, [(10, None)])
+
+    async def test_early_exit_cancels_prefetch(self):
+        http = FakeHTTP(120, delay=1)
+        history = self.channel(http).history(limit=None, reverse=True)
+
+        await history.__anext__()
+        await asyncio.sleep(0)
+        await history.aclose()
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(http.requested), 2)
+        self.assertEqual(http.cancelled, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import asyncio
+import unittest
+
+from pyosu.chatlog import ChatHistoryStore
+from pyosu.connection import Connector
+from pyosu.dispatch import EventBus
+from pyosu.enums import EventType
+from pyosu.message import ChatMessage
+
+
+def message(message_id, channel_id, sender_id, content, day=1):
+    return {
+        "message_id": message_id,
+        "channel_id": channel_id,
+        "sender_id": sender_id,
+        "timestamp": f"2022-03-{day:02d}T10:00:00+00:00",
+        "content": content,
+        "is_action": False,
+    }
+
+
+class FakeChannel:
+    def __init__(self, channel_id, messages):
+        self.id = channel_id
+        self.messages = messages
+        self.requested = []
+
+    async def history(self, *, limit=50, since=None, reverse=False):
+        self.requested.append(since)
+        for data in self.messages:
+            if since is None or data["message_id"] > since:
+                yield ChatMessage(connector=None, data=data)
+
+
+class TestChatHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.connector = Connector(http=None)
+        self.store = ChatHistoryStore(self.connector)
+        self.store.add(
+            ChatMessage(connector=self.connector, data=data)
+            for data in (
+                message(1, 10, 2, "hello world"),
+                message(2, 10, 3, "buy cheap gold", day=5),
+                message(3, 11, 2, "gold medal", day=9),
+            )
+        )
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_add_ignores_duplicates(self):
+        data = message(1, 10, 2, "hello world")
+        added = self.store.add(
+            [ChatMessage(connector=self.connector, data=data)]
+        )
+        self.assertEqual(added, 0)
+        self.assertEqual(len(self.store), 3)
+
+    def test_high_water(self):
+        self.assertEqual(self.store.high_water(10), 2)
+        self.assertEqual(self.store.high_water(11), 3)
+        self.assertEqual(self.store.high_water(12), 0)
+
+    def test_search(self):
+        found = self.store.search("gold")
+        self.assertEqual([m.id for m in found], [3, 2])
+
+        found = self.store.search("gold", channel_id=10)
+        self.assertEqual([m.id for m in found], [2])
+
+        found = self.store.search("gold", start="2022-03-06T00:00:00Z")
+        self.assertEqual([m.id for m in found], [3])
+
+    def test_messages(self):
+        found = self.store.messages(sender_id=2)
+        self.assertEqual([m.id for m in found], [3, 1])
+        self.assertEqual(found[1].content, "hello world")
+
+    def test_backfill(self):
+        channel = FakeChannel(
+            10, [message(i, 10, 2, f"message {i}") for i in (1, 2, 4, 5, 6)]
+        )
+        added = asyncio.run(self.store.backfill(channel))
+
+        # Stored messages are not a backfill, the whole history is read
+        self.assertEqual(channel.requested, [None])
+        self.assertEqual(added, 3)
+        self.assertEqual(self.store.high_water(10), 6)
+        self.assertEqual(self.store.backfilled(10), 6)
+
+        channel.messages.append(message(8, 10, 2, "message 8"))
+        added = asyncio.run(self.store.backfill(channel))
+
+        self.assertEqual(channel.requested, [None, 6])
+        self.assertEqual(added, 1)
+        self.assertEqual(self.store.backfilled(10), 8)
+
+    def test_backfill_after_attach(self):
+        bus = EventBus()
+        self.store.attach(bus)
+        channel = FakeChannel(
+            12, [message(i, 12, 2, f"message {i}") for i in (4, 5, 6, 7)]
+        )
+
+        async def run():
+            live = ChatMessage(
+                connector=self.connector, data=channel.messages[-1]
+            )
+            await bus.publish(EventType.Message, live)
+            await bus.close()
+            return await self.store.backfill(channel)
+
+        added = asyncio.run(run())
+
+        self.assertEqual(channel.requested, [None])
+        self.assertEqual(added, 3)
+        self.assertEqual(self.store.count(channel_id=12), 4)
+        self.assertEqual(self.store.high_water(12), 7)
+        self.assertEqual(self.store.backfilled(12), 7)
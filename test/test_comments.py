@@ -0,0 +1,146 @@
+import asyncio
+import unittest
+
+from pyosu.comment import Comment, CommentCrawler, CommentTree
+from pyosu.connection import Connector
+
+# parent ID -> reply IDs, 0 holds the top level comments
+THREAD = {
+    0: [1, 2, 3, 4, 5],
+    1: [11, 12, 13],
+    3: [31],
+    11: [111, 112],
+}
+PARENTS = {c: p for p, replies in THREAD.items() for c in replies}
+
+
+def comment(comment_id):
+    return {
+        "id": comment_id,
+        "commentable_id": 1,
+        "commentable_type": "beatmapset",
+        "created_at": "2022-03-01T10:00:00+00:00",
+        "parent_id": PARENTS[comment_id] or None,
+        "replies_count": len(THREAD.get(comment_id, ())),
+        "user_id": 2,
+    }
+
+
+class FakeComments:
+    """Comments endpoint over `THREAD`, two comments per page."""
+
+    def __init__(self, fail_on=None):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_on = fail_on
+
+    async def get_comments(self, *, cursor=None, parent_id=0, **kwargs):
+        self.requests.append((parent_id, cursor))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if parent_id == self.fail_on:
+            raise RuntimeError("boom")
+
+        start = (cursor or {}).get("offset", 0)
+        replies = THREAD.get(parent_id, [])
+        page = replies[start : start + 2]
+        has_more = start + 2 < len(replies)
+        return {
+            "comments": [comment(i) for i in page],
+            # Top level pages embed the first reply of comment 1
+            "included_comments": [comment(11)] if parent_id == 0 else [],
+            "users": [],
+            "has_more": has_more,
+            "cursor": {"offset": start + 2} if has_more else None,
+        }
+
+
+class TestCommentCrawler(unittest.IsolatedAsyncioTestCase):
+    def crawler(self, http, **options):
+        return CommentCrawler(Connector(http=http), "beatmapset", 1, **options)
+
+    async def test_streams_whole_thread_once(self):
+        http = FakeComments()
+        ids = [c.id async for c in self.crawler(http)]
+
+        self.assertEqual(sorted(ids), sorted(PARENTS))
+        self.assertEqual(len(ids), len(set(ids)))
+
+    async def test_follows_cursor_per_listing(self):
+        http = FakeComments()
+        [c async for c in self.crawler(http)]
+
+        top = [cursor for parent, cursor in http.requests if parent == 0]
+        self.assertEqual(top, [None, {"offset": 2}, {"offset": 4}])
+        replies = [cursor for parent, cursor in http.requests if parent == 1]
+        self.assertEqual(replies, [None, {"offset": 2}])
+        # Comment 31 has no replies, no listing is requested for it
+        self.assertNotIn(31, [parent for parent, _ in http.requests])
+
+    async def test_concurrency_limit(self):
+        http = FakeComments()
+        [c async for c in self.crawler(http, concurrency=1)]
+        self.assertEqual(http.max_in_flight, 1)
+
+    async def test_error_propagates(self):
+        http = FakeComments(fail_on=11)
+        with self.assertRaises(RuntimeError):
+            [c async for c in self.crawler(http)]
+
+    async def test_early_exit_cancels_listings(self):
+        http = FakeComments()
+        iterator = self.crawler(http).__aiter__()
+
+        await iterator.__anext__()
+        await iterator.aclose()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(http.in_flight, 0)
+        self.assertLess(len(http.requests), 5)
+
+
+class TestCommentTree(unittest.IsolatedAsyncioTestCase):
+    async def test_builds_tree(self):
+        http = FakeComments()
+        connector = Connector(http=http)
+        crawler = CommentCrawler(connector, "beatmapset", 1, sort="old")
+        tree = CommentTree([c async for c in crawler])
+
+        self.assertEqual(len(tree), len(PARENTS))
+        self.assertEqual(sorted(c.id for c in tree.roots), THREAD[0])
+        self.assertEqual(sorted(c.id for c in tree.replies(11)), [111, 112])
+        self.assertIn(31, tree)
+
+        depths = {c.id: depth for depth, c in tree.walk()}
+        self.assertEqual(depths[1], 0)
+        self.assertEqual(depths[11], 1)
+        self.assertEqual(depths[112], 2)
+
+    def test_walk_is_depth_first(self):
+        connector = Connector(http=None)
+        tree = CommentTree(
+            Comment(connector=connector, data=comment(i))
+            for i in (1, 2, 11, 111, 12)
+        )
+        self.assertEqual([c.id for _, c in tree.walk()], [1, 11, 111, 12, 2])
+        self.assertEqual([c.id for _, c in tree.walk(11)], [111])
+
+    def test_add_replaces_known_comment(self):
+        connector = Connector(http=None)
+        tree = CommentTree([Comment(connector=connector, data=comment(1))])
+        updated = comment(1)
+        updated["votes_count"] = 5
+        tree.add(Comment(connector=connector, data=updated))
+
+        self.assertEqual(len(tree.roots), 1)
+        self.assertEqual(tree.roots[0].votes_count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import time
+import unittest
+
+from pyosu.connection import Connector
+
+from payloads import user_payload
+
+
+def full_user(user_id, **fields):
+    data = user_payload(
+        user_id,
+        title="Mapper",
+        post_count=1200,
+        playmode="mania",
+        statistics={"global_rank": 10, "pp": 9000.0, "play_count": 50},
+        rank_history={"mode": "mania", "data": [12, 11, 10]},
+    )
+    data.update(fields)
+    return data
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.requested = []
+
+    async def get_users(self, ids):
+        self.requested.append(list(ids))
+        return {
+            "users": [user_payload(i, is_online=True) for i in ids],
+        }
+
+
+class TestUserCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.http = FakeHTTP()
+        self.connector = Connector(http=self.http)
+
+    def test_refresh_merges_compact_payload(self):
+        user = self.connector._add_user_cache(full_user(2))
+        refreshed = self.connector._refresh_user_cache(
+            user_payload(2, username="renamed", is_online=True)
+        )
+
+        self.assertIs(refreshed, user)
+        self.assertEqual(user.username, "renamed")
+        self.assertTrue(user.is_online)
+        self.assertEqual(user.title, "Mapper")
+        self.assertEqual(user.post_count, 1200)
+        self.assertEqual(user.playmode, "mania")
+        self.assertEqual(user.statistics.pp, 9000.0)
+        self.assertEqual(user.rank_history["data"], [12, 11, 10])
+
+    def test_refresh_replaces_present_fields(self):
+        user = self.connector._add_user_cache(full_user(2))
+        self.connector._refresh_user_cache(
+            full_user(2, title=None, statistics={"pp": 10.0})
+        )
+
+        self.assertIsNone(user.title)
+        self.assertEqual(user.statistics.pp, 10.0)
+
+    async def test_fetch_users_chunks(self):
+        self.connector.users_chunk_size = 2
+        self.connector._add_user_cache(full_user(3))
+
+        users = await self.connector._fetch_users([1, 2, 3, 4, 5])
+
+        self.assertEqual(self.http.requested, [[1, 2], [3, 4], [5]])
+        self.assertEqual([u.id for u in users], [1, 2, 3, 4, 5])
+        self.assertTrue(all(u.is_online for u in users))
+        self.assertEqual(self.connector.users[3].statistics.pp, 9000.0)
+
+    def test_stale_users(self):
+        for user_id in (1, 2):
+            self.connector._add_user_cache(user_payload(user_id))
+
+        self.connector.users_updated[2] = time.monotonic() - 3600
+
+        self.assertEqual(self.connector._stale_users([1, 2, 3, 3]), [2, 3])
+
+        self.connector.users_ttl = 7200
+        self.assertEqual(self.connector._stale_users([1, 2, 3]), [3])
+
+    async def test_presence_fetches_only_stale_partners(self):
+        self.connector._add_user_cache(user_payload(1))
+        self.connector.user = self.connector.users[1]
+        self.connector._add_user_cache(user_payload(2))
+        self.connector.users_updated[2] = time.monotonic() - 3600
+        self.connector._add_user_cache(user_payload(3))
+
+        channels = [
+            {
+                "channel_id": 100 + user_id,
+                "name": f"user{user_id}",
+                "icon": None,
+                "type": "PM",
+                "moderated": False,
+                "users": [1, user_id],
+            }
+            for user_id in (2, 3, 4)
+        ]
+        await self.connector._get_presence(channels)
+
+        self.assertEqual(self.http.requested, [[2, 4]])
+        self.assertEqual(list(self.connector.pm_channels), [2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
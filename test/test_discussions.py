@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+from pyosu.client import Client
+
+from payloads import user_payload
+
+
+def discussion(discussion_id):
+    return {
+        "id": discussion_id,
+        "beatmapset_id": 1,
+        "created_at": "2022-03-01T10:00:00+00:00",
+        "message_type": "suggestion",
+        "user_id": discussion_id % 3 + 1,
+        "starting_post": {
+            "id": discussion_id * 10,
+            "beatmapset_discussion_id": discussion_id,
+            "created_at": "2022-03-01T10:00:00+00:00",
+            "message": "fix this",
+            "user_id": discussion_id % 3 + 1,
+        },
+    }
+
+
+class TestDiscussionStreams(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+        self.client.http.get_beatmapset_discussions = self.get_discussions
+        self.client.http.get_beatmapset_discussion_votes = self.get_votes
+        self.requests = []
+
+    async def asyncTearDown(self):
+        await self.client.http.close_session()
+        self.client.loop.close()
+
+    async def get_discussions(self, *, cursor_string=None, limit, **kwargs):
+        self.requests.append(cursor_string)
+        await asyncio.sleep(0)
+        start = int(cursor_string or 0)
+        ids = list(range(start, min(start + limit, 7)))
+        return {
+            "discussions": [discussion(i) for i in ids],
+            "users": [user_payload(1), user_payload(2), user_payload(3)],
+            "cursor_string": str(start + limit) if start + limit < 7 else None,
+        }
+
+    async def get_votes(self, *, cursor_string=None, limit, **kwargs):
+        self.requests.append(cursor_string)
+        page = int(cursor_string or 0)
+        votes = [
+            {
+                "id": page * limit + i,
+                "beatmapset_discussion_id": 1,
+                "created_at": "2022-03-01T10:00:00+00:00",
+                "score": 1,
+                "user_id": 1,
+            }
+            for i in range(limit)
+        ]
+        return {
+            "votes": votes,
+            "users": [user_payload(1)],
+            "cursor_string": str(page + 1) if page < 1 else None,
+        }
+
+    async def test_follows_cursor_string(self):
+        iterator = self.client.iter_beatmapset_discussions(page_size=3)
+        discussions = [d async for d in iterator]
+
+        self.assertEqual([d.id for d in discussions], list(range(7)))
+        self.assertEqual(self.requests, [None, "3", "6"])
+        self.assertTrue(iterator.exhausted)
+
+    async def test_included_users_are_cached(self):
+        discussions = [
+            d async for d in self.client.iter_beatmapset_discussions()
+        ]
+
+        self.assertEqual(discussions[0].user.username, "user1")
+        self.assertEqual(discussions[0].starting_post.message, "fix this")
+        self.assertEqual(len(self.client._connection.users), 3)
+
+    async def test_resume_from_cursor(self):
+        first = self.client.iter_beatmapset_discussions(page_size=3, limit=4)
+        seen = [d.id async for d in first]
+
+        rest = self.client.iter_beatmapset_discussions(
+            page_size=3, cursor=first.cursor, offset=first.offset
+        )
+        seen += [d.id async for d in rest]
+        self.assertEqual(seen, list(range(7)))
+
+    async def test_votes(self):
+        votes = [
+            v
+            async for v in self.client.iter_beatmapset_discussion_votes(
+                page_size=2
+            )
+        ]
+
+        self.assertEqual([v.id for v in votes], [0, 1, 2, 3])
+        self.assertEqual(self.requests, [None, "1"])
+        self.assertIs(votes[0].user, self.client._connection.users[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+
+from pyosu.dispatch import EventBus
+from pyosu.enums import OverflowPolicy
+
+
+class TestEventBus(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bus = EventBus(queue_size=1)
+        self.release = asyncio.Event()
+        self.handled = []
+
+    async def asyncTearDown(self):
+        self.release.set()
+        await self.bus.close(drain=False)
+
+    async def handler(self, value):
+        await self.release.wait()
+        self.handled.append(value)
+
+    async def fill(self, policy):
+        subscription = self.bus.subscribe("test", self.handler, policy=policy)
+
+        # The worker takes the first event and blocks on it
+        await self.bus.publish("test", 1)
+        await asyncio.sleep(0)
+        await self.bus.publish("test", 2)
+        return subscription
+
+    async def test_drop_policy(self):
+        subscription = await self.fill(OverflowPolicy.Drop)
+        await self.bus.publish("test", 3)
+
+        self.release.set()
+        await self.bus.join()
+
+        self.assertEqual(self.handled, [1, 2])
+        self.assertEqual(subscription.dropped, 1)
+        self.assertEqual(subscription.processed, 2)
+
+    async def test_latest_policy(self):
+        subscription = await self.fill(OverflowPolicy.Latest)
+        await self.bus.publish("test", 3)
+
+        self.release.set()
+        await self.bus.join()
+
+        self.assertEqual(self.handled, [1, 3])
+        self.assertEqual(subscription.dropped, 1)
+
+    async def test_block_policy(self):
+        subscription = await self.fill(OverflowPolicy.Block)
+        publish = asyncio.ensure_future(self.bus.publish("test", 3))
+        await asyncio.sleep(0.01)
+        self.assertFalse(publish.done())
+
+        self.release.set()
+        await publish
+        await self.bus.join()
+
+        self.assertEqual(self.handled, [1, 2, 3])
+        self.assertEqual(subscription.dropped, 0)
+
+    async def test_unbounded_queue(self):
+        subscription = self.bus.subscribe(
+            "test", self.handler, queue_size=0, policy=OverflowPolicy.Drop
+        )
+        self.assertEqual(subscription.queue_size, 0)
+
+        for value in range(5):
+            await self.bus.publish("test", value)
+
+        self.release.set()
+        await self.bus.join()
+
+        self.assertEqual(self.handled, list(range(5)))
+        self.assertEqual(subscription.dropped, 0)
+
+    async def test_failed_handler(self):
+        async def handler(value):
+            raise ValueError(value)
+
+        subscription = self.bus.subscribe("test", handler)
+        with self.assertLogs("pyosu.dispatch"):
+            await self.bus.publish("test", 1)
+            await self.bus.join()
+
+        self.assertEqual(subscription.failed, 1)
+        self.assertEqual(subscription.processed, 0)
+
+    async def test_close_drain_timeout(self):
+        await self.fill(OverflowPolicy.Block)
+
+        with self.assertLogs("pyosu.dispatch", level="WARNING"):
+            await asyncio.wait_for(self.bus.close(timeout=0.01), 1)
+
+        self.assertEqual(self.handled, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
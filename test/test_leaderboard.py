@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+
+from pyosu.connection import Connector
+from pyosu.enums import EventType
+from pyosu.leaderboard import LeaderboardWatcher
+from pyosu.ratelimit import TokenBucket
+
+from payloads import score_payload
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.leaderboards = {}
+        self.requested = []
+
+    async def get_beatmap_scores(self, beatmap_id, mode=None, type=None):
+        self.requested.append(beatmap_id)
+        scores = self.leaderboards.get(beatmap_id, [])
+        return {
+            "scores": [
+                score_payload(s, u, score=1000000 - s) for s, u in scores
+            ]
+        }
+
+
+class TestLeaderboardWatcher(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = FakeHTTP()
+        self.watcher = LeaderboardWatcher(
+            Connector(http=self.http),
+            budget=TokenBucket(1000, 1000),
+            min_interval=10,
+            max_interval=40,
+            backoff=2,
+        )
+        self.changes = []
+        self.watcher.add_handler(EventType.ScoreSet, self.on_score)
+
+    async def asyncTearDown(self):
+        await self.watcher.stop()
+        await self.watcher.bus.close()
+
+    async def on_score(self, change):
+        self.changes.append(change)
+
+    async def test_first_check_stores_snapshot(self):
+        self.http.leaderboards[1] = [(11, 2), (12, 3)]
+        self.watcher.watch([1])
+
+        self.assertEqual(await self.watcher.check(1), [])
+        self.assertEqual(list(self.watcher.snapshot(1)), [11, 12])
+
+    async def test_new_scores(self):
+        self.http.leaderboards[1] = [(11, 2), (12, 3), (13, 4)]
+        self.watcher.watch([1])
+        await self.watcher.check(1)
+
+        # User 4 improves from #3 to #1, user 5 enters at #3
+        self.http.leaderboards[1] = [(20, 4), (11, 2), (21, 5), (12, 3)]
+        changes = await self.watcher.check(1)
+        await self.watcher.bus.join()
+
+        self.assertEqual(
+            [(c.score.id, c.position, c.previous) for c in changes],
+            [(20, 1, 3), (21, 3, None)],
+        )
+        self.assertEqual(self.changes, changes)
+        self.assertEqual(self.watcher.changes, 2)
+
+    async def test_positions_filter(self):
+        self.watcher.positions = 1
+        self.http.leaderboards[1] = [(11, 2), (12, 3)]
+        self.watcher.watch([1])
+        await self.watcher.check(1)
+
+        self.http.leaderboards[1] = [(11, 2), (20, 4), (12, 3)]
+        self.assertEqual(await self.watcher.check(1), [])
+
+        self.http.leaderboards[1] = [(21, 5), (11, 2), (20, 4)]
+        changes = await self.watcher.check(1)
+        self.assertEqual([c.score.id for c in changes], [21])
+
+    async def test_interval_backoff_and_halving(self):
+        self.http.leaderboards[1] = [(11, 2)]
+        self.watcher.watch([1], interval=10)
+        watch = self.watcher._watches[1]
+
+        intervals = []
+        for _ in range(4):
+            await self.watcher.check(1)
+            intervals.append(watch.interval)
+
+        # Unchanged checks back off up to max_interval
+        self.assertEqual(intervals, [20, 40, 40, 40])
+
+        self.http.leaderboards[1] = [(20, 3), (11, 2)]
+        await self.watcher.check(1)
+        self.assertEqual(watch.interval, 20)
+
+        self.http.leaderboards[1] = [(21, 4), (20, 3), (11, 2)]
+        await self.watcher.check(1)
+        self.assertEqual(watch.interval, 10)
+
+        self.http.leaderboards[1] = [(22, 5), (21, 4), (20, 3), (11, 2)]
+        await self.watcher.check(1)
+        self.assertEqual(watch.interval, 10)
+
+    async def test_run_checks_watched_beatmaps(self):
+        self.http.leaderboards = {1: [(11, 2)], 2: [(12, 2)]}
+        self.watcher.watch([1, 2])
+        self.watcher.watch([1])
+        self.watcher.unwatch(2)
+        self.watcher.watch([3])
+
+        self.watcher.start()
+        await asyncio.sleep(0.05)
+        await self.watcher.stop()
+
+        self.assertEqual(sorted(self.http.requested), [1, 3])
+        self.assertEqual(self.watcher.checks, 2)
+        self.assertNotIn(2, self.watcher)
+
+    async def test_failed_check_keeps_watching(self):
+        async def fail(*args, **kwargs):
+            raise RuntimeError("request failed")
+
+        self.http.get_beatmap_scores = fail
+        self.watcher.watch([1])
+
+        with self.assertLogs("pyosu.leaderboard"):
+            interval = await self.watcher._poll(1)
+
+        self.assertEqual(interval, 10)
+        self.assertIsNone(await self.watcher._poll(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import asyncio
+import unittest
+
+from pyosu.channel import ChatChannel
+from pyosu.connection import Connector
+from pyosu.markers import ReadMarkers
+
+
+class FakeHTTP:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.marked = []
+        self.notifications = []
+
+    def fail(self):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("request failed")
+
+    async def mark_channel_as_read(self, channel, message, **kwargs):
+        self.fail()
+        self.marked.append((channel, message))
+
+    async def read_notifications(self, ids):
+        self.fail()
+        self.notifications.append(ids)
+
+
+def channel_payload(last_message_id=None):
+    return {
+        "channel_id": 10,
+        "name": "#osu",
+        "icon": None,
+        "type": "PUBLIC",
+        "moderated": False,
+        "last_message_id": last_message_id,
+    }
+
+
+class TestMarkAsRead(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = FakeHTTP()
+        self.connector = Connector(http=self.http)
+
+    async def asyncTearDown(self):
+        await self.connector.read_markers.close()
+
+    async def test_sends_immediately(self):
+        channel = ChatChannel(
+            connector=self.connector, data=channel_payload(15)
+        )
+        await channel.mark_as_read()
+        await channel.mark_as_read(12)
+
+        self.assertEqual(self.http.marked, [(10, 15), (10, 12)])
+        self.assertEqual(channel.last_read_id, 15)
+
+    async def test_no_messages(self):
+        channel = ChatChannel(connector=self.connector, data=channel_payload())
+        await channel.mark_as_read()
+
+        self.assertEqual(self.http.marked, [])
+
+    async def test_coalesce(self):
+        channel = ChatChannel(
+            connector=self.connector, data=channel_payload(15)
+        )
+        await channel.mark_as_read(12, coalesce=True)
+        await channel.mark_as_read(coalesce=True)
+        self.assertEqual(self.http.marked, [])
+
+        await self.connector.read_markers.flush()
+        self.assertEqual(self.http.marked, [(10, 15)])
+
+
+class TestReadMarkers(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = FakeHTTP()
+        self.markers = ReadMarkers(
+            Connector(http=self.http),
+            delay=0.01,
+            max_delay=0.05,
+            notification_delay=0.01,
+            retries=2,
+        )
+
+    async def asyncTearDown(self):
+        await self.markers.close()
+
+    async def test_debounce_sends_highest(self):
+        for message_id in (3, 5, 4):
+            self.markers.mark_channel(10, message_id)
+        self.markers.mark_channel(11, 1)
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(sorted(self.http.marked), [(10, 5), (11, 1)])
+
+        # Marks at or below the sent one are ignored
+        self.markers.mark_channel(10, 5)
+        self.assertEqual(self.markers._pending, {})
+
+    async def test_failed_mark_is_requeued(self):
+        self.http.failures = 2
+        with self.assertLogs("pyosu.markers", level="WARNING"):
+            self.markers.mark_channel(10, 5)
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(self.http.marked, [(10, 5)])
+        self.assertEqual(self.markers._pending, {})
+        self.assertEqual(self.markers._failures, {})
+
+    async def test_failed_mark_keeps_newer(self):
+        self.http.failures = 1
+        with self.assertLogs("pyosu.markers", level="WARNING"):
+            self.markers.mark_channel(10, 5)
+            await self.markers.flush()
+
+        self.markers.mark_channel(10, 7)
+        await self.markers.flush()
+
+        self.assertEqual(self.http.marked, [(10, 7)])
+
+    async def test_mark_dropped_after_retries(self):
+        self.http.failures = 10
+        with self.assertLogs("pyosu.markers", level="ERROR"):
+            self.markers.mark_channel(10, 5)
+            await asyncio.sleep(0.2)
+
+        self.assertEqual(self.http.failures, 7)
+        self.assertEqual(self.markers._pending, {})
+
+    async def test_notifications_batched(self):
+        self.markers.mark_notifications([3, 1])
+        self.markers.mark_notifications([2, 3])
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.http.notifications, [[1, 2, 3]])
+
+    async def test_failed_notifications_are_requeued(self):
+        self.http.failures = 1
+        with self.assertLogs("pyosu.markers", level="WARNING"):
+            self.markers.mark_notifications([1, 2])
+            await self.markers.flush()
+
+        self.markers.mark_notifications([3])
+        await self.markers.flush()
+
+        self.assertEqual(self.http.notifications, [[1, 2, 3]])
+
+    async def test_close_drops_failed(self):
+        self.http.failures = 10
+        self.markers.mark_channel(10, 5)
+        self.markers.mark_notifications([1])
+
+        with self.assertLogs("pyosu.markers", level="WARNING"):
+            await self.markers.close()
+
+        self.assertEqual(self.http.failures, 8)
+        self.assertEqual(self.markers._pending, {})
+        self.assertEqual(self.markers._timers, {})
+        self.assertIsNone(self.markers._notification_timer)
+
+
+if __name__ == "__main__":
+    unittest.main()
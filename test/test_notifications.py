@@ -0,0 +1,193 @@
+import asyncio
+import unittest
+
+from pyosu.client import Client
+from pyosu.connection import Connector
+from pyosu.enums import EventType
+from pyosu.http import HTTPClient
+from pyosu.notification import NotificationInbox, iter_notifications
+from pyosu.testing import NotificationServer
+from pyosu.websocket import NotificationSocket
+
+
+def notification(notification_id):
+    return {
+        "id": notification_id,
+        "name": "channel_message",
+        "created_at": "2022-03-01T10:00:00+00:00",
+        "object_type": "channel",
+        "object_id": 5,
+        "source_user_id": 2,
+        "is_read": False,
+        "details": {},
+    }
+
+
+class TestNotificationSocket(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = NotificationServer(token="token")
+        await self.server.start()
+
+        self.http = HTTPClient()
+        self.http.token = "token"
+        self.http.get_notifications = self.get_notifications
+        self.listed = [notification(1)]
+
+        self.socket = NotificationSocket(
+            Connector(http=self.http),
+            endpoint=self.server.url,
+            min_backoff=0.01,
+        )
+        self.events = []
+        self.socket.add_handler(EventType.Notification, self.on_event)
+        self.socket.add_handler(EventType.NotificationRead, self.on_event)
+        self.socket.add_handler(EventType.Message, self.on_event)
+
+    async def asyncTearDown(self):
+        await self.socket.stop()
+        await self.socket.bus.close()
+        await self.server.close()
+        await self.http.close_session()
+
+    async def get_notifications(self, max_id=None):
+        return {
+            "has_more": False,
+            "notifications": self.listed,
+            "unread_count": len(self.listed),
+            "notification_endpoint": self.server.url,
+        }
+
+    async def on_event(self, value):
+        self.events.append(value)
+
+    async def wait_events(self, count):
+        for _ in range(200):
+            await self.socket.bus.join()
+            if len(self.events) >= count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"Expected {count} events, got {self.events}")
+
+    async def test_frames(self):
+        self.socket.start()
+        await self.server.wait_for(received=1)
+        self.assertEqual(self.server.received, [{"event": "chat.start"}])
+
+        await self.server.send_notification(notification(2))
+        await self.server.send_read([2])
+        await self.server.send_messages(
+            [
+                {
+                    "message_id": 10,
+                    "channel_id": 5,
+                    "sender_id": 2,
+                    "timestamp": "2022-03-01T10:00:00+00:00",
+                    "content": "hello",
+                    "is_action": False,
+                }
+            ]
+        )
+        await self.wait_events(3)
+
+        self.assertEqual(self.events[0].id, 2)
+        self.assertEqual(self.events[1], [2])
+        self.assertEqual(self.events[2].content, "hello")
+
+    async def test_resume_after_reconnect(self):
+        self.socket.start()
+        await self.server.wait_for(connections=1)
+        while self.socket.last_id is None:
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.socket.last_id, 1)
+
+        await self.server.drop()
+        self.listed = [notification(3), notification(2), notification(1)]
+        await self.server.wait_for(connections=2)
+        await self.wait_events(2)
+
+        self.assertEqual([n.id for n in self.events], [2, 3])
+        self.assertEqual(self.socket.last_id, 3)
+
+    async def test_fallback_polling(self):
+        await self.server.close()
+        self.socket.fallback_after = 1
+        self.socket.start()
+        await asyncio.sleep(0.05)
+
+        self.listed = [notification(4), notification(1)]
+        await self.wait_events(1)
+        self.assertEqual(self.events[0].id, 4)
+
+
+class TestNotificationInbox(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pages = {
+            None: [notification(5), notification(4)],
+            3: [notification(3), notification(2)],
+            1: [notification(1)],
+        }
+        self.requested = []
+
+        http = HTTPClient()
+        http.get_notifications = self.get_notifications
+        self.connector = Connector(http=http)
+        self.inbox = NotificationInbox(self.connector)
+
+    async def get_notifications(self, max_id=None):
+        self.requested.append(max_id)
+        return {
+            "has_more": max_id != 1,
+            "notifications": self.pages[max_id],
+            "unread_count": 0,
+            "notification_endpoint": "",
+        }
+
+    async def test_iter_notifications(self):
+        ids = [n.id async for n in iter_notifications(self.connector)]
+        self.assertEqual(ids, [5, 4, 3, 2, 1])
+        self.assertEqual(self.requested, [None, 3, 1])
+
+    async def test_sync_deltas(self):
+        changes = await self.inbox.sync()
+        self.assertEqual(len(changes.new), 5)
+
+        self.requested.clear()
+        self.pages[None] = [notification(6), dict(notification(5))]
+        self.pages[None][1]["is_read"] = True
+        changes = await self.inbox.sync()
+
+        self.assertEqual(self.requested, [None])
+        self.assertEqual([n.id for n in changes.new], [6])
+        self.assertEqual([n.id for n in changes.read], [5])
+        self.assertEqual(len(self.inbox.unread), 5)
+
+    async def test_groups(self):
+        await self.inbox.sync()
+        self.inbox.notifications[2].object_id = 6
+
+        groups = self.inbox.groups()
+        self.assertEqual([n.id for n in groups[("channel", 5)]], [5, 4, 3, 1])
+        self.assertEqual([n.id for n in groups[("channel", 6)]], [2])
+
+
+class TestClientNotifier(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+
+    async def asyncTearDown(self):
+        await self.client.http.close_session()
+        self.client.loop.close()
+
+    async def test_chat_only_from_poller(self):
+        self.assertFalse(self.client.notifier.chat)
+        self.assertIs(self.client.notifier.bus, self.client.poller.bus)
+
+    async def test_inbox_is_attached_on_first_use(self):
+        events = self.client.events
+        self.assertFalse(events.has_subscribers(EventType.Notification))
+
+        inbox = self.client.inbox
+        self.assertIs(self.client.inbox, inbox)
+        self.assertTrue(events.has_subscribers(EventType.Notification))
+        self.assertTrue(events.has_subscribers(EventType.NotificationRead))
+        await events.close()
@@ -0,0 +1,161 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from pyosu.channel import ChatChannel
+from pyosu.connection import Connector
+from pyosu.outbox import MessageQueue
+from pyosu.ratelimit import TokenBucket
+
+
+def channel_payload(channel_id, type="PUBLIC", users=()):
+    return {
+        "channel_id": channel_id,
+        "name": f"#channel{channel_id}",
+        "icon": None,
+        "type": type,
+        "moderated": False,
+        "users": list(users),
+    }
+
+
+def message_payload(message_id, channel_id, content):
+    return {
+        "message_id": message_id,
+        "channel_id": channel_id,
+        "sender_id": 1,
+        "timestamp": "2022-03-01T10:00:00+00:00",
+        "content": content,
+        "is_action": False,
+    }
+
+
+class FakeHTTP:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.sent = []
+        self.created = []
+
+    async def send_message_to_channel(self, channel_id, message, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("send failed")
+
+        self.sent.append((channel_id, message))
+        return message_payload(len(self.sent), channel_id, message)
+
+    async def create_new_pm(self, user_id, message, **kwargs):
+        self.created.append((user_id, message))
+        channel_id = 100 + user_id
+        return {
+            "channel": channel_payload(channel_id, "PM", [1, user_id]),
+            "message": message_payload(0, channel_id, message),
+        }
+
+
+class TestMessageQueue(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = FakeHTTP()
+        self.connector = Connector(http=self.http)
+        self.connector.user = SimpleNamespace(id=1)
+        self.queue = MessageQueue(
+            self.connector, channel_rate=100, retry_delay=0
+        )
+
+    async def asyncTearDown(self):
+        await self.queue.close(flush=False)
+
+    async def test_merges_queued_messages(self):
+        futures = [self.queue.send(10, f"hello {i}") for i in range(3)]
+        messages = await asyncio.gather(*futures)
+
+        self.assertEqual(self.http.sent, [(10, "hello 0 | hello 1 | hello 2")])
+        self.assertEqual({m.id for m in messages}, {1})
+        self.assertEqual(len(self.queue), 0)
+
+    async def test_merge_respects_max_length(self):
+        self.queue.max_length = 10
+        await asyncio.gather(
+            *(self.queue.send(10, content) for content in ("abcd", "ef", "g"))
+        )
+
+        self.assertEqual(self.http.sent, [(10, "abcd | ef"), (10, "g")])
+
+    async def test_pm_channel_created_once(self):
+        user = SimpleNamespace(id=5, pm_channel=None)
+        first = self.queue.send(user, "hi")
+        await first
+        await self.queue.send(user, "again")
+
+        self.assertEqual(self.http.created, [(5, "hi")])
+        self.assertEqual(self.http.sent, [(105, "again")])
+
+    async def test_recipient_key_normalised(self):
+        user = SimpleNamespace(id=5, pm_channel=None)
+        channel = ChatChannel(
+            connector=self.connector,
+            data=channel_payload(105, "PM", [1, 5]),
+        )
+
+        self.assertEqual(self.queue._key(user), ("user", 5))
+        self.assertEqual(self.queue._key(channel), ("user", 5))
+        self.assertEqual(self.queue._key(105), ("user", 5))
+        self.assertEqual(self.queue._key(10), ("channel", 10))
+
+        await asyncio.gather(
+            self.queue.send(user, "one"),
+            self.queue.send(channel, "two"),
+            self.queue.send(105, "three"),
+        )
+
+        self.assertEqual(self.http.sent, [(105, "one | two | three")])
+
+    async def test_retries_failed_send(self):
+        self.http.failures = 2
+        message = await self.queue.send(10, "hello")
+
+        self.assertEqual(message.content, "hello")
+        self.assertEqual(self.http.sent, [(10, "hello")])
+
+    async def test_gives_up_after_retries(self):
+        self.http.failures = 5
+        self.queue.retries = 1
+
+        with self.assertRaises(RuntimeError):
+            await self.queue.send(10, "hello")
+
+        self.assertEqual(self.http.failures, 3)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_outside_loop(self):
+        bucket = TokenBucket(1, 2)
+        self.assertTrue(bucket.try_acquire())
+        self.assertLess(bucket.tokens, 2)
+        self.assertIn("capacity=2", repr(bucket))
+
+    def test_try_acquire(self):
+        bucket = TokenBucket(0.001, 2)
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+class TestTokenBucketAcquire(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_waits(self):
+        bucket = TokenBucket(100, 1)
+        await bucket.acquire()
+        await asyncio.wait_for(bucket.acquire(), 1)
+        self.assertLess(bucket.tokens, 1)
+
+    async def test_acquire_over_capacity(self):
+        with self.assertRaises(ValueError):
+            await TokenBucket(1, 2).acquire(3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,293 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from pyosu.connection import Connector
+from pyosu.enums import ScoreType
+from pyosu.client import Client
+from pyosu.pagination import (
+    CursorPaginator,
+    fetch_offset_pages,
+    paginate_offset,
+)
+from pyosu.user import User
+
+from payloads import user_payload
+
+
+class FakePages:
+    """Offset endpoint over `total` integers that records requests."""
+
+    def __init__(self, total, delay=0.01):
+        self.total = total
+        self.delay = delay
+        self.requests = []
+        self.cancelled = []
+
+    async def __call__(self, offset, limit):
+        self.requests.append((offset, limit))
+        try:
+            # The first page answers right away, later ones are slow
+            await asyncio.sleep(self.delay if offset else 0)
+        except asyncio.CancelledError:
+            self.cancelled.append(offset)
+            raise
+        return list(range(offset, min(offset + limit, self.total)))
+
+
+def user():
+    return User(connector=Connector(http=None), data=user_payload(2))
+
+
+class TestPaginateOffset(unittest.IsolatedAsyncioTestCase):
+    async def test_yields_all_pages_in_order(self):
+        fetch = FakePages(120)
+        items = [i async for i in paginate_offset(fetch, page_size=50)]
+
+        self.assertEqual(items, list(range(120)))
+        self.assertEqual([o for o, _ in fetch.requests][:3], [0, 50, 100])
+
+    async def test_prefetches_ahead(self):
+        fetch = FakePages(500)
+        iterator = paginate_offset(fetch, page_size=10, prefetch=2)
+
+        self.assertEqual(await iterator.__anext__(), 0)
+        self.assertEqual([o for o, _ in fetch.requests], [0, 10, 20])
+        await iterator.aclose()
+
+    async def test_early_exit_cancels_prefetch(self):
+        fetch = FakePages(500, delay=0.05)
+        iterator = paginate_offset(fetch, page_size=10, prefetch=3)
+
+        async for item in iterator:
+            if item == 2:
+                break
+
+        await iterator.aclose()
+        await asyncio.sleep(0)
+        self.assertEqual(sorted(fetch.cancelled), [10, 20, 30])
+
+    async def test_abandoned_iterator_cancels_prefetch(self):
+        fetch = FakePages(500, delay=0.05)
+
+        async for item in paginate_offset(fetch, page_size=10, prefetch=1):
+            break
+
+        # The event loop closes abandoned async generators
+        await asyncio.sleep(0.01)
+        self.assertEqual(fetch.cancelled, [10])
+
+    async def test_limit_and_offset(self):
+        fetch = FakePages(500)
+        iterator = paginate_offset(fetch, page_size=10, limit=25, offset=5)
+        items = [i async for i in iterator]
+
+        self.assertEqual(items, list(range(5, 30)))
+        self.assertEqual(fetch.requests, [(5, 10), (15, 10), (25, 5)])
+
+
+class TestFetchOffsetPages(unittest.IsolatedAsyncioTestCase):
+    async def test_requests_every_page_up_front(self):
+        fetch = FakePages(95)
+        items = await fetch_offset_pages(fetch, 95, page_size=10, key=None)
+
+        self.assertEqual(items, list(range(95)))
+        self.assertEqual(len(fetch.requests), 10)
+        self.assertEqual(
+            sorted(o for o, _ in fetch.requests), list(range(0, 100, 10))
+        )
+
+    async def test_keeps_order_with_out_of_order_pages(self):
+        async def fetch(offset, limit):
+            await asyncio.sleep(0.01 * (5 - offset // 10))
+            return list(range(offset, offset + limit))[: max(0, 45 - offset)]
+
+        items = await fetch_offset_pages(fetch, 45, page_size=10, key=None)
+        self.assertEqual(items, list(range(45)))
+
+    async def test_drops_shifted_duplicates(self):
+        async def fetch(offset, limit):
+            # An item was inserted at the top while paging, so every
+            # page after the first repeats the last item of the previous
+            start = offset - 1 if offset else 0
+            return [{"id": i} for i in range(start, min(start + limit, 30))]
+
+        items = await fetch_offset_pages(
+            fetch, 30, page_size=10, key=lambda item: item["id"]
+        )
+        self.assertEqual([i["id"] for i in items], list(range(30)))
+
+    async def test_reads_past_stale_total(self):
+        fetch = FakePages(35)
+        items = await fetch_offset_pages(fetch, 20, page_size=10, key=None)
+        self.assertEqual(items, list(range(35)))
+
+    async def test_failure_cancels_siblings(self):
+        fetch = FakePages(100, delay=0.05)
+
+        async def failing(offset, limit):
+            if offset == 10:
+                raise RuntimeError("boom")
+            return await fetch(offset, limit)
+
+        with self.assertRaises(RuntimeError):
+            await fetch_offset_pages(failing, 100, page_size=10, key=None)
+
+        await asyncio.sleep(0)
+        self.assertEqual(len(fetch.cancelled), 8)
+
+
+class FakeCursorPages:
+    """Cursor endpoint over `total` integers, `page_size` per page."""
+
+    def __init__(self, total, page_size=10):
+        self.total = total
+        self.page_size = page_size
+        self.cursors = []
+
+    async def __call__(self, cursor):
+        self.cursors.append(cursor)
+        await asyncio.sleep(0)
+        start = cursor or 0
+        end = min(start + self.page_size, self.total)
+        return list(range(start, end)), end if end < self.total else None
+
+
+class TestCursorPaginator(unittest.IsolatedAsyncioTestCase):
+    async def test_follows_cursor(self):
+        fetch = FakeCursorPages(25)
+        paginator = CursorPaginator(fetch)
+
+        self.assertEqual([i async for i in paginator], list(range(25)))
+        self.assertEqual(fetch.cursors, [None, 10, 20])
+        self.assertTrue(paginator.exhausted)
+        self.assertIsNone(paginator.cursor)
+
+    async def test_resume_after_limit(self):
+        fetch = FakeCursorPages(40)
+        first = CursorPaginator(fetch, limit=15)
+        items = [i async for i in first]
+
+        self.assertEqual(items, list(range(15)))
+        self.assertEqual((first.cursor, first.offset), (10, 5))
+        self.assertFalse(first.exhausted)
+
+        rest = CursorPaginator(fetch, cursor=first.cursor, offset=first.offset)
+        self.assertEqual([i async for i in rest], list(range(15, 40)))
+
+    async def test_resume_after_break(self):
+        fetch = FakeCursorPages(40)
+        first = CursorPaginator(fetch)
+        iterator = first.__aiter__()
+
+        items = [await iterator.__anext__() for _ in range(13)]
+        await iterator.aclose()
+
+        rest = CursorPaginator(fetch, cursor=first.cursor, offset=first.offset)
+        self.assertEqual(items + [i async for i in rest], list(range(40)))
+
+    async def test_limit_on_page_boundary(self):
+        fetch = FakeCursorPages(40)
+        paginator = CursorPaginator(fetch, limit=20)
+
+        self.assertEqual(len([i async for i in paginator]), 20)
+        self.assertEqual((paginator.cursor, paginator.offset), (20, 0))
+        # The page after the limit is never requested
+        self.assertEqual(fetch.cursors, [None, 10])
+
+    async def test_key_skips_duplicates_by_raw_offset(self):
+        pages = {None: ([1, 2, 2, 3], "b"), "b": ([3, 4], None)}
+
+        async def fetch(cursor):
+            return pages[cursor]
+
+        first = CursorPaginator(fetch, limit=2, key=lambda i: i)
+        self.assertEqual([i async for i in first], [1, 2])
+        # The repeated 2 is consumed with the page
+        self.assertEqual((first.cursor, first.offset), (None, 3))
+
+        # 3 shifted to the next page as well
+        self.assertEqual([i async for i in first], [3, 4])
+        self.assertTrue(first.exhausted)
+
+
+class TestIterRankings(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+        self.client.http.get_rankings = self.get_rankings
+        self.cursors = []
+
+    async def asyncTearDown(self):
+        await self.client.http.close_session()
+        self.client.loop.close()
+
+    async def get_rankings(self, *, cursor=None, **kwargs):
+        self.cursors.append(cursor)
+        page = (cursor or {}).get("page", 1)
+        ranking = [
+            {
+                "pp": 1000.0 - rank,
+                "global_rank": rank,
+                "user": user_payload(rank),
+            }
+            for rank in range(page * 3 - 2, page * 3 + 1)
+        ]
+        return {
+            "ranking": ranking,
+            "cursor": {"page": page + 1} if page < 3 else None,
+            "total": 9,
+        }
+
+    async def test_iterates_and_caches_users(self):
+        entries = [e async for e in self.client.iter_rankings()]
+
+        self.assertEqual([e.global_rank for e in entries], list(range(1, 10)))
+        self.assertEqual(self.cursors, [None, {"page": 2}, {"page": 3}])
+        self.assertIs(entries[4].user, self.client._connection.users[5])
+
+    async def test_resume(self):
+        first = self.client.iter_rankings(limit=4)
+        seen = [e.global_rank async for e in first]
+
+        rest = self.client.iter_rankings(
+            cursor=first.cursor, offset=first.offset
+        )
+        seen += [e.global_rank async for e in rest]
+        self.assertEqual(seen, list(range(1, 10)))
+
+
+class TestUserIterators(unittest.IsolatedAsyncioTestCase):
+    async def test_iter_scores_pages_fetch_scores(self):
+        u = user()
+        fetch = FakePages(7)
+        calls = []
+
+        async def fetch_scores(type, *, limit, offset, **kwargs):
+            calls.append(type)
+            return await fetch(offset, limit)
+
+        u.fetch_scores = fetch_scores
+        items = [s async for s in u.iter_scores(ScoreType.best, page_size=3)]
+
+        self.assertEqual(items, list(range(7)))
+        self.assertEqual(fetch.requests[:3], [(0, 3), (3, 3), (6, 3)])
+        self.assertEqual(set(calls), {ScoreType.best})
+
+    async def test_fetch_all_firsts_uses_profile_count(self):
+        u = user()
+        u.scores_first_count = 25
+        fetch = FakePages(25)
+
+        async def fetch_scores(type, *, limit, offset, **kwargs):
+            return [SimpleNamespace(id=i) for i in await fetch(offset, limit)]
+
+        u.fetch_scores = fetch_scores
+        items = await u.fetch_all_scores(ScoreType.firsts, page_size=10)
+
+        self.assertEqual([s.id for s in items], list(range(25)))
+        # Three parallel pages, no sequential probe past the end
+        self.assertEqual(sorted(fetch.requests), [(0, 10), (10, 10), (20, 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from pyosu.connection import Connector
+from pyosu.dispatch import EventBus
+from pyosu.enums import EventType
+from pyosu.poller import ChatPoller
+
+
+def message(message_id, channel_id=10):
+    return {
+        "message_id": message_id,
+        "channel_id": channel_id,
+        "sender_id": 2,
+        "timestamp": "2022-03-01T10:00:00+00:00",
+        "content": f"message {message_id}",
+        "is_action": False,
+    }
+
+
+class FakeHTTP:
+    def __init__(self, messages):
+        self.messages = messages
+        self.requested = []
+
+    async def get_updates(self, *, since=0, limit=50, **kwargs):
+        self.requested.append(since)
+        found = [m for m in self.messages if m["message_id"] > since]
+        return {"messages": found[:limit], "silences": []}
+
+
+class FailingBus(EventBus):
+    def __init__(self, fail_on):
+        super().__init__()
+        self.fail_on = fail_on
+        self.published = []
+
+    async def publish(self, event, *args):
+        if event == EventType.Message and args[0].id == self.fail_on:
+            self.fail_on = None
+            raise RuntimeError("publish failed")
+
+        if event == EventType.Message:
+            self.published.append(args[0].id)
+
+
+class TestChatPoller(unittest.IsolatedAsyncioTestCase):
+    async def test_poll_advances_since(self):
+        http = FakeHTTP([message(i) for i in (4, 5, 6)])
+        bus = FailingBus(fail_on=None)
+        poller = ChatPoller(Connector(http=http), bus=bus, since=3)
+
+        self.assertEqual(await poller.poll_once(), 3)
+        self.assertEqual(poller.since, 6)
+        self.assertEqual(await poller.poll_once(), 0)
+        self.assertEqual(http.requested, [3, 6])
+        self.assertEqual(bus.published, [4, 5, 6])
+
+    async def test_resume_after_failed_publish(self):
+        http = FakeHTTP([message(i) for i in (4, 5, 6)])
+        bus = FailingBus(fail_on=5)
+        poller = ChatPoller(Connector(http=http), bus=bus, since=3)
+
+        with self.assertRaises(RuntimeError):
+            await poller.poll_once()
+
+        self.assertEqual(poller.since, 4)
+
+        self.assertEqual(await poller.poll_once(), 2)
+        self.assertEqual(http.requested, [3, 4])
+        self.assertEqual(bus.published, [4, 5, 6])
+        self.assertEqual(poller.since, 6)
+
+    async def test_silences_resume(self):
+        class SilenceHTTP(FakeHTTP):
+            async def get_updates(self, *, history_since=None, **kwargs):
+                data = await super().get_updates(**kwargs)
+                data["silences"] = [
+                    {"id": i, "user_id": i}
+                    for i in (8, 7)
+                    if i > (history_since or 0)
+                ]
+                return data
+
+        poller = ChatPoller(Connector(http=SilenceHTTP([])), since=0)
+        silenced = []
+
+        @poller.on(EventType.Silence)
+        async def on_silence(silence):
+            silenced.append(silence["id"])
+
+        await poller.poll_once()
+        await poller.poll_once()
+        await poller.bus.close()
+
+        self.assertEqual(poller.history_since, 8)
+        self.assertEqual(silenced, [7, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
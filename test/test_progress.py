@@ -0,0 +1,178 @@
+import asyncio
+import unittest
+
+from pyosu.client import Client
+from pyosu.connection import Connector
+from pyosu.progress import StatisticsRecorder
+from pyosu.user import User
+
+from payloads import user_payload
+
+DAY = 86400
+
+
+def user(pp, play_count, ranks=None, rank=100, mode="osu"):
+    data = user_payload(
+        2,
+        username="peppy",
+        is_supporter=True,
+        playmode="osu",
+        statistics={
+            "global_rank": rank,
+            "country_rank": 5,
+            "pp": pp,
+            "hit_accuracy": 98.1,
+            "play_count": play_count,
+            "level": {"current": 100, "progress": 50},
+        },
+    )
+    if ranks is not None:
+        data["rank_history"] = {"mode": mode, "data": ranks}
+    return data
+
+
+class TestStatisticsRecorder(unittest.TestCase):
+    def setUp(self):
+        self.connector = Connector(http=None)
+        self.recorder = StatisticsRecorder()
+
+    def tearDown(self):
+        self.recorder.close()
+
+    def record(self, data, day):
+        u = User(connector=self.connector, data=data)
+        return self.recorder.record(u, taken_at=day * DAY)
+
+    def test_user_keeps_statistics(self):
+        u = User(connector=self.connector, data=user(1000.0, 10, [3, 2, 1]))
+        self.assertEqual(u.statistics.pp, 1000.0)
+        self.assertEqual(u.statistics.user_id, 2)
+        self.assertEqual(u.rank_history["data"], [3, 2, 1])
+        self.assertEqual(u.to_payload()["statistics"]["play_count"], 10)
+
+    def test_unchanged_samples_are_skipped(self):
+        self.assertTrue(self.record(user(1000.0, 10), 1))
+        self.assertFalse(self.record(user(1000.0, 10), 2))
+        self.assertTrue(self.record(user(1010.0, 11), 3))
+
+        samples = self.recorder.samples(2, "osu")
+        self.assertEqual([s.taken_at for s in samples], [DAY, 3 * DAY])
+        self.assertEqual(samples[0].level, 100.5)
+
+    def test_range_and_downsample(self):
+        for hour in range(48):
+            self.recorder.record(
+                User(connector=self.connector, data=user(1000.0 + hour, hour)),
+                taken_at=hour * 3600,
+            )
+
+        samples = self.recorder.samples(2, start=3600, end=7200)
+        self.assertEqual([s.play_count for s in samples], [1, 2])
+
+        daily = self.recorder.samples(2, bucket=DAY)
+        self.assertEqual([s.play_count for s in daily], [23, 47])
+        self.assertEqual(daily[1].taken_at, 47 * 3600)
+
+    def test_rank_history_merges_days(self):
+        self.record(user(1000.0, 10, [30, 20, 10]), 10)
+        self.record(user(1000.0, 10, [20, 10, 5]), 11)
+
+        history = self.recorder.rank_history(2)
+        self.assertEqual(
+            history,
+            [(8 * DAY, 30), (9 * DAY, 20), (10 * DAY, 10), (11 * DAY, 5)],
+        )
+        self.assertEqual(len(self.recorder.rank_history(2, start=10 * DAY)), 2)
+
+    def test_rank_history_of_another_mode(self):
+        self.connector.statistics_recorder = self.recorder
+        self.connector._merge_user(user(1000.0, 10, [3, 2, 1]), "osu")
+
+        taiko = user(200.0, 5)
+        taiko["rank_history"] = None
+        cached = self.connector._merge_user(taiko, "taiko")
+
+        self.assertIsNone(cached.rank_history)
+        self.assertEqual(len(self.recorder.rank_history(2, "osu")), 3)
+        self.assertEqual(self.recorder.rank_history(2, "taiko"), [])
+        self.assertEqual(len(self.recorder.samples(2, "taiko")), 1)
+
+        # An explicit mode never files another mode's ranks
+        osu = User(connector=self.connector, data=user(1, 1, [9]))
+        self.recorder.record(osu, mode="mania")
+        self.assertEqual(self.recorder.rank_history(2, "mania"), [])
+
+
+class TestFetchAllModes(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+        self.client.http.get_user = self.get_user
+        self.recorder = self.client.open_statistics_recorder()
+        self.calls = []
+
+    async def asyncTearDown(self):
+        self.recorder.close()
+        await self.client.http.close_session()
+        self.client.loop.close()
+
+    async def get_user(self, user_id, mode=None):
+        self.calls.append(mode)
+        await asyncio.sleep(0.01)
+        mode = mode or "osu"
+        pp = {"osu": 1000.0, "taiko": 200.0, "fruits": 30.0, "mania": 4.0}
+        ranks = [int(pp[mode]) * 2, int(pp[mode])]
+        return user(pp[mode], 10, ranks, rank=len(self.calls), mode=mode)
+
+    async def test_modes_are_merged_into_cached_user(self):
+        cached, single = await asyncio.gather(
+            self.client.fetch_user_all_modes(2),
+            self.client.fetch_user(2, "mania"),
+        )
+
+        self.assertIs(cached, single)
+        self.assertIs(cached, self.client._connection.users[2])
+        # The unthrottled call does not wait on the throttled one
+        self.assertEqual(len(self.calls), 5)
+        self.assertEqual(cached.statistics.pp, 1000.0)
+        self.assertEqual(
+            {mode: s.pp for mode, s in cached.statistics_rulesets.items()},
+            {"osu": 1000.0, "taiko": 200.0, "fruits": 30.0, "mania": 4.0},
+        )
+        self.assertEqual(len(self.recorder.samples(2, "taiko")), 1)
+        self.assertEqual(
+            [rank for _, rank in self.recorder.rank_history(2, "taiko")],
+            [400, 200],
+        )
+        self.assertEqual(
+            [rank for _, rank in self.recorder.rank_history(2, "osu")],
+            [2000, 1000],
+        )
+        # The default mode is merged last
+        self.assertEqual(cached.rank_history["mode"], "osu")
+
+    async def test_batch(self):
+        users = await self.client.fetch_users_all_modes([2, 2])
+        self.assertIs(users[0], users[1])
+        self.assertEqual(len(self.calls), 4)
+
+    async def test_concurrent_fetches_share_request(self):
+        first, second = await asyncio.gather(
+            self.client.fetch_user(2, "taiko"),
+            self.client.fetch_user(2, "taiko"),
+        )
+
+        self.assertIs(first, second)
+        self.assertEqual(self.calls, ["taiko"])
+
+    async def test_empty_modes(self):
+        with self.assertRaises(ValueError):
+            await self.client.fetch_user_all_modes(2, ())
+
+        with self.assertRaises(ValueError):
+            await self.client.fetch_users_all_modes([2], ())
+
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
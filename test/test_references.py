@@ -0,0 +1,209 @@
+import unittest
+
+from pyosu.connection import Connector
+from pyosu.errors import NotFound
+from pyosu.event import Event
+from pyosu.references import resolve_references
+from pyosu.score import Score
+
+from payloads import score_payload, user_payload
+
+
+def beatmapset(beatmapset_id):
+    return {
+        "id": beatmapset_id,
+        "artist": "Artist",
+        "artist_unicode": "Artist",
+        "covers": {},
+        "creator": "peppy",
+        "favourite_count": 0,
+        "nsfw": False,
+        "play_count": 0,
+        "preview_url": "",
+        "source": "",
+        "status": "ranked",
+        "title": "Title",
+        "title_unicode": "Title",
+        "user_id": 2,
+        "video": False,
+    }
+
+
+def beatmap(beatmap_id):
+    return {
+        "id": beatmap_id,
+        "beatmapset_id": beatmap_id // 10,
+        "difficulty_rating": 5.0,
+        "mode": "osu",
+        "status": "ranked",
+        "total_length": 120,
+        "user_id": 2,
+        "version": "Insane",
+        "beatmapset": beatmapset(beatmap_id // 10),
+    }
+
+
+def score(score_id, beatmap_id, user_id):
+    return score_payload(score_id, user_id, beatmap={"id": beatmap_id})
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.calls = []
+
+    async def get_beatmaps(self, ids):
+        self.calls.append(("beatmaps", len(ids)))
+        return {"beatmaps": [beatmap(i) for i in ids if i != 404]}
+
+    async def get_users(self, ids):
+        self.calls.append(("users", len(ids)))
+        return {"users": [user_payload(i) for i in ids]}
+
+    async def get_beatmapset(self, beatmapset_id):
+        self.calls.append(("beatmapset", beatmapset_id))
+        if beatmapset_id == 404:
+            raise NotFound({})
+
+        return beatmapset(beatmapset_id)
+
+
+class TestResolveReferences(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = FakeHTTP()
+        self.connector = Connector(http=self.http)
+
+    async def test_scores_are_batched(self):
+        scores = [
+            Score(
+                connector=self.connector,
+                data=score(i, 1000 + i % 120, 10 + i % 75),
+            )
+            for i in range(1000)
+        ]
+        self.assertIsNone(scores[0].beatmap)
+
+        await resolve_references(self.connector, scores)
+
+        self.assertEqual(
+            sorted(self.http.calls),
+            [
+                ("beatmaps", 20),
+                ("beatmaps", 50),
+                ("beatmaps", 50),
+                ("users", 25),
+                ("users", 50),
+            ],
+        )
+        self.assertIs(scores[5].beatmap, self.connector.beatmaps[1005])
+        self.assertIs(scores[5].user, self.connector.users[15])
+        self.assertIn(100, self.connector.beatmapsets)
+
+        self.http.calls.clear()
+        await resolve_references(self.connector, scores)
+        self.assertEqual(self.http.calls, [])
+
+    async def test_embedded_beatmaps_are_not_fetched(self):
+        embedded = score(1, 1234, 2)
+        embedded["beatmap"] = beatmap(1234)
+        embedded["beatmapset"] = beatmapset(123)
+        bare = Score(connector=self.connector, data=score(2, 5678, 2))
+        scores = [Score(connector=self.connector, data=embedded), bare]
+
+        self.assertIs(scores[0].beatmap, self.connector.beatmaps[1234])
+        self.assertIs(scores[0].beatmapset, self.connector.beatmapsets[123])
+        self.assertIsNone(bare.beatmapset)
+
+        await resolve_references(self.connector, scores)
+
+        self.assertEqual(
+            sorted(self.http.calls), [("beatmaps", 1), ("users", 1)]
+        )
+        self.assertIs(bare.beatmap, self.connector.beatmaps[5678])
+        self.assertIs(bare.beatmapset, self.connector.beatmapsets[567])
+        self.assertEqual(bare.to_payload()["beatmapset_id"], 567)
+
+    async def test_events(self):
+        events = [
+            Event(
+                data={
+                    "id": 1,
+                    "created_at": "2022-03-02T12:30:00+00:00",
+                    "type": "rank",
+                    "beatmap": {"title": "A", "url": "/b/1234?m=0"},
+                    "user": {"username": "peppy", "url": "/u/2"},
+                }
+            ),
+            Event(
+                data={
+                    "id": 2,
+                    "created_at": "2022-03-02T12:30:00+00:00",
+                    "type": "beatmapsetApprove",
+                    "beatmapset": {"title": "B", "url": "/s/77"},
+                    "user": {"username": "peppy", "url": "/u/2"},
+                }
+            ),
+            Event(
+                data={
+                    "id": 3,
+                    "created_at": "2022-03-02T12:30:00+00:00",
+                    "type": "rank",
+                    "beatmap": {"title": "C", "url": "/b/404?m=0"},
+                }
+            ),
+        ]
+        self.assertEqual(events[0].beatmap_id, 1234)
+
+        await resolve_references(self.connector, events)
+
+        self.assertEqual(
+            sorted(self.http.calls),
+            [("beatmaps", 2), ("beatmapset", 77), ("users", 1)],
+        )
+        self.assertIs(events[0].cached_beatmap, self.connector.beatmaps[1234])
+        self.assertEqual(events[0].cached_beatmapset.id, 123)
+        self.assertIs(events[0].cached_user, self.connector.users[2])
+        self.assertEqual(events[1].cached_beatmapset.id, 77)
+        self.assertIsNone(events[2].cached_beatmap)
+        self.assertEqual(events[0].to_payload()["beatmap"]["title"], "A")
+
+    async def test_missing_beatmapset(self):
+        events = [
+            Event(
+                data={
+                    "id": i,
+                    "created_at": "2022-03-02T12:30:00+00:00",
+                    "type": "beatmapsetApprove",
+                    "beatmapset": {"title": "B", "url": f"/s/{set_id}"},
+                    "user": {"username": "peppy", "url": "/u/2"},
+                }
+            )
+            for i, set_id in enumerate((404, 77))
+        ]
+
+        await resolve_references(self.connector, events)
+
+        self.assertIsNone(events[0].cached_beatmapset)
+        self.assertEqual(events[1].cached_beatmapset.id, 77)
+        self.assertIs(events[0].cached_user, self.connector.users[2])
+
+    async def test_cached_users_keep_full_fields(self):
+        full = user_payload(15)
+        full["statistics"] = {"pp": 1234.5, "global_rank": 100}
+        get_users = self.http.get_users
+
+        async def cached_meanwhile(ids):
+            # Another request cached the full profile while this one ran
+            self.connector._add_user_cache(full)
+            return await get_users(ids)
+
+        self.http.get_users = cached_meanwhile
+        scores = [Score(connector=self.connector, data=score(1, 1000, 15))]
+        await resolve_references(self.connector, scores)
+
+        cached = self.connector.users[15]
+        self.assertIs(scores[0].user, cached)
+        self.assertEqual(cached.to_payload()["statistics"]["pp"], 1234.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from pyosu.client import Client
+from pyosu.connection import Connector
+from pyosu.errors import NotFound
+from pyosu.resolver import BeatmapResolver
+
+
+def beatmap(beatmap_id, checksum=None, version="Insane"):
+    return {
+        "id": beatmap_id,
+        "beatmapset_id": beatmap_id // 10,
+        "difficulty_rating": 5.0,
+        "mode": "osu",
+        "status": "ranked",
+        "total_length": 120,
+        "user_id": 2,
+        "version": version,
+        "checksum": checksum or f"md5-{beatmap_id}",
+    }
+
+
+class FakeHTTP:
+    def __init__(self, known):
+        self.known = known
+        self.lookups = []
+
+    async def lookup_beatmap(self, beatmap_id=None, **kwargs):
+        self.lookups.append(kwargs)
+        await asyncio.sleep(0)
+
+        value = kwargs.get("checksum") or kwargs.get("filename")
+        if value == "broken":
+            raise RuntimeError("server error")
+        if value not in self.known:
+            raise NotFound({"error": None})
+
+        return beatmap(self.known[value])
+
+
+class TestBeatmapResolver(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "beatmaps.db")
+        self.http = FakeHTTP({"md5-10": 10, "song.osu": 20})
+        self.connector = Connector(http=self.http)
+        self.resolver = BeatmapResolver(self.connector, self.path)
+        self.connector.beatmap_index = self.resolver
+
+    async def asyncTearDown(self):
+        self.resolver.close()
+        self.dir.cleanup()
+
+    def stored(self, table):
+        # A second connection only sees committed rows
+        db = sqlite3.connect(self.path)
+        try:
+            return dict(db.execute(f"SELECT * FROM {table}"))
+        finally:
+            db.close()
+
+    async def test_single_add_is_committed(self):
+        self.connector._add_beatmap_cache(beatmap(30))
+
+        self.assertEqual(self.stored("checksums"), {"md5-30": 30})
+        self.assertFalse(self.resolver._db.in_transaction)
+
+    async def test_bulk_add_commits_once(self):
+        self.connector._add_beatmaps_cache([beatmap(30), beatmap(31)])
+
+        self.assertEqual(
+            self.stored("checksums"), {"md5-30": 30, "md5-31": 31}
+        )
+        self.assertFalse(self.resolver._db.in_transaction)
+
+    async def test_index_is_reloaded(self):
+        self.connector._add_beatmap_cache(beatmap(30))
+        self.resolver.close()
+
+        self.resolver = BeatmapResolver(self.connector, self.path)
+        self.assertEqual(self.resolver.get(checksum="md5-30"), 30)
+
+    async def test_resolve_from_index(self):
+        self.connector._add_beatmap_cache(beatmap(30))
+
+        found = await self.resolver.resolve(checksum="md5-30")
+
+        self.assertIs(found, self.connector.beatmaps[30])
+        self.assertEqual(self.http.lookups, [])
+        self.assertEqual(self.resolver.hits, 1)
+
+    async def test_concurrent_misses_share_lookup(self):
+        ids = await asyncio.gather(
+            *(self.resolver.resolve_id(checksum="md5-10") for _ in range(3))
+        )
+
+        self.assertEqual(ids, [10, 10, 10])
+        self.assertEqual(self.http.lookups, [{"checksum": "md5-10"}])
+        self.assertEqual(self.resolver.misses, 1)
+        self.assertIn(10, self.connector.beatmaps)
+
+    async def test_filename_lookup(self):
+        self.assertEqual(
+            await self.resolver.resolve_id(filename="song.osu"), 20
+        )
+        self.assertEqual(self.stored("filenames"), {"song.osu": 20})
+
+    async def test_unknown_keys_are_remembered(self):
+        for _ in range(2):
+            found = await self.resolver.resolve(checksum="missing")
+            self.assertIsNone(found)
+
+        self.assertEqual(len(self.http.lookups), 1)
+
+        self.resolver.negative_ttl = 0
+        self.resolver._unknown.clear()
+        await self.resolver.resolve_id(checksum="missing")
+        await self.resolver.resolve_id(checksum="missing")
+        self.assertEqual(len(self.http.lookups), 3)
+
+    async def test_other_errors_propagate(self):
+        with self.assertRaises(RuntimeError):
+            await self.resolver.resolve_id(checksum="broken")
+
+        self.assertNotIn(("checksum", "broken"), self.resolver._unknown)
+
+    async def test_requires_key(self):
+        with self.assertRaises(ValueError):
+            await self.resolver.resolve_id()
+
+
+class TestFetchBeatmap(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+        self.client.http.get_beatmap = self.get_beatmap
+        self.resolver = self.client.open_beatmap_resolver()
+        self.version = "Insane"
+
+    async def asyncTearDown(self):
+        self.resolver.close()
+        await self.client.http.close_session()
+        self.client.loop.close()
+
+    async def get_beatmap(self, beatmap_id):
+        return beatmap(beatmap_id, version=self.version)
+
+    async def test_fetch_beatmap_is_cached(self):
+        first = await self.client.fetch_beatmap(30)
+        self.version = "Extra"
+        second = await self.client.fetch_beatmap(30)
+
+        self.assertIs(first, second)
+        self.assertIs(self.client._connection.beatmaps[30], first)
+        self.assertEqual(first.version, "Extra")
+        self.assertEqual(self.resolver.get(checksum="md5-30"), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
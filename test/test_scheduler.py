@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+
+from pyosu.scheduler import PollScheduler
+
+
+class TestPollScheduler(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.polls = []
+        self.delays = {}
+        self.scheduler = PollScheduler(self.poll, concurrency=1)
+        self.task = None
+
+    async def asyncTearDown(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+
+    async def poll(self, key):
+        self.polls.append(key)
+        delays = self.delays.get(key)
+        return delays.pop(0) if delays else None
+
+    async def run_for(self, seconds):
+        self.task = asyncio.ensure_future(self.scheduler.run())
+        await asyncio.sleep(seconds)
+
+    async def test_due_order(self):
+        for key, delay in ((1, 0.03), (2, 0.01), (3, 0.02)):
+            self.scheduler.schedule(key, delay)
+
+        await self.run_for(0.06)
+
+        self.assertEqual(self.polls, [2, 3, 1])
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_schedule_replaces_previous(self):
+        self.scheduler.schedule(1, 0.01)
+        self.scheduler.schedule(2, 0.02)
+        self.scheduler.schedule(1, 0.03)
+
+        await self.run_for(0.06)
+
+        self.assertEqual(self.polls, [2, 1])
+
+    async def test_schedule_while_running(self):
+        await self.run_for(0.01)
+        self.scheduler.schedule(1, 0.02)
+        self.scheduler.schedule(2, 0)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.polls, [2, 1])
+
+    async def test_cancel(self):
+        self.scheduler.schedule(1, 0.01)
+        self.scheduler.schedule(2, 0.02)
+        self.scheduler.cancel(1)
+
+        await self.run_for(0.05)
+
+        self.assertEqual(self.polls, [2])
+        self.assertNotIn(1, self.scheduler)
+
+    async def test_poll_reschedules(self):
+        self.delays = {1: [0.01, 0.01], 2: [0.05]}
+        self.scheduler.schedule(1, 0)
+        self.scheduler.schedule(2, 0)
+
+        await self.run_for(0.04)
+
+        self.assertEqual(self.polls, [1, 2, 1, 1])
+        self.assertEqual(list(self.scheduler.due), [2])
+
+    async def test_failed_poll_stops_key(self):
+        async def poll(key):
+            raise RuntimeError("poll failed")
+
+        self.scheduler = PollScheduler(poll)
+        self.scheduler.schedule(1, 0)
+
+        with self.assertLogs("pyosu.scheduler"):
+            await self.run_for(0.02)
+
+        self.assertNotIn(1, self.scheduler)
+
+    async def test_concurrency(self):
+        running = []
+        peak = []
+        release = asyncio.Event()
+
+        async def poll(key):
+            running.append(key)
+            peak.append(len(running))
+            await release.wait()
+            running.remove(key)
+
+        self.scheduler = PollScheduler(poll, concurrency=2)
+        for key in range(5):
+            self.scheduler.schedule(key, 0)
+
+        await self.run_for(0.02)
+        self.assertEqual(running, [0, 1])
+
+        release.set()
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(len(peak), 5)
+
+    async def test_resume_after_stop(self):
+        started = asyncio.Event()
+
+        async def poll(key):
+            self.polls.append(key)
+            started.set()
+            await asyncio.sleep(1)
+
+        self.scheduler = PollScheduler(poll)
+        self.scheduler.schedule(1, 0)
+
+        await self.run_for(0)
+        await started.wait()
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+        # The cancelled poll never rescheduled itself
+        self.assertIn(1, self.scheduler)
+
+        await self.run_for(0.01)
+        self.assertEqual(self.polls, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import os
+import tempfile
+import unittest
+
+from pyosu.client import Client
+from pyosu.connection import Connector
+from pyosu.search import BeatmapsetIndex, tokenize
+
+
+def beatmap(beatmap_id, beatmapset_id, difficulty, length, mode="osu"):
+    return {
+        "id": beatmap_id,
+        "beatmapset_id": beatmapset_id,
+        "difficulty_rating": difficulty,
+        "mode": mode,
+        "status": "ranked",
+        "total_length": length,
+        "user_id": 2,
+        "version": "Insane",
+        "bpm": 180,
+    }
+
+
+def beatmapset(beatmapset_id, title, artist, tags, beatmaps, play_count=0):
+    return {
+        "id": beatmapset_id,
+        "artist": artist,
+        "artist_unicode": artist,
+        "covers": {},
+        "creator": "peppy",
+        "favourite_count": 0,
+        "nsfw": False,
+        "play_count": play_count,
+        "preview_url": "",
+        "source": "",
+        "status": "ranked",
+        "title": title,
+        "title_unicode": title,
+        "user_id": 2,
+        "video": False,
+        "tags": tags,
+        "beatmaps": beatmaps,
+    }
+
+
+class TestBeatmapsetIndex(unittest.TestCase):
+    def setUp(self):
+        self.connector = Connector(http=None)
+        self.index = BeatmapsetIndex()
+        self.connector.beatmapset_index = self.index
+
+        for data in (
+            beatmapset(
+                1,
+                "Blue Zenith",
+                "xi",
+                "freedom dive",
+                [
+                    beatmap(10, 1, 6.8, 240),
+                ],
+                play_count=10,
+            ),
+            beatmapset(
+                2,
+                "FREEDOM DiVE",
+                "xi",
+                "blue",
+                [
+                    beatmap(20, 2, 7.5, 260),
+                    beatmap(21, 2, 3.2, 260, mode="taiko"),
+                ],
+                play_count=50,
+            ),
+            beatmapset(
+                3,
+                "Bluebird",
+                "Ikimono-gakari",
+                "anime",
+                [
+                    beatmap(30, 3, 4.1, 220),
+                ],
+            ),
+        ):
+            self.connector._add_beatmapset_cache(data)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("FREEDOM DiVE↓"), ["freedom", "dive"])
+
+    def test_prefix_search(self):
+        found = self.index.search("blu")
+        self.assertEqual({b.id for b in found}, {1, 2, 3})
+
+        found = self.index.search("freedom dive")
+        self.assertEqual([b.id for b in found], [2, 1])
+
+    def test_range_filters(self):
+        found = self.index.search("xi", difficulty=(7, None))
+        self.assertEqual([b.id for b in found], [2])
+
+        found = self.index.search(difficulty=(3, 4), mode="taiko")
+        self.assertEqual([b.id for b in found], [2])
+
+        found = self.index.search(length=(None, 230))
+        self.assertEqual([b.id for b in found], [3])
+
+    def test_cached_update_is_reindexed(self):
+        cached = self.connector.beatmapsets[3]
+        data = beatmapset(
+            3,
+            "Aoi Tori",
+            "Ikimono-gakari",
+            "anime",
+            [beatmap(30, 3, 4.1, 220), beatmap(31, 3, 8.0, 220)],
+        )
+
+        self.assertIs(self.connector._add_beatmapset_cache(data), cached)
+        self.assertEqual(cached.title, "Aoi Tori")
+        self.assertEqual([b.id for b in self.index.search("aoi")], [3])
+        self.assertEqual([b.id for b in self.index.search("bluebird")], [])
+
+        found = self.index.search("ikimono", difficulty=(7, None))
+        self.assertEqual([b.id for b in found], [3])
+
+    def test_compact_update_keeps_fields(self):
+        compact = beatmapset(3, "Bluebird", "Ikimono-gakari", None, [])
+        del compact["tags"], compact["beatmaps"]
+        compact["play_count"] = 99
+
+        cached = self.connector._add_beatmapset_cache(compact)
+
+        self.assertEqual(cached.play_count, 99)
+        self.assertEqual(cached.tags, "anime")
+        self.assertEqual([b.id for b in cached.beatmaps], [30])
+        self.assertEqual([b.id for b in self.index.search("anime")], [3])
+
+    def test_update_and_remove(self):
+        self.index.remove(3)
+        self.assertEqual(self.index.search("bluebird"), [])
+        self.assertNotIn("anime", self.index.postings)
+
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "index.json")
+            self.index.save(path)
+            loaded = BeatmapsetIndex.load(path, connector=Connector(None))
+
+        self.assertEqual(len(loaded), 3)
+        found = loaded.search("blue", difficulty=(6, 7))
+        self.assertEqual([b.id for b in found], [1])
+
+
+class TestSearchBeatmapsets(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+        self.client.http.search_beatmap = self.search_beatmap
+        self.requested = []
+        # Set 3 shifts from the first page to the second one
+        self.pages = {
+            None: ([1, 2, 3], "page2"),
+            "page2": ([3, 4], None),
+        }
+
+    async def asyncTearDown(self):
+        await self.client.http.close_session()
+        self.client.loop.close()
+
+    async def search_beatmap(self, query, *, mode, cursor_string, **kwargs):
+        self.requested.append((mode, cursor_string))
+        ids, cursor = self.pages[cursor_string]
+        return {
+            "beatmapsets": [
+                beatmapset(i, "Title", "Artist", "", []) for i in ids
+            ],
+            "cursor_string": cursor,
+        }
+
+    async def test_mode_name(self):
+        found = [
+            b.id async for b in self.client.search_beatmapsets(mode="mania")
+        ]
+
+        self.assertEqual(found, [1, 2, 3, 4])
+        self.assertEqual(self.requested, [(3, None), (3, "page2")])
+        self.assertIn(4, self.client._connection.beatmapsets)
+
+    async def test_resume_after_limit(self):
+        self.pages = {
+            None: ([1, 2, 3, 4], "page2"),
+            "page2": ([5, 6], None),
+        }
+        paginator = self.client.search_beatmapsets(limit=2)
+
+        self.assertEqual([b.id async for b in paginator], [1, 2])
+        self.assertEqual((paginator.cursor, paginator.offset), (None, 2))
+
+        paginator.limit = None
+        self.assertEqual([b.id async for b in paginator], [3, 4, 5, 6])
+
+    async def test_cursor_matches_page(self):
+        self.pages = {
+            None: ([1, 2], "page2"),
+            "page2": ([2], "page3"),
+            "page3": ([3], None),
+        }
+        paginator = self.client.search_beatmapsets()
+        found = []
+
+        async for beatmapset in paginator:
+            found.append((beatmapset.id, paginator.cursor))
+
+        self.assertEqual(found, [(1, None), (2, None), (3, "page3")])
+
+    async def test_mode_number(self):
+        [b async for b in self.client.search_beatmapsets(mode=1)]
+        self.assertEqual(self.requested[0], (1, None))
+
+    async def test_unknown_mode(self):
+        with self.assertRaisesRegex(ValueError, "'ctb'"):
+            self.client.search_beatmapsets(mode="ctb")
+
+        with self.assertRaises(ValueError):
+            self.client.search_beatmapsets(mode=4)
+
+        self.assertEqual(self.requested, [])
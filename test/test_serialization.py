@@ -0,0 +1,122 @@
+import unittest
+
+import pyosu
+from pyosu.connection import Connector
+from pyosu.event import Event
+from pyosu.kudosu import KudosuHistory
+
+USER = {
+    "id": 2,
+    "username": "peppy",
+    "avatar_url": "https://a.ppy.sh/2",
+    "country_code": "AU",
+    "default_group": "default",
+    "is_active": True,
+    "is_bot": False,
+    "is_deleted": False,
+    "is_online": False,
+    "is_supporter": True,
+    "pm_friends_only": False,
+    "last_visit": "2022-03-01T10:00:00+00:00",
+    "profile_colour": "#3366FF",
+    "join_date": "2007-08-28T03:09:12+00:00",
+}
+
+SCORE = {
+    "id": 4016305466,
+    "best_id": 3857040117,
+    "user_id": 2,
+    "accuracy": 0.9812,
+    "mods": ["HD"],
+    "score": 1234567,
+    "max_combo": 842,
+    "perfect": False,
+    "passed": True,
+    "pp": 210.5,
+    "rank": "S",
+    "created_at": "2022-03-01T10:00:00+00:00",
+    "mode": "osu",
+    "mode_int": 0,
+    "replay": True,
+}
+
+EVENT = {
+    "id": 912,
+    "created_at": "2022-03-02T12:30:00+00:00",
+    "type": "rank",
+    "scoreRank": "S",
+    "rank": 3,
+    "mode": "osu",
+    "beatmap": {"title": "Artist - Title [Insane]", "url": "/b/139919?m=0"},
+    "user": {"username": "peppy", "url": "/u/2"},
+}
+
+RANKING = {
+    "cursor": {"page": 2},
+    "ranking": [{"pp": 12000.5, "global_rank": 1, "hit_accuracy": 98.7}],
+    "total": 10000,
+}
+
+KUDOSU = {
+    "id": 10,
+    "action": "vote.give",
+    "amount": 1,
+    "model": "beatmap_discussion",
+    "created_at": "2022-03-01T10:00:00+00:00",
+    "post": {"title": "Some map", "url": None},
+    "giver": {"url": "/u/3", "username": "someone"},
+}
+
+
+class TestSerialization(unittest.TestCase):
+    """For testing model payload round-trips."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.connector = Connector(http=None)
+        cls.models = [
+            pyosu.User(connector=cls.connector, data=USER),
+            pyosu.Score(connector=cls.connector, data=SCORE),
+            Event(data=EVENT),
+            KudosuHistory(data=KUDOSU),
+        ]
+
+    def test_to_payload_keeps_api_shape(self):
+        self.assertEqual(self.models[2].to_payload(), EVENT)
+        self.assertEqual(self.models[3].to_payload()["giver"], KUDOSU["giver"])
+        self.assertEqual(
+            self.models[0].to_payload()["join_date"], USER["join_date"]
+        )
+
+    def test_round_trip(self):
+        raw = pyosu.dumps(self.models[1])
+        score = pyosu.loads(raw, connector=self.connector)
+
+        self.assertIsInstance(score, pyosu.Score)
+        self.assertEqual(score.to_payload(), self.models[1].to_payload())
+
+    def test_round_trip_many(self):
+        raw = pyosu.dumps_many(self.models)
+        models = pyosu.loads_many(raw, connector=self.connector)
+
+        self.assertEqual(
+            [m.to_payload() for m in models],
+            [m.to_payload() for m in self.models],
+        )
+
+    def test_round_trip_ranking(self):
+        ranking = pyosu.Ranking(connector=self.connector, data=RANKING)
+        loaded = pyosu.loads(pyosu.dumps(ranking), connector=self.connector)
+
+        self.assertIsInstance(loaded, pyosu.Ranking)
+        self.assertEqual(loaded.to_payload(), ranking.to_payload())
+        self.assertEqual(loaded.ranking, RANKING["ranking"])
+        self.assertEqual(loaded.cursor, RANKING["cursor"])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            pyosu.dumps(self.models[0], backend="yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()
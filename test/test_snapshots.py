@@ -0,0 +1,158 @@
+import unittest
+
+from pyosu.connection import Connector
+from pyosu.snapshots import RankingHistory, ranking_key
+from pyosu.user import UserStatistics
+
+KEY = ranking_key("osu", "performance")
+
+
+def ranking(connector, order, play_count=10):
+    return [
+        UserStatistics(
+            connector=connector,
+            data={
+                "user_id": user_id,
+                "pp": 10000.0 - rank * 100,
+                "hit_accuracy": 98.5,
+                "play_count": play_count + user_id,
+            },
+        )
+        for rank, user_id in enumerate(order)
+    ]
+
+
+class TestRankingHistory(unittest.TestCase):
+    def setUp(self):
+        self.connector = Connector(http=None)
+        self.history = RankingHistory(keyframe_interval=3)
+        self.orders = [
+            [1, 2, 3, 4, 5],
+            [1, 3, 2, 4, 5],
+            [5, 1, 3, 2, 4],
+            [5, 1, 3, 2],
+            [4, 5, 1, 3, 2],
+        ]
+        for day, order in enumerate(self.orders):
+            self.history.add(
+                KEY,
+                ranking(self.connector, order, play_count=day),
+                taken_at=86400 * (day + 1),
+            )
+
+    def tearDown(self):
+        self.history.close()
+
+    def test_load_replays_deltas(self):
+        snapshots = self.history.snapshots(KEY)
+        self.assertEqual(len(snapshots), len(self.orders))
+
+        for (snapshot_id, _), order in zip(snapshots, self.orders):
+            snapshot = self.history.load(snapshot_id)
+            self.assertEqual(list(snapshot.user_ids), order)
+            self.assertEqual(
+                list(snapshot.ranks), list(range(1, len(order) + 1))
+            )
+
+    def test_unchanged_rows_are_not_stored(self):
+        history = RankingHistory()
+        history.add(KEY, ranking(self.connector, [1, 2, 3]), taken_at=1)
+        snapshot_id = history.add(
+            KEY, ranking(self.connector, [1, 3, 2]), taken_at=2
+        )
+        raw = history._db.execute(
+            "SELECT length(user_ids), length(ranks), length(play_count)"
+            " FROM snapshots WHERE id = ?",
+            (snapshot_id,),
+        ).fetchone()
+        self.assertEqual(raw, (2 * 8, 2 * 8, 2 * 8))
+
+        # Only the changed rows are indexed per user
+        indexed = history._db.execute(
+            "SELECT user_id, rank FROM user_ranks WHERE snapshot_id = ?"
+            " ORDER BY user_id",
+            (snapshot_id,),
+        ).fetchall()
+        self.assertEqual(indexed, [(2, 3), (3, 2)])
+        history.close()
+
+    def test_realistic_pp_is_not_a_change(self):
+        history = RankingHistory()
+        entries = [
+            UserStatistics(
+                connector=self.connector,
+                data={
+                    "user_id": user_id,
+                    "pp": 1234.567 - user_id * 0.311,
+                    "hit_accuracy": 98.7654,
+                    "play_count": 5000 + user_id,
+                },
+            )
+            for user_id in range(1, 1001)
+        ]
+        history.add(KEY, entries, taken_at=1)
+        snapshot_id = history.add(KEY, entries, taken_at=2)
+
+        raw = history._db.execute(
+            "SELECT length(user_ids), length(removed) FROM snapshots"
+            " WHERE id = ?",
+            (snapshot_id,),
+        ).fetchone()
+        self.assertEqual(raw, (0, 0))
+        self.assertEqual(
+            history.load(snapshot_id).rows()[3],
+            (3, 1234.567 - 3 * 0.311, 98.7654, 5003),
+        )
+        self.assertEqual(
+            history.user_history(3),
+            [(1, 3, 1234.567 - 3 * 0.311), (2, 3, 1234.567 - 3 * 0.311)],
+        )
+        history.close()
+
+    def test_user_history(self):
+        ranks = [rank for _, rank, _ in self.history.user_history(5)]
+        self.assertEqual(ranks, [5, 5, 1, 1, 2])
+
+        # User 4 left the fourth snapshot and came back
+        history = self.history.user_history(4)
+        self.assertEqual(
+            [(t // 86400, rank) for t, rank, _ in history],
+            [(1, 4), (2, 4), (3, 5), (5, 1)],
+        )
+        self.assertEqual(history[-1][2], 10000.0)
+
+    def test_user_history_by_key(self):
+        other = ranking_key("osu", "performance", "JP")
+        self.history.add(
+            other, ranking(self.connector, [2, 5]), taken_at=86400 * 2.5
+        )
+
+        history = self.history.user_history(5)
+        self.assertEqual([rank for _, rank, _ in history], [5, 5, 2, 1, 1, 2])
+        self.assertEqual(
+            [rank for _, rank, _ in self.history.user_history(5, KEY)],
+            [5, 5, 1, 1, 2],
+        )
+        self.assertEqual(
+            self.history.user_history(5, other), [(216000, 2, 9900.0)]
+        )
+
+    def test_movers(self):
+        movers = self.history.movers(KEY, 86400, 86400 * 3, limit=1)
+        self.assertEqual(movers, [(5, 5, 1)])
+
+        droppers = self.history.movers(
+            KEY, 86400, 86400 * 3, limit=1, ascending=True
+        )
+        self.assertEqual(droppers, [(2, 2, 4)])
+
+    def test_movers_skip_missing_users(self):
+        movers = self.history.movers(KEY, 86400 * 3, 86400 * 4, limit=10)
+        self.assertEqual(
+            sorted(movers), [(1, 2, 2), (2, 4, 4), (3, 3, 3), (5, 1, 1)]
+        )
+        self.assertEqual(self.history.movers(KEY, 0, 86400 * 4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
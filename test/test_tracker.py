@@ -0,0 +1,160 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from pyosu.connection import Connector
+from pyosu.enums import EventType
+from pyosu.ratelimit import TokenBucket
+from pyosu.tracker import ScoreTracker
+
+from payloads import score_payload, user_payload
+
+
+def user(user_id, *, online=False, days=None):
+    last_visit = None
+    if days is not None:
+        visit = datetime.now(timezone.utc) - timedelta(days=days)
+        last_visit = visit.isoformat()
+
+    return user_payload(user_id, is_online=online, last_visit=last_visit)
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.scores = {}
+        self.users = {}
+        self.requested = []
+
+    async def get_user_scores(self, user_id, type, **kwargs):
+        self.requested.append(("scores", user_id))
+        # Newest first, as the API returns them
+        ids = sorted(self.scores.get(user_id, []), reverse=True)
+        return [score_payload(i, user_id) for i in ids]
+
+    async def get_users(self, ids):
+        self.requested.append(("users", list(ids)))
+        return {"users": [self.users[i] for i in ids if i in self.users]}
+
+
+class TestScoreTracker(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = FakeHTTP()
+        self.connector = Connector(http=self.http)
+        self.tracker = ScoreTracker(
+            self.connector,
+            budget=TokenBucket(1000, 1000),
+            online_interval=10,
+            active_interval=20,
+            idle_interval=30,
+            dormant_interval=40,
+        )
+        self.published = []
+        self.tracker.add_handler(EventType.RecentScore, self.on_score)
+
+    async def asyncTearDown(self):
+        await self.tracker.stop()
+        await self.tracker.bus.close()
+
+    async def on_score(self, score):
+        self.published.append(score.id)
+
+    async def test_first_poll_only_stores(self):
+        self.http.scores[2] = [5, 6]
+        self.tracker.track([2])
+
+        self.assertEqual(await self.tracker.poll(2), [])
+        self.assertEqual(self.tracker.last_ids, {2: 6})
+
+    async def test_new_scores_oldest_first(self):
+        self.http.scores[2] = [5, 6]
+        self.tracker.track([2])
+        await self.tracker.poll(2)
+
+        self.http.scores[2] = [5, 6, 7, 9, 8]
+        new = await self.tracker.poll(2)
+        await self.tracker.bus.join()
+
+        self.assertEqual([s.id for s in new], [7, 8, 9])
+        self.assertEqual(self.published, [7, 8, 9])
+        self.assertEqual(self.tracker.last_ids, {2: 9})
+        self.assertEqual(self.tracker.scores, 3)
+
+        self.assertEqual(await self.tracker.poll(2), [])
+
+    async def test_resume_from_last_ids(self):
+        self.http.scores[2] = [5, 6, 7]
+        self.tracker.track([2], last_ids={2: 5})
+
+        new = await self.tracker.poll(2)
+        self.assertEqual([s.id for s in new], [6, 7])
+
+    async def test_new_score_resets_interval(self):
+        self.connector._add_user_cache(user(2, days=30))
+        self.http.scores[2] = [5]
+        self.tracker.track([2], last_ids={2: 4})
+        self.assertEqual(self.tracker._tracked[2].interval, 40)
+
+        await self.tracker.poll(2)
+        self.assertEqual(self.tracker._tracked[2].interval, 10)
+
+    async def test_interval_for(self):
+        add = self.connector._add_user_cache
+        interval_for = self.tracker.interval_for
+
+        self.assertEqual(interval_for(None), 10)
+        self.assertEqual(interval_for(add(user(1, online=True))), 10)
+        self.assertEqual(interval_for(add(user(2, days=0.5))), 20)
+        self.assertEqual(interval_for(add(user(3, days=3))), 30)
+        self.assertEqual(interval_for(add(user(4, days=30))), 40)
+        self.assertEqual(interval_for(add(user(5))), 30)
+
+    async def test_refresh_adapts_intervals(self):
+        self.connector.users_chunk_size = 2
+        for user_id in (1, 2, 3):
+            self.connector._add_user_cache(user(user_id, days=30))
+
+        self.tracker.track([1, 2, 3])
+        for user_id in (1, 2, 3):
+            self.tracker._scheduler.schedule(user_id, 40)
+
+        self.http.users = {
+            1: user(1, online=True),
+            2: user(2, days=3),
+            3: user(3, days=30),
+        }
+        await self.tracker.refresh()
+
+        self.assertEqual(
+            self.http.requested, [("users", [1, 2]), ("users", [3])]
+        )
+        self.assertEqual(
+            {i: t.interval for i, t in self.tracker._tracked.items()},
+            {1: 10, 2: 30, 3: 40},
+        )
+
+        # Users that became more active are polled sooner
+        loop = asyncio.get_event_loop()
+        due = {
+            i: d - loop.time() for i, d in self.tracker._scheduler.due.items()
+        }
+        self.assertLessEqual(due[1], 10)
+        self.assertLessEqual(due[2], 30)
+        self.assertGreater(due[3], 30)
+
+    async def test_run_polls_tracked_users(self):
+        self.http.scores = {1: [5], 2: [6]}
+        self.tracker.track([1, 2])
+        self.tracker.untrack(2)
+
+        self.tracker.start()
+        await asyncio.sleep(0.05)
+        await self.tracker.stop()
+
+        self.assertIn(("scores", 1), self.http.requested)
+        self.assertNotIn(("scores", 2), self.http.requested)
+        self.assertEqual(self.tracker.polls, 1)
+        self.assertEqual(self.tracker.last_ids, {1: 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
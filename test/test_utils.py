@@ -0,0 +1,96 @@
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from pyosu import utils
+from pyosu.connection import Connector
+from pyosu.event import Event
+from pyosu.utils import TimeIndex, parse_timestamp, to_epoch
+
+from payloads import user_payload
+
+
+def event(event_id, created_at):
+    return Event(
+        data={"id": event_id, "created_at": created_at, "type": "rank"}
+    )
+
+
+class TestTimestamps(unittest.TestCase):
+    def test_parse_timestamp(self):
+        expected = datetime(2022, 3, 1, 10, 0, tzinfo=timezone.utc)
+        self.assertEqual(
+            parse_timestamp("2022-03-01T10:00:00+00:00"), expected
+        )
+        self.assertEqual(parse_timestamp("2022-03-01T10:00:00Z"), expected)
+        self.assertEqual(parse_timestamp("2022-03-01T10:00:00"), expected)
+
+    def test_to_epoch(self):
+        self.assertEqual(to_epoch(1646128800), 1646128800)
+        self.assertEqual(to_epoch("2022-03-01T10:00:00+00:00"), 1646128800)
+        self.assertEqual(
+            to_epoch(datetime(2022, 3, 1, 10, tzinfo=timezone.utc)),
+            1646128800,
+        )
+
+    def test_model_parses_once(self):
+        item = event(1, "2022-03-01T10:00:00+00:00")
+
+        with mock.patch.object(
+            utils, "_intern_timestamp", wraps=utils._intern_timestamp
+        ) as parse:
+            self.assertEqual(item.created_at_epoch, 1646128800)
+            self.assertEqual(item.created_at_datetime.year, 2022)
+            self.assertEqual(item.created_at_epoch, 1646128800)
+            self.assertEqual(parse.call_count, 1)
+
+            item.created_at = "2022-03-02T10:00:00+00:00"
+            self.assertEqual(item.created_at_epoch, 1646128800 + 86400)
+            self.assertEqual(parse.call_count, 2)
+
+    def test_shared_values_are_parsed_once(self):
+        utils._intern_timestamp.cache_clear()
+        items = [event(i, "2022-03-05T10:00:00Z") for i in range(3)]
+
+        with mock.patch.object(
+            utils, "_parse_timestamp", wraps=utils._parse_timestamp
+        ) as parse:
+            epochs = {item.created_at_epoch for item in items}
+            self.assertEqual(epochs, {1646474400})
+            self.assertEqual(parse.call_count, 1)
+
+    def test_optional_timestamp(self):
+        user = Connector(http=None)._add_user_cache(user_payload(2))
+        self.assertIsNone(user.last_visit_datetime)
+        self.assertIsNone(user.join_date_epoch)
+
+
+class TestTimeIndex(unittest.TestCase):
+    def setUp(self):
+        self.events = [
+            event(3, "2022-03-03T00:00:00+00:00"),
+            event(1, "2022-03-01T00:00:00+00:00"),
+            event(2, "2022-03-02T00:00:00+00:00"),
+        ]
+        self.index = TimeIndex(self.events)
+
+    def test_sorted(self):
+        self.assertEqual([e.id for e in self.index], [1, 2, 3])
+        self.assertEqual(len(self.index), 3)
+
+    def test_between(self):
+        found = self.index.between("2022-03-02T00:00:00+00:00", None)
+        self.assertEqual([e.id for e in found], [2, 3])
+
+        found = self.index.between(
+            end=datetime(2022, 3, 2, tzinfo=timezone.utc)
+        )
+        self.assertEqual([e.id for e in found], [1, 2])
+
+    def test_add(self):
+        self.index.add(event(4, "2022-03-01T12:00:00+00:00"))
+        self.assertEqual([e.id for e in self.index], [1, 4, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()